@@ -0,0 +1,38 @@
+"""item full-text and trigram search
+
+Revision ID: 3b7e9f0c2d41
+Revises: 8c1d4e2f7a90
+Create Date: 2026-10-18 11:40:52.004117
+
+"""
+from alembic import op
+
+revision = '3b7e9f0c2d41'
+down_revision = '8c1d4e2f7a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        """
+        ALTER TABLE items ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('simple', coalesce(notes, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        'CREATE INDEX ix_items_search_vector ON items USING gin (search_vector)'
+    )
+    op.execute(
+        'CREATE INDEX ix_items_title_trgm ON items USING gin (title gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_items_title_trgm', table_name='items')
+    op.drop_index('ix_items_search_vector', table_name='items')
+    op.drop_column('items', 'search_vector')
@@ -0,0 +1,63 @@
+"""items.done_at and user_item_stats counters
+
+Revision ID: 6d2a9c4e1f83
+Revises: 3b7e9f0c2d41
+Create Date: 2026-10-18 15:27:41.306528
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = '6d2a9c4e1f83'
+down_revision = '3b7e9f0c2d41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'items', sa.Column('done_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+    # точное время перехода в done не хранилось - лучшее приближение
+    op.execute("UPDATE items SET done_at = updated_at WHERE status = 'done'")
+    op.create_table(
+        'user_item_stats',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'name'),
+    )
+    # то же, что UserItemStatsRepository.reconcile, одним INSERT ... SELECT
+    op.execute(
+        """
+        INSERT INTO user_item_stats (user_id, name, value)
+        SELECT user_id, 'items', count(*) FROM items GROUP BY user_id
+        UNION ALL
+        SELECT user_id, 'status:' || status::text, count(*)
+        FROM items GROUP BY user_id, status
+        UNION ALL
+        SELECT user_id, 'kind:' || kind::text, count(*)
+        FROM items GROUP BY user_id, kind
+        UNION ALL
+        SELECT user_id, 'priority:' || priority::text, count(*)
+        FROM items GROUP BY user_id, priority
+        UNION ALL
+        SELECT user_id, 'done:' || to_char(done_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+               count(*)
+        FROM items WHERE done_at IS NOT NULL
+        GROUP BY user_id, to_char(done_at AT TIME ZONE 'UTC', 'YYYY-MM')
+        UNION ALL
+        SELECT items.user_id, 'tag:' || item_tags.tag_id::text, count(*)
+        FROM item_tags JOIN items ON items.id = item_tags.item_id
+        GROUP BY items.user_id, item_tags.tag_id
+        UNION ALL
+        SELECT user_id, 'tags', count(*) FROM tags GROUP BY user_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('user_item_stats')
+    op.drop_column('items', 'done_at')
@@ -0,0 +1,39 @@
+"""item listing indexes
+
+Revision ID: 8c1d4e2f7a90
+Revises: 51f2198e9ca9
+Create Date: 2026-10-18 10:12:04.518231
+
+"""
+from alembic import op
+
+revision = '8c1d4e2f7a90'
+down_revision = '51f2198e9ca9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_items_user_id_created_at', 'items', ['user_id', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_items_user_id_updated_at', 'items', ['user_id', 'updated_at', 'id'],
+    )
+    op.create_index(
+        'ix_items_user_id_priority', 'items', ['user_id', 'priority', 'id'],
+    )
+    op.create_index(
+        'ix_items_user_id_status', 'items', ['user_id', 'status', 'created_at'],
+    )
+    op.create_index(
+        'ix_item_tags_tag_id_item_id', 'item_tags', ['tag_id', 'item_id'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_item_tags_tag_id_item_id', table_name='item_tags')
+    op.drop_index('ix_items_user_id_status', table_name='items')
+    op.drop_index('ix_items_user_id_priority', table_name='items')
+    op.drop_index('ix_items_user_id_updated_at', table_name='items')
+    op.drop_index('ix_items_user_id_created_at', table_name='items')
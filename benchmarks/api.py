@@ -0,0 +1,265 @@
+"""Нагрузочный прогон API в процессе: приложение целиком через httpx.
+
+Настоящее FastAPI-приложение (middleware, зависимости, сериализация)
+вызывается через ASGITransport без сети. По умолчанию - временный
+SQLite-файл; --database-url (или DATABASE_URL) направляет прогон на
+локальный Postgres. Таблицы пересоздаются - не запускать на живой базе.
+
+    python -m benchmarks.api --requests 500 --concurrency 8 --output run.json
+    python -m benchmarks.api --baseline run.json --tolerance 0.2
+
+Результат - JSON с p50/p95/p99 и req/s по каждому сценарию. С --baseline
+прогон сравнивается с сохраненным, и при регрессии код выхода 1.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+MS_IN_SECOND = 1000
+PERCENTILES = (50, 95, 99)
+TITLE_WORDS = (
+    'clean', 'code', 'architecture', 'python', 'async', 'patterns',
+    'database', 'design', 'systems', 'notes', 'distributed', 'testing',
+)
+BENCH_TAGS = 6
+
+Workload = Callable[[Any, dict[str, Any], int], Awaitable[Any]]
+
+
+async def _list(client, ctx, idx):
+    return await client.get(ctx['items_url'], params={'limit': 20})
+
+
+async def _filter(client, ctx, idx):
+    return await client.get(ctx['items_url'], params={
+        'limit': 20,
+        'status': ('planned', 'reading', 'done')[idx % 3],
+        'tag_ids': ctx['tag_ids'][idx % len(ctx['tag_ids'])],
+        'sort_by': 'priority',
+    })
+
+
+async def _search(client, ctx, idx):
+    return await client.get(ctx['items_url'], params={
+        'limit': 20, 'q': TITLE_WORDS[idx % len(TITLE_WORDS)],
+    })
+
+
+async def _create(client, ctx, idx):
+    return await client.post(ctx['items_url'], json={
+        'title': f'Bench item {idx}',
+        'kind': 'article',
+        'tag_ids': ctx['tag_ids'][:2],
+    })
+
+
+async def _update(client, ctx, idx):
+    item_id = ctx['item_ids'][idx % len(ctx['item_ids'])]
+    return await client.patch(f'{ctx["items_url"]}/{item_id}', json={
+        'priority': ('low', 'normal', 'high')[idx % 3],
+        'tag_ids': ctx['tag_ids'],
+    })
+
+
+async def _remove_tags(client, ctx, idx):
+    item_id = ctx['item_ids'][idx % len(ctx['item_ids'])]
+    tag_id = ctx['tag_ids'][idx % len(ctx['tag_ids'])]
+    return await client.request(
+        'DELETE',
+        f'{ctx["items_url"]}/{item_id}/tags',
+        json={'tag_ids': [tag_id]},
+    )
+
+
+WORKLOADS: dict[str, Workload] = {
+    'list': _list,
+    'filter': _filter,
+    'search': _search,
+    'create': _create,
+    'update': _update,
+    'remove_tags': _remove_tags,
+}
+
+
+async def seed(n_items: int) -> dict[str, Any]:
+    from reading_list.db.engine import engine
+    from reading_list.db.models.base import Base
+    from reading_list.db.seed import DatasetConfig, generate_dataset
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    # генератор выдает id подряд с 1: у единственного пользователя
+    # теги 1..tags_per_user и Item 1..n_items
+    config = DatasetConfig(
+        users=1, items_per_user=n_items, tags_per_user=BENCH_TAGS,
+    )
+    await generate_dataset(config, engine)
+    return {
+        'user_id': 1,
+        'tag_ids': list(range(1, BENCH_TAGS + 1)),
+        'item_ids': list(range(1, n_items + 1)),
+        'items_url': '/api/v1/items',
+    }
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Ближайший ранг: значение, не меньше которого pct% выборки."""
+    if not sorted_values:
+        return 0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+async def run_workload(  # noqa: WPS210
+    client: Any,
+    workload: Workload,
+    ctx: dict[str, Any],
+    n_requests: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    latencies: list[float] = []
+    errors = 0
+    counter = itertools.count()
+
+    async def worker() -> None:  # noqa: WPS430
+        nonlocal errors
+        while (idx := next(counter)) < n_requests:
+            started = time.perf_counter()
+            resp = await workload(client, ctx, idx)
+            latencies.append(time.perf_counter() - started)
+            if resp.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+
+    latencies.sort()
+    summary = {
+        f'p{pct}_ms': round(percentile(latencies, pct) * MS_IN_SECOND, 3)
+        for pct in PERCENTILES
+    }
+    summary.update(
+        requests=len(latencies),
+        errors=errors,
+        mean_ms=round(sum(latencies) / len(latencies) * MS_IN_SECOND, 3),
+        rps=round(len(latencies) / wall_seconds, 1),
+    )
+    return summary
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """Регрессии: p95 выросла или req/s упал больше чем на tolerance."""
+    regressions = []
+    for name, stats in current['workloads'].items():
+        base = baseline['workloads'].get(name)
+        if base is None:
+            continue
+        if stats['p95_ms'] > base['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f'{name}: p95 {base["p95_ms"]} -> {stats["p95_ms"]} ms',
+            )
+        if stats['rps'] < base['rps'] * (1 - tolerance):
+            regressions.append(
+                f'{name}: req/s {base["rps"]} -> {stats["rps"]}',
+            )
+        if stats['errors'] > base['errors']:
+            regressions.append(
+                f'{name}: errors {base["errors"]} -> {stats["errors"]}',
+            )
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    from httpx import ASGITransport, AsyncClient
+
+    from reading_list.db.engine import engine
+    from reading_list.main import create_app
+
+    ctx = await seed(args.items)
+    results: dict[str, Any] = {
+        'meta': {
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'dialect': engine.dialect.name,
+            'python': platform.python_version(),
+            'items': args.items,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+        },
+        'workloads': {},
+    }
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(
+        transport=transport, base_url='http://bench',
+    ) as client:
+        for name in args.workloads:
+            workload = WORKLOADS[name]
+            await run_workload(
+                client, workload, ctx, args.warmup, args.concurrency,
+            )
+            results['workloads'][name] = await run_workload(
+                client, workload, ctx, args.requests, args.concurrency,
+            )
+    await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'))
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument(
+        '--workloads', nargs='+', choices=tuple(WORKLOADS),
+        default=list(WORKLOADS),
+    )
+    parser.add_argument('--output', help='куда сохранить JSON прогона')
+    parser.add_argument('--baseline', help='JSON прошлого прогона')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    # настройки читаются при импорте reading_list, поэтому окружение -
+    # до первого импорта приложения
+    os.environ['DATABASE_URL'] = args.database_url or (
+        f'sqlite+aiosqlite:///{tempfile.mkdtemp(prefix="rl_bench_")}/bench.db'
+    )
+    os.environ.setdefault('DEBUG', 'false')
+
+    results = asyncio.run(run(args))
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(report)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f'REGRESSION {line}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""Загрузка тегов в листинге Item: joinedload, selectinload и агрегат.
+
+Сравнивает, сколько строк уходит из БД и сколько занимает страница
+на 10, 100 и 1000 Item. По умолчанию - временный SQLite-файл, но
+DATABASE_URL можно направить на локальный Postgres.
+
+    python -m benchmarks.item_tags --tags-per-item 5 --repeat 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault(
+    'DATABASE_URL',
+    f'sqlite+aiosqlite:///{tempfile.mkdtemp(prefix="rl_bench_")}/bench.db',
+)
+os.environ.setdefault('DEBUG', 'false')
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import joinedload, selectinload  # noqa: E402
+
+from reading_list.api.schemas.item_filter import ItemFilter  # noqa: E402
+from reading_list.db.engine import AsyncSessionLocal, engine  # noqa: E402
+from reading_list.db.models.base import Base  # noqa: E402
+from reading_list.db.models.item import ItemKind, ItemORM, ItemStatus  # noqa: E402
+from reading_list.db.models.tag import ItemTagORM, TagORM  # noqa: E402
+from reading_list.db.models.user import UserORM  # noqa: E402
+from reading_list.repositories.item import ItemRepository  # noqa: E402
+
+PAGE_SIZES = (10, 100, 1000)
+MS_IN_SECOND = 1000
+
+
+async def seed(n_items: int, tags_per_item: int) -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        user = UserORM(email='bench@example.com', display_name='Bench')
+        session.add(user)
+        await session.flush()
+        tag_ids = list((await session.scalars(
+            insert(TagORM).returning(TagORM.id),
+            [
+                {'user_id': user.id, 'name': f'tag-{idx}'}
+                for idx in range(tags_per_item)
+            ],
+        )).all())
+        item_ids = list((await session.scalars(
+            insert(ItemORM).returning(ItemORM.id),
+            [
+                {
+                    'user_id': user.id,
+                    'title': f'Item {idx}',
+                    'kind': ItemKind.book,
+                    'status': ItemStatus.planned,
+                }
+                for idx in range(n_items)
+            ],
+        )).all())
+        await session.execute(insert(ItemTagORM), [
+            {'item_id': item_id, 'tag_id': tag_id}
+            for item_id in item_ids
+            for tag_id in tag_ids
+        ])
+        await session.commit()
+        return user.id
+
+
+def _orm_page_stmt(user_id: int, limit: int, loader):
+    return select(ItemORM).where(
+        ItemORM.user_id == user_id,
+    ).order_by(
+        ItemORM.created_at.desc(), ItemORM.id.desc(),
+    ).limit(limit).options(loader(ItemORM.tags))
+
+
+async def _run_joinedload(session, user_id: int, limit: int) -> int:
+    stmt = _orm_page_stmt(user_id, limit, joinedload)
+    db_items = (await session.execute(stmt)).unique().scalars().all()
+    # LEFT JOIN дает по строке на тег, но не меньше одной на Item
+    return sum(max(len(db_item.tags), 1) for db_item in db_items)
+
+
+async def _run_selectinload(session, user_id: int, limit: int) -> int:
+    stmt = _orm_page_stmt(user_id, limit, selectinload)
+    db_items = (await session.execute(stmt)).scalars().all()
+    # страница плюс по строке item_tags JOIN tags на каждый тег
+    return len(db_items) + sum(len(db_item.tags) for db_item in db_items)
+
+
+async def _run_aggregated(session, user_id: int, limit: int) -> int:
+    listing = await ItemRepository(session).get_with_filters(
+        user_id, ItemFilter(limit=limit, count='none'),
+    )
+    # limit + 1 строка-проба для has_more
+    return len(listing.items) + int(listing.has_more)
+
+
+STRATEGIES = {
+    'joinedload': _run_joinedload,
+    'selectinload': _run_selectinload,
+    'aggregated': _run_aggregated,
+}
+
+
+async def measure(user_id: int, repeat: int) -> list[dict]:
+    results = []
+    for limit in PAGE_SIZES:
+        for name, strategy in STRATEGIES.items():
+            timings = []
+            rows = 0
+            for _ in range(repeat):
+                async with AsyncSessionLocal() as session:
+                    started = time.perf_counter()
+                    rows = await strategy(session, user_id, limit)
+                    timings.append(time.perf_counter() - started)
+            results.append({
+                'page_size': limit,
+                'strategy': name,
+                'rows': rows,
+                'median_ms': round(
+                    statistics.median(timings) * MS_IN_SECOND, 2,
+                ),
+            })
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tags-per-item', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    user_id = await seed(max(PAGE_SIZES), args.tags_per_item)
+    results = await measure(user_id, args.repeat)
+    await engine.dispose()
+
+    print(f'{"page":>6} {"strategy":<14} {"rows":>7} {"median ms":>10}')
+    for res in results:
+        print(
+            f'{res["page_size"]:>6} {res["strategy"]:<14} '
+            f'{res["rows"]:>7} {res["median_ms"]:>10}'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
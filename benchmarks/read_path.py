@@ -0,0 +1,163 @@
+"""Листинг Item и тегов: ORM-объекты против Core-строк.
+
+orm - как было: select(ItemORM) / select(TagORM) через identity map;
+core - текущие ItemRepository.get_with_filters и TagRepository.get_for_user.
+Оба пути доводят страницу до ItemOut/TagOut. Время - медиана, память -
+пик tracemalloc за один запрос (tracemalloc включается только на замер
+памяти, чтобы не искажать время). По умолчанию - временный SQLite-файл,
+DATABASE_URL можно направить на локальный Postgres.
+
+    python -m benchmarks.read_path --repeat 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault(
+    'DATABASE_URL',
+    f'sqlite+aiosqlite:///{tempfile.mkdtemp(prefix="rl_bench_")}/bench.db',
+)
+os.environ.setdefault('DEBUG', 'false')
+
+from sqlalchemy import select  # noqa: E402
+
+from reading_list.api.schemas.item_filter import ItemFilter  # noqa: E402
+from reading_list.db.engine import AsyncSessionLocal, engine  # noqa: E402
+from reading_list.db.models.base import Base  # noqa: E402
+from reading_list.db.models.item import ItemORM  # noqa: E402
+from reading_list.db.models.tag import TagORM  # noqa: E402
+from reading_list.db.seed import DatasetConfig, generate_dataset  # noqa: E402
+from reading_list.repositories.item import (  # noqa: E402, WPS318, WPS319
+    ItemRepository,
+    parse_tag_ids,
+    tag_ids_column,
+)
+from reading_list.repositories.tag import TagRepository  # noqa: E402
+from reading_list.services.item import ItemsService  # noqa: E402
+from reading_list.services.tag import TagService  # noqa: E402
+
+PAGE_SIZES = (10, 100, 1000)
+USER_ID = 1
+MS_IN_SECOND = 1000
+BYTES_IN_KIB = 1024
+
+
+async def _orm_items(session, limit: int) -> int:
+    stmt = select(
+        ItemORM, tag_ids_column(session.get_bind().dialect.name),
+    ).where(
+        ItemORM.user_id == USER_ID,
+    ).order_by(
+        ItemORM.created_at.desc(), ItemORM.id.desc(),
+    ).limit(limit + 1)
+    rows = (await session.execute(stmt)).all()[:limit]
+    page = [
+        ItemsService._to_item_out(row[0], parse_tag_ids(row.tag_ids))
+        for row in rows
+    ]
+    return len(page)
+
+
+async def _core_items(session, limit: int) -> int:
+    listing = await ItemRepository(session).get_with_filters(
+        USER_ID, ItemFilter(limit=limit, count='none'),
+    )
+    page = [
+        ItemsService._to_item_out(row, listing.tag_ids[row.id])
+        for row in listing.items
+    ]
+    return len(page)
+
+
+async def _orm_tags(session, limit: int) -> int:
+    stmt = select(TagORM).where(
+        TagORM.user_id == USER_ID,
+    ).order_by(TagORM.name.asc())
+    tags = (await session.scalars(stmt)).all()
+    return len([TagService.to_tag_out(tag) for tag in tags])
+
+
+async def _core_tags(session, limit: int) -> int:
+    tags = await TagRepository(session).get_for_user(USER_ID)
+    return len([TagService.to_tag_out(tag) for tag in tags])
+
+
+SCENARIOS = {
+    'items': {'orm': _orm_items, 'core': _core_items},
+    'tags': {'orm': _orm_tags, 'core': _core_tags},
+}
+
+
+async def _run_once(path, limit: int) -> int:
+    async with AsyncSessionLocal() as session:
+        return await path(session, limit)
+
+
+async def _measure_memory(path, limit: int) -> int:
+    tracemalloc.start()
+    try:
+        await _run_once(path, limit)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+async def measure(repeat: int, tag_pages: tuple[int, ...]) -> list[dict]:
+    results = []
+    for scenario, paths in SCENARIOS.items():
+        page_sizes = PAGE_SIZES if scenario == 'items' else tag_pages
+        for limit in page_sizes:
+            for name, path in paths.items():
+                await _run_once(path, limit)  # прогрев
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    rows = await _run_once(path, limit)
+                    timings.append(time.perf_counter() - started)
+                results.append({
+                    'scenario': scenario,
+                    'page_size': rows,
+                    'path': name,
+                    'median_ms': round(
+                        statistics.median(timings) * MS_IN_SECOND, 2,
+                    ),
+                    'peak_kib': round(
+                        await _measure_memory(path, limit) / BYTES_IN_KIB, 1,
+                    ),
+                })
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tags', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await generate_dataset(DatasetConfig(
+        users=1, items_per_user=max(PAGE_SIZES) * 2, tags_per_user=args.tags,
+    ))
+    results = await measure(args.repeat, (args.tags,))
+    await engine.dispose()
+
+    print(
+        f'{"scenario":<9} {"page":>6} {"path":<5} '
+        f'{"median ms":>10} {"peak KiB":>9}',
+    )
+    for res in results:
+        print(
+            f'{res["scenario"]:<9} {res["page_size"]:>6} {res["path"]:<5} '
+            f'{res["median_ms"]:>10} {res["peak_kib"]:>9}'
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
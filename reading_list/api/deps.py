@@ -1,24 +1,20 @@
 from typing import AsyncGenerator, Awaitable, Callable, Type, TypeVar
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from reading_list.db.engine import AsyncSessionLocal
+from reading_list.api.schemas.item import ITEM_FIELDS
+from reading_list.db.engine import AsyncSessionLocal, replica_router
 from reading_list.repositories.base_crud import BaseCrudRepository
 from reading_list.services.abstract_crud import AbstractCrudService
+from reading_list.utils.etag import etag_matches
 
 TRepo = TypeVar('TRepo', bound=BaseCrudRepository)
 TService = TypeVar('TService', bound=AbstractCrudService)
 x_user_header = Header(default=None, alias='X-User-Id')
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
-        yield session
-
-depends_db = Depends(get_db)
-
-
 async def get_current_user_id(
     x_user_id: int | None = x_user_header,
 ) -> int:
@@ -34,14 +30,86 @@ async def get_current_user_id(
 depends_user_id = Depends(get_current_user_id)
 
 
+async def get_db(
+    user_id: int = depends_user_id,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия на primary - для роутов, которые пишут.
+
+    Каждый commit открывает окно, в котором чтения пользователя тоже
+    идут в primary (см. ReplicaRouter).
+    """
+    async with AsyncSessionLocal() as session:
+        def _mark_write(sync_session):  # noqa: WPS430
+            replica_router.mark_write(user_id)
+
+        event.listen(session.sync_session, 'after_commit', _mark_write)
+        yield session
+
+depends_db = Depends(get_db)
+
+
+async def get_read_db(
+    user_id: int = depends_user_id,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия на реплике (или на primary сразу после записи) - для GET."""
+    bind = replica_router.engine_for_read(user_id)
+    async with AsyncSessionLocal(bind=bind) as session:
+        yield session
+
+depends_read_db = Depends(get_read_db)
+
+
 def crud_service_dep(
     service_cls: Type[TService],
     repo_cls: Type[TRepo],
+    read_only: bool = False,
 ) -> Callable[..., Awaitable[TService]]:
+    """read_only=True - сервис на сессии get_read_db (только для GET)."""
     async def _dep(  # noqa: WPS430
-        db: AsyncSession = depends_db,
+        db: AsyncSession = depends_read_db if read_only else depends_db,
         user_id: int = depends_user_id,
     ) -> TService:
         repo = repo_cls(db)
         return service_cls(repo=repo, user_id=user_id)
     return _dep
+
+
+item_fields_query = Query(
+    None, description=f'Через запятую из: {", ".join(ITEM_FIELDS)}',
+)
+
+
+def item_fields_dep(
+    default: tuple[str, ...],
+) -> Callable[..., tuple[str, ...]]:
+    """fields=title,status -> поля ItemOut в порядке схемы; id - всегда."""
+    def _dep(  # noqa: WPS430
+        fields: str | None = item_fields_query,
+    ) -> tuple[str, ...]:
+        if fields is None:
+            return default
+        requested = {name.strip() for name in fields.split(',')} - {''}
+        unknown = requested.difference(ITEM_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f'Unknown fields: {", ".join(sorted(unknown))}',
+            )
+        requested.add('id')
+        return tuple(name for name in ITEM_FIELDS if name in requested)
+    return _dep
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+) -> Response | None:
+    """304 при совпадении If-None-Match, иначе ставит ETag в ответ."""
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag},
+        )
+    response.headers['ETag'] = etag
+    return None
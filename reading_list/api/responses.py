@@ -0,0 +1,51 @@
+"""JSON-ответ одним проходом pydantic-core, без повторной валидации.
+
+Схему ответа сервис уже собрал и провалидировал. По response_model
+FastAPI проверил бы ее еще раз, а версии без dump_json еще и прогнали
+бы через jsonable_encoder - для страницы из 100 Item это на порядок
+дольше самой сериализации. Response из эндпоинта отдается как есть,
+response_model остается для OpenAPI.
+"""
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from reading_list.utils.timing import serialize_timed
+
+JSON_MEDIA_TYPE = 'application/json'
+
+
+def json_response(
+    schema: Any,
+    content: Any,
+    response: Response | None = None,
+    status_code: int = status.HTTP_200_OK,
+    exclude_unset: bool = False,
+) -> Response:
+    """content (значение schema) -> JSON-байты.
+
+    Заголовки, выставленные в response (например, ETag), переносятся
+    в ответ - FastAPI сам их в возвращенный Response не добавит.
+    exclude_unset - как у model_dump: поля, которые не задавали при
+    создании схемы, в ответ не попадают (sparse fieldsets).
+    """
+    fast_response = Response(
+        _dump_json(schema, content, exclude_unset),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+    )
+    if response is not None:
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
+
+
+@lru_cache
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+@serialize_timed
+def _dump_json(schema: Any, content: Any, exclude_unset: bool = False) -> bytes:
+    return _adapter(schema).dump_json(content, exclude_unset=exclude_unset)
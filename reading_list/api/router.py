@@ -3,6 +3,8 @@ from fastapi import APIRouter
 from reading_list.api.v1.items import router as items_router
 from reading_list.api.v1.tags import router as tags_router
 from reading_list.api.v1.users import router as users_router
+from reading_list.db.engine import pool_stats
+from reading_list.services.tag import user_tags_cache
 
 api_router = APIRouter()
 api_router.include_router(items_router, prefix='/items', tags=['items'])
@@ -13,3 +15,18 @@ api_router.include_router(users_router, prefix='/users', tags=['users'])
 @api_router.get('/health')
 async def health_check():
     return {'status': 'ok'}
+
+
+@api_router.get('/internal/cache')
+async def cache_stats():
+    return {
+        'user_tags': {
+            'size': len(user_tags_cache),
+            **user_tags_cache.stats.as_dict(),
+        },
+    }
+
+
+@api_router.get('/internal/pool')
+async def pool_state():
+    return pool_stats()
@@ -3,14 +3,18 @@ from typing import Generic, List, TypeVar
 from pydantic import BaseModel
 
 MAX_TITLE_LENGTH = 255
+MAX_BATCH_SIZE = 1000
+MAX_IMPORT_ERRORS = 1000
 
 T = TypeVar('T')  # noqa: WPS111
 
 
 class PageMeta(BaseModel):
-    total: int
+    total: int | None
     limit: int
     offset: int
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class Page(BaseModel, Generic[T]):
@@ -1,9 +1,13 @@
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
-from reading_list.api.schemas.common import Page
+from reading_list.api.schemas.common import (  # noqa: WPS318, WPS319
+    MAX_BATCH_SIZE,
+    MAX_IMPORT_ERRORS,
+    Page,
+)
 from reading_list.db.models.item import ItemKind, ItemPriority, ItemStatus
 
 
@@ -32,6 +36,28 @@ class ItemUpdate(BaseModel):
     tag_ids: List[int] | None = None
 
 
+class ItemBulkUpdate(BaseModel):
+    """Изменения для всех Item, подходящих под ItemFilter."""
+
+    kind: ItemKind | None = None
+    status: ItemStatus | None = None
+    priority: ItemPriority | None = None
+    notes: str | None = None
+
+    # None - "не менять" только по умолчанию; явный null для NOT NULL
+    # колонок дошел бы до UPDATE ... SET status = NULL
+    @field_validator('kind', 'status', 'priority')
+    @classmethod
+    def _not_null(cls, field_value: object) -> object:
+        if field_value is None:
+            raise ValueError('may not be null')
+        return field_value
+
+
+class ItemBulkResult(BaseModel):
+    affected: int
+
+
 class ItemOut(BaseModel):
     id: int
     user_id: int
@@ -49,9 +75,92 @@ class ItemOut(BaseModel):
     }
 
 
+# поля для fields=; notes - неограниченный Text, в списке его отдают
+# только по явному запросу
+ITEM_FIELDS = tuple(ItemOut.model_fields)
+LIST_FIELDS = tuple(name for name in ITEM_FIELDS if name != 'notes')
+
+
 class ItemPage(Page[ItemOut]):
     """Конкретный класс для страницы Item."""
 
 
+class ItemFieldsOut(BaseModel):
+    """Item с полями из fields=: невыбранных в ответе нет совсем.
+
+    id приходит всегда, остальное необязательно - в OpenAPI так видно,
+    что поле может отсутствовать; присутствующее поле - как в ItemOut.
+    """
+
+    id: int
+    user_id: int | None = None
+    title: str | None = None
+    kind: ItemKind | None = None
+    status: ItemStatus | None = None
+    priority: ItemPriority | None = None
+    notes: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    tag_ids: List[int] | None = None
+
+
+class ItemFieldsPage(Page[ItemFieldsOut]):
+    """Страница Item с полями из fields=."""
+
+
+class ItemFacets(BaseModel):
+    """Число Item под ItemFilter по каждому значению фильтров."""
+
+    total: int
+    status: Dict[ItemStatus, int]
+    kind: Dict[ItemKind, int]
+    priority: Dict[ItemPriority, int]
+    # все теги пользователя, включая те, под которыми 0 Item
+    tag_ids: Dict[int, int]
+
+
 class ItemTagsRemove(BaseModel):
     tag_ids: list[int]
+
+
+class ItemBatchCreate(BaseModel):
+    items: List[ItemCreate] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE,
+    )
+
+
+class ItemBatchResult(BaseModel):
+    """Результат для items[index]: созданный Item или причина отказа."""
+
+    index: int
+    item: ItemOut | None = None
+    error: str | None = None
+
+
+class ItemBatchOut(BaseModel):
+    created: int
+    failed: int
+    results: List[ItemBatchResult]
+
+
+class ItemImportError(BaseModel):
+    line: int
+    error: str
+
+
+class ItemImportOut(BaseModel):
+    """Итог импорта; errors обрезается до MAX_IMPORT_ERRORS строк."""
+
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: List[ItemImportError] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append(ItemImportError(line=line, error=error))
+        else:
+            self.errors_truncated = True
@@ -1,20 +1,40 @@
 from datetime import datetime
 from typing import List, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from reading_list.db.models.item import ItemKind, ItemPriority, ItemStatus
 
+MAX_PAGE_SIZE = 1000
+
 
 class ItemFilter(BaseModel):
     status: ItemStatus | None = None
     kind: ItemKind | None = None
     priority: ItemPriority | None = None
     tag_ids: List[int] | None = None
+    # any - хотя бы один из tag_ids, all - все, none - ни одного
+    tag_mode: Literal['any', 'all', 'none'] = 'any'
     q: str | None = None  # noqa: WPS111
     created_from: datetime | None = None
     created_to: datetime | None = None
-    limit: int = 20
-    offset: int = 0
-    sort_by: Literal['created_at', 'updated_at', 'priority'] = 'created_at'
+    limit: int = Field(20, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(0, ge=0)
+    # непрозрачный курсор из meta.next_cursor; если задан, offset игнорируется
+    cursor: str | None = None
+    sort_by: Literal[
+        'created_at', 'updated_at', 'priority', 'relevance',
+    ] = 'created_at'
     sort_dir: Literal['asc', 'desc'] = 'desc'
+    # exact - точное число тем же запросом, estimate - оценка планировщика
+    # (на SQLite считается точно), none - без total, только has_more
+    count: Literal['exact', 'estimate', 'none'] = 'exact'
+
+
+ExportFormat = Literal['ndjson', 'csv']
+
+
+class ItemExportFilter(ItemFilter):
+    """ItemFilter для выгрузки: пагинация игнорируется, есть формат."""
+
+    format: ExportFormat = 'ndjson'  # noqa: WPS125
@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Dict
 
 from pydantic import BaseModel, EmailStr
 
+from reading_list.db.models.item import ItemKind, ItemPriority, ItemStatus
+
 
 class UserBase(BaseModel):
     display_name: str
@@ -25,3 +28,17 @@ class UserOut(UserBase):
     model_config = {
         'from_attributes': True,
     }
+
+
+class UserItemStatsOut(BaseModel):
+    """Счетчики пользователя из user_item_stats."""
+
+    user_id: int
+    items: int
+    tags: int
+    status: Dict[ItemStatus, int]
+    kind: Dict[ItemKind, int]
+    priority: Dict[ItemPriority, int]
+    done_this_month: int
+    done_by_month: Dict[str, int]  # YYYY-MM (UTC) -> число Item
+    items_per_tag: Dict[int, int]
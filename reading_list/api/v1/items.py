@@ -1,46 +1,180 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Request, Response, status
 from fastapi.params import Depends
+from fastapi.responses import StreamingResponse
 
-from reading_list.api.deps import crud_service_dep
+from reading_list.api.deps import crud_service_dep, item_fields_dep, not_modified
+from reading_list.api.responses import json_response
 from reading_list.api.schemas.item import (  # noqa: WPS318, WPS319
+    ITEM_FIELDS,
+    LIST_FIELDS,
+    ItemBatchCreate,
+    ItemBatchOut,
+    ItemBulkResult,
+    ItemBulkUpdate,
     ItemCreate,
+    ItemFacets,
+    ItemFieldsOut,
+    ItemFieldsPage,
+    ItemImportOut,
     ItemOut,
-    ItemPage,
     ItemTagsRemove,
     ItemUpdate,
 )
-from reading_list.api.schemas.item_filter import ItemFilter
+from reading_list.api.schemas.item_filter import (  # noqa: WPS318, WPS319
+    ExportFormat,
+    ItemExportFilter,
+    ItemFilter,
+)
 from reading_list.repositories.item import ItemRepository
+from reading_list.services.export import EXPORT_MEDIA_TYPES
 from reading_list.services.item import ItemsService
+from reading_list.utils.etag import make_etag
 
 router = APIRouter(tags=['items'])
 
 ItemServiceDep = Depends(crud_service_dep(ItemsService, ItemRepository))
-ItemFiltersDep = Depends(ItemFilter)
+# GET-роуты читают с реплики (см. replica_router), пишущие - из primary
+ItemReadServiceDep = Depends(crud_service_dep(
+    ItemsService, ItemRepository, read_only=True,
+))
+# модель query-параметров: иначе список tag_ids ожидается в теле запроса
+ItemFiltersDep = Query()
+ItemFieldsDep = Depends(item_fields_dep(ITEM_FIELDS))
+# в списке notes по умолчанию не выбирается - только через fields=
+ListFieldsDep = Depends(item_fields_dep(LIST_FIELDS))
+# без ?format= формат импорта определяется по Content-Type
+ImportFormatDep = Query(None, alias='format')
 
 
 @router.post('', response_model=ItemOut, status_code=status.HTTP_201_CREATED)
 async def create_item(
     payload: ItemCreate,
     service: ItemsService = ItemServiceDep,
-) -> ItemOut:
-    return await service.create(payload)
+) -> Response:
+    return json_response(
+        ItemOut, await service.create(payload),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(':batch', response_model=ItemBatchOut)
+async def create_items_batch(
+    payload: ItemBatchCreate,
+    service: ItemsService = ItemServiceDep,
+) -> Response:
+    return json_response(ItemBatchOut, await service.create_many(payload.items))
+
 
+@router.post('/import', response_model=ItemImportOut)
+async def import_items(
+    request: Request,
+    import_format: ExportFormat | None = ImportFormatDep,
+    service: ItemsService = ItemServiceDep,
+) -> ItemImportOut:
+    """Тело NDJSON или CSV (как у /export), читается потоком.
 
-@router.get('/{item_id}', response_model=ItemOut)
+    Формат - из ?format=, иначе по Content-Type (text/csv - CSV).
+    """
+    if import_format is None:
+        content_type = request.headers.get('content-type', '')
+        import_format = 'csv' if content_type.startswith('text/csv') else 'ndjson'
+    return await service.import_items(request.stream(), import_format)
+
+
+@router.get('/export', response_class=StreamingResponse)
+async def export_items(
+    filters: ItemExportFilter = ItemFiltersDep,
+    service: ItemsService = ItemReadServiceDep,
+) -> StreamingResponse:
+    return StreamingResponse(
+        await service.export(filters),
+        media_type=EXPORT_MEDIA_TYPES[filters.format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="items.{filters.format}"'
+            ),
+        },
+    )
+
+
+@router.get('/facets', response_model=ItemFacets)
+async def get_item_facets(
+    request: Request,
+    response: Response,
+    filters: ItemFilter = ItemFiltersDep,
+    service: ItemsService = ItemReadServiceDep,
+) -> Response:
+    """Счетчики по status/kind/priority/тегам под теми же фильтрами."""
+    etag = make_etag(
+        await service.facets_fingerprint(),
+        sorted(request.query_params.multi_items()),
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    return json_response(ItemFacets, await service.facets(filters), response)
+
+
+@router.get('/{item_id}', response_model=ItemFieldsOut)
 async def get_item(
     item_id: int,
-    service: ItemsService = ItemServiceDep,
-) -> ItemOut:
-    return await service.get_by_id(item_id)
+    request: Request,
+    response: Response,
+    fields: tuple[str, ...] = ItemFieldsDep,
+    service: ItemsService = ItemReadServiceDep,
+) -> Response:
+    version = await service.item_version(item_id)
+    if version is not None:
+        etag = make_etag(item_id, version, fields)
+        cached = not_modified(request, response, etag)
+        if cached is not None:
+            return cached
+    return json_response(
+        ItemFieldsOut, await service.get_item_fields(item_id, fields),
+        response, exclude_unset=True,
+    )
 
 
-@router.get('', response_model=ItemPage)
+@router.get('', response_model=ItemFieldsPage)
 async def get_items(
+    request: Request,
+    response: Response,
+    filters: ItemFilter = ItemFiltersDep,
+    fields: tuple[str, ...] = ListFieldsDep,
+    service: ItemsService = ItemReadServiceDep,
+) -> Response:
+    """Без fields= у Item нет notes - его можно запросить явно."""
+    # одни и те же данные под разными параметрами - разные страницы
+    etag = make_etag(
+        await service.fingerprint(),
+        sorted(request.query_params.multi_items()),
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+    return json_response(
+        ItemFieldsPage, await service.get(filters, fields), response,
+        exclude_unset=True,
+    )
+
+
+@router.patch('', response_model=ItemBulkResult)
+async def update_items(
+    payload: ItemBulkUpdate,
+    filters: ItemFilter = ItemFiltersDep,
+    service: ItemsService = ItemServiceDep,
+) -> ItemBulkResult:
+    affected = await service.update_many(filters, payload)
+    return ItemBulkResult(affected=affected)
+
+
+@router.delete('', response_model=ItemBulkResult)
+async def delete_items(
     filters: ItemFilter = ItemFiltersDep,
     service: ItemsService = ItemServiceDep,
-) -> ItemPage:
-    return await service.get(filters)
+) -> ItemBulkResult:
+    affected = await service.delete_many(filters)
+    return ItemBulkResult(affected=affected)
 
 
 @router.patch('/{item_id}', response_model=ItemOut)
@@ -48,8 +182,8 @@ async def update_item(
     item_id: int,
     payload: ItemUpdate,
     service: ItemsService = ItemServiceDep,
-) -> ItemOut:
-    return await service.update(item_id, payload)
+) -> Response:
+    return json_response(ItemOut, await service.update(item_id, payload))
 
 
 @router.delete('/{item_id}', status_code=status.HTTP_200_OK)
@@ -67,5 +201,7 @@ async def remove_tags_from_item(
     item_id: int,
     payload: ItemTagsRemove,
     service: ItemsService = ItemServiceDep,
-) -> ItemOut:
-    return await service.remove_tags(item_id, payload.tag_ids)
+) -> Response:
+    return json_response(
+        ItemOut, await service.remove_tags(item_id, payload.tag_ids),
+    )
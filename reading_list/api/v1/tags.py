@@ -1,8 +1,9 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
-from reading_list.api.deps import crud_service_dep
+from reading_list.api.deps import crud_service_dep, not_modified
+from reading_list.api.responses import json_response
 from reading_list.api.schemas.tag import TagCreate, TagOut
 from reading_list.repositories.tag import TagRepository
 from reading_list.services.tag import TagService
@@ -10,29 +11,40 @@ from reading_list.services.tag import TagService
 router = APIRouter(tags=['tags'])
 
 TagServiceDep = Depends(crud_service_dep(TagService, TagRepository))
+TagReadServiceDep = Depends(crud_service_dep(
+    TagService, TagRepository, read_only=True,
+))
 
 
 @router.post('', response_model=TagOut, status_code=status.HTTP_201_CREATED)
 async def create_tag(
     payload: TagCreate,
     service: TagService = TagServiceDep,
-) -> TagOut:
-    return await service.create(payload)
+) -> Response:
+    return json_response(
+        TagOut, await service.create(payload),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get('', response_model=List[TagOut])
 async def get_tags(
-    service: TagService = TagServiceDep,
-) -> List[TagOut]:
-    return await service.get()
+    request: Request,
+    response: Response,
+    service: TagService = TagReadServiceDep,
+) -> Response:
+    cached = not_modified(request, response, await service.get_etag())
+    if cached is not None:
+        return cached
+    return json_response(List[TagOut], await service.get(), response)
 
 
 @router.get('/{tag_id}', response_model=TagOut)
 async def get_tag(
     tag_id: int,
-    service: TagService = TagServiceDep,
-) -> TagOut:
-    return await service.get_by_id(tag_id)
+    service: TagService = TagReadServiceDep,
+) -> Response:
+    return json_response(TagOut, await service.get_by_id(tag_id))
 
 
 @router.delete('/{tag_id}', status_code=status.HTTP_200_OK)
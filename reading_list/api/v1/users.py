@@ -2,13 +2,21 @@ from fastapi import APIRouter, status
 from fastapi.params import Depends
 
 from reading_list.api.deps import crud_service_dep
-from reading_list.api.schemas.user import UserCreate, UserOut, UserUpdate
+from reading_list.api.schemas.user import (  # noqa: WPS318, WPS319
+    UserCreate,
+    UserItemStatsOut,
+    UserOut,
+    UserUpdate,
+)
 from reading_list.repositories.user import UserRepository
 from reading_list.services.user import UserService
 
 router = APIRouter(tags=['users'])
 
 UserServiceDep = Depends(crud_service_dep(UserService, UserRepository))
+UserReadServiceDep = Depends(crud_service_dep(
+    UserService, UserRepository, read_only=True,
+))
 
 
 @router.post('', response_model=UserOut, status_code=status.HTTP_201_CREATED)
@@ -22,14 +30,22 @@ async def create_user(
 @router.get('/{user_id}', response_model=UserOut)
 async def get_user(
     user_id: int,
-    service: UserService = UserServiceDep,
+    service: UserService = UserReadServiceDep,
 ) -> UserOut:
     return await service.get_by_id(user_id)
 
 
+@router.get('/{user_id}/stats', response_model=UserItemStatsOut)
+async def get_user_stats(
+    user_id: int,
+    service: UserService = UserReadServiceDep,
+) -> UserItemStatsOut:
+    return await service.get_stats(user_id)
+
+
 @router.get('', response_model=list[UserOut])
 async def get_users(
-    service: UserService = UserServiceDep,
+    service: UserService = UserReadServiceDep,
 ) -> list[UserOut]:
     return await service.get()
 
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -9,6 +10,66 @@ class Settings(BaseSettings):
     debug: bool = Field(default=True, alias='DEBUG')
 
     database_url: str = Field(..., alias='DATABASE_URL')
+    # реплики для GET-роутов, через запятую; пусто - все идет в primary
+    database_read_urls: str = Field(default='', alias='DATABASE_READ_URLS')
+    db_read_balance: Literal['round_robin', 'least_connections'] = Field(
+        default='round_robin', alias='DB_READ_BALANCE',
+    )
+    # сколько секунд после записи пользователь читает из primary:
+    # реплика могла еще не догнать его изменения
+    db_read_sticky_seconds: float = Field(
+        default=5, alias='DB_READ_STICKY_SECONDS',
+    )
+
+    # пул соединений (для SQLite - только размер и таймаут имеют смысл)
+    db_pool_size: int = Field(default=5, alias='DB_POOL_SIZE')
+    db_max_overflow: int = Field(default=10, alias='DB_MAX_OVERFLOW')
+    db_pool_timeout: float = Field(default=30, alias='DB_POOL_TIMEOUT')
+    # -1 - не пересоздавать соединения по возрасту
+    db_pool_recycle: int = Field(default=-1, alias='DB_POOL_RECYCLE')
+    db_pool_pre_ping: bool = Field(default=False, alias='DB_POOL_PRE_PING')
+    # кэш подготовленных выражений asyncpg; 0 - за pgbouncer в режиме
+    # transaction pooling
+    db_statement_cache_size: int = Field(
+        default=100, alias='DB_STATEMENT_CACHE_SIZE',
+    )
+
+    # auto - полнотекстовый поиск под диалект БД, ilike - без индексов
+    search_backend: Literal['auto', 'ilike'] = Field(
+        default='auto', alias='SEARCH_BACKEND',
+    )
+
+    # Server-Timing во всех ответах; иначе - по заголовку X-Server-Timing
+    server_timing: bool = Field(default=False, alias='SERVER_TIMING')
+
+    # журнал медленных запросов (JSON lines с ротацией); без пути выключен
+    slow_query_log: str | None = Field(default=None, alias='SLOW_QUERY_LOG')
+    slow_query_threshold_ms: float = Field(
+        default=200, alias='SLOW_QUERY_THRESHOLD_MS',
+    )
+    # доля медленных запросов, для которых снимается план
+    slow_query_explain_rate: float = Field(
+        default=0.1, ge=0, le=1, alias='SLOW_QUERY_EXPLAIN_RATE',
+    )
+    # одновременных фоновых EXPLAIN; сверх лимита запись идет без плана
+    slow_query_explain_concurrency: int = Field(
+        default=2, ge=1, alias='SLOW_QUERY_EXPLAIN_CONCURRENCY',
+    )
+    slow_query_log_max_bytes: int = Field(
+        default=10 * 1024 * 1024, alias='SLOW_QUERY_LOG_MAX_BYTES',
+    )
+    slow_query_log_backups: int = Field(
+        default=5, alias='SLOW_QUERY_LOG_BACKUPS',
+    )
+
+    # строка (запись CSV) импорта длиннее - ошибка в отчете, не буфер
+    import_max_line_bytes: int = Field(
+        default=1024 * 1024, ge=1, alias='IMPORT_MAX_LINE_BYTES',
+    )
+
+    # кэш тегов пользователя (services.tag.user_tags_cache), на процесс
+    tag_cache_size: int = Field(default=10_000, alias='TAG_CACHE_SIZE')
+    tag_cache_ttl: float = Field(default=60, alias='TAG_CACHE_TTL')
 
     model_config = {
         'env_file': '.env',  # для локального запуска вне Docker
@@ -1,11 +1,139 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import time
+from typing import Any
+
+from sqlalchemy import event, exc, make_url
+from sqlalchemy.ext.asyncio import (  # noqa: WPS318, WPS319
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 
 from reading_list.config import settings
+from reading_list.db.replicas import ReplicaRouter
+from reading_list.db.slow_queries import SlowQueryLog
+from reading_list.utils.metrics import (  # noqa: WPS318, WPS319
+    REGISTRY,
+    CallbackMetric,
+    request_stats,
+)
+
+QUERY_STARTED_KEY = 'query_started'
+
+# время получения соединения из пула: ожидание в очереди + connect
+pool_checkout_seconds = REGISTRY.histogram(
+    'db_pool_checkout_seconds', 'Time to get a connection from the pool.',
+).labels()
+pool_timeouts = REGISTRY.counter(
+    'db_pool_timeouts_total', 'Pool checkouts that hit pool_timeout.',
+).labels()
+db_queries = REGISTRY.counter(
+    'db_queries_total', 'SQL statements sent to the database.',
+).labels()
+db_query_seconds = REGISTRY.histogram(
+    'db_query_seconds', 'SQL statement execution time.',
+).labels()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Пул по умолчанию для async-движка, но с замером checkout."""
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_timeouts.inc()
+            raise
+        finally:
+            pool_checkout_seconds.observe(time.perf_counter() - started)
+
+
+def _connect_args(driver: str) -> dict[str, Any]:
+    if driver != 'asyncpg':
+        return {}
+    return {
+        # кэш SQLAlchemy-диалекта и собственный кэш asyncpg
+        'prepared_statement_cache_size': settings.db_statement_cache_size,
+        'statement_cache_size': settings.db_statement_cache_size,
+    }
+
+
+def make_engine(url: str) -> AsyncEngine:
+    """Engine с общими настройками пула и хуками метрик (primary и реплики)."""
+    db_engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=_connect_args(make_url(url).get_driver_name()),
+    )
+    sync_engine = db_engine.sync_engine
+    event.listen(sync_engine, 'before_cursor_execute', _start_query_timer)
+    event.listen(sync_engine, 'after_cursor_execute', _record_query)
+    event.listen(sync_engine, 'handle_error', _drop_query_timer)
+    if db_engine.dialect.name == 'sqlite':
+        event.listen(sync_engine, 'connect', _enable_sqlite_foreign_keys)
+    return db_engine
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, many):
+    conn.info.setdefault(QUERY_STARTED_KEY, []).append(time.perf_counter())
+
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
+def _record_query(conn, cursor, statement, parameters, context, many):
+    started = conn.info.get(QUERY_STARTED_KEY)
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    db_queries.inc()
+    db_query_seconds.observe(elapsed)
+    # контекст запроса доходит сюда через greenlet SQLAlchemy
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+    if slow_query_log is not None:
+        slow_query_log.record(
+            conn, statement, parameters, context, many, elapsed,
+        )
+
+
+def _drop_query_timer(exception_context):
+    # after_cursor_execute для упавшего запроса не вызывается
+    conn = exception_context.connection
+    if conn is not None:
+        conn.info.pop(QUERY_STARTED_KEY, None)
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # без этого SQLite игнорирует ON DELETE CASCADE, на который
+    # опираются массовые DELETE по items
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.close()
+
+
+engine = make_engine(settings.database_url)
+replica_router = ReplicaRouter(
+    engine,
+    [
+        make_engine(url.strip())
+        for url in settings.database_read_urls.split(',') if url.strip()
+    ],
+    balance=settings.db_read_balance,
+    sticky_seconds=settings.db_read_sticky_seconds,
+)
+
+slow_query_log = (
+    SlowQueryLog.from_settings(settings)
+    if settings.slow_query_log else None
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -13,3 +141,43 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
     class_=AsyncSession,
 )
+
+
+def pool_stats() -> dict[str, Any]:
+    """Состояние текущего пула engine для /internal/pool."""
+    pool = engine.pool
+    stats: dict[str, Any] = {'class': type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # отрицательный, пока не открыты все pool_size соединений
+            overflow=max(pool.overflow(), 0),
+            max_overflow=settings.db_max_overflow,
+            timeout=settings.db_pool_timeout,
+        )
+    if replica_router.replicas:
+        stats['replicas_checked_out'] = [
+            replica.pool.checkedout() for replica in replica_router.replicas
+        ]
+    stats['timeouts'] = int(pool_timeouts.value)
+    stats['checkout_seconds'] = pool_checkout_seconds.snapshot()
+    return stats
+
+
+def _pool_connections() -> list[tuple[tuple[str, ...], float]]:
+    stats = pool_stats()
+    return [
+        ((state,), stats[state])
+        for state in ('checked_out', 'idle', 'overflow')
+        if state in stats
+    ]
+
+
+REGISTRY.register(CallbackMetric(
+    'db_pool_connections',
+    'Connections in the pool by state.',
+    _pool_connections,
+    labelnames=('state',),
+))
@@ -2,8 +2,34 @@ from datetime import datetime
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import functions as sa_func
+from sqlalchemy.sql import expression
+
+# SQLite автоинкрементит только INTEGER PRIMARY KEY
+BigIntPK = sa.BigInteger().with_variant(sa.Integer(), 'sqlite')
+
+
+class utcnow(expression.FunctionElement):  # noqa: N801
+    """now() c тем же форматом хранения, что и у SQLAlchemy на SQLite.
+
+    CURRENT_TIMESTAMP в SQLite отдает секунды без дробной части, а
+    параметры SQLAlchemy пишет с микросекундами - строки перестают
+    сравниваться корректно (важно для keyset-пагинации).
+    """
+
+    type = sa.TIMESTAMP(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return 'now()'
+
+
+@compiles(utcnow, 'sqlite')
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "(strftime('%Y-%m-%d %H:%M:%f000', 'now'))"
 
 
 class Base(AsyncAttrs, DeclarativeBase):
@@ -14,7 +40,7 @@ class BaseORM(Base):
     __abstract__ = True
 
     id: Mapped[int] = mapped_column(
-        sa.BigInteger,
+        BigIntPK,
         primary_key=True,
         autoincrement=True,
     )
@@ -22,6 +48,6 @@ class BaseORM(Base):
     created_at: Mapped[datetime] = mapped_column(
         sa.TIMESTAMP(timezone=True),
         sa.FetchedValue(),
-        server_default=sa_func.now(),
+        server_default=utcnow(),
         nullable=False,
     )
@@ -5,9 +5,9 @@ from typing import List
 import sqlalchemy as sa
 from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import functions as sa_func
 
-from reading_list.db.models.base import BaseORM
+from reading_list.db.models.base import BaseORM, utcnow
+from reading_list.db.models.search import register_search_ddl
 from reading_list.db.models.tag import TagORM
 from reading_list.db.models.user import UserORM
 
@@ -31,6 +31,17 @@ class ItemPriority(StrEnum):
 
 class ItemORM(BaseORM):
     __tablename__ = 'items'
+    # Индексы повторяют доступ из ItemRepository: всегда user_id,
+    # дальше колонка сортировки и id как тай-брейкер keyset-курсора
+    __table_args__ = (
+        sa.Index('ix_items_user_id_created_at', 'user_id', 'created_at', 'id'),
+        sa.Index('ix_items_user_id_updated_at', 'user_id', 'updated_at', 'id'),
+        sa.Index('ix_items_user_id_priority', 'user_id', 'priority', 'id'),
+        sa.Index('ix_items_user_id_status', 'user_id', 'status', 'created_at'),
+    )
+    # updated_at (onupdate) возвращается через RETURNING, а не
+    # догружается лениво - в async-сессии это был бы MissingGreenlet
+    __mapper_args__ = {'eager_defaults': True}
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey('users.id', ondelete='CASCADE'),
@@ -63,11 +74,16 @@ class ItemORM(BaseORM):
         Text,
         nullable=True,
     )
+    # когда Item стал done (NULL - не done): из него счетчики done по месяцам
+    done_at: Mapped[datetime | None] = mapped_column(
+        sa.TIMESTAMP(timezone=True),
+        nullable=True,
+    )
     updated_at: Mapped[datetime] = mapped_column(
         sa.TIMESTAMP(timezone=True),
         sa.FetchedValue(),
-        server_default=sa_func.now(),
-        onupdate=sa_func.now(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
     user: Mapped[UserORM] = relationship(
@@ -77,3 +93,6 @@ class ItemORM(BaseORM):
         secondary='item_tags',
         back_populates='items',
     )
+
+
+register_search_ddl(ItemORM.__table__)
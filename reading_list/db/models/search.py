@@ -0,0 +1,77 @@
+"""DDL полнотекстового поиска по items, которого нет в ORM-модели.
+
+Postgres: generated tsvector-колонка + GIN, trigram-индекс по title.
+SQLite: внешняя FTS5-таблица items_fts, синхронизируемая триггерами.
+Для Postgres в проде то же самое создает миграция 3b7e9f0c2d41.
+"""
+from sqlalchemy import DDL, Table, event
+
+FTS_TABLE = 'items_fts'
+SEARCH_VECTOR_COLUMN = 'search_vector'
+TS_CONFIG = 'simple'
+
+_POSTGRES_DDL = (
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    f"""
+    ALTER TABLE items ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('{TS_CONFIG}', coalesce(notes, '')), 'B')
+    ) STORED
+    """,
+    f"""
+    CREATE INDEX ix_items_search_vector
+    ON items USING gin ({SEARCH_VECTOR_COLUMN})
+    """,
+    'CREATE INDEX ix_items_title_trgm ON items USING gin (title gin_trgm_ops)',
+)
+
+_SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, notes,
+        content='items', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, notes)
+        VALUES (new.id, new.title, new.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER items_fts_ad AFTER DELETE ON items BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, notes)
+        VALUES ('delete', old.id, old.title, old.notes);
+    END
+    """,
+    f"""
+    CREATE TRIGGER items_fts_au AFTER UPDATE OF title, notes ON items BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, notes)
+        VALUES ('delete', old.id, old.title, old.notes);
+        INSERT INTO {FTS_TABLE}(rowid, title, notes)
+        VALUES (new.id, new.title, new.notes);
+    END
+    """,
+)
+
+
+def register_search_ddl(items_table: Table) -> None:
+    for pg_statement in _POSTGRES_DDL:
+        event.listen(
+            items_table,
+            'after_create',
+            DDL(pg_statement).execute_if(dialect='postgresql'),
+        )
+    for sqlite_statement in _SQLITE_DDL:
+        event.listen(
+            items_table,
+            'after_create',
+            DDL(sqlite_statement).execute_if(dialect='sqlite'),
+        )
+    event.listen(
+        items_table,
+        'before_drop',
+        DDL(f'DROP TABLE IF EXISTS {FTS_TABLE}').execute_if(dialect='sqlite'),
+    )
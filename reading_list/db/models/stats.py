@@ -0,0 +1,28 @@
+from sqlalchemy import BigInteger, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from reading_list.db.models.base import Base
+
+
+class UserItemStatORM(Base):
+    """Счетчик пользователя по имени: items, status:done, tag:7, done:2026-10.
+
+    Обновляется дельтами в той же транзакции, что и Item/теги; сверяется
+    с исходными таблицами задачей reading_list.jobs.reconcile_stats.
+    """
+
+    __tablename__ = 'user_item_stats'
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey('users.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(),
+        primary_key=True,
+    )
+    value: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+    )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from reading_list.db.models.base import Base, BaseORM
@@ -41,6 +41,10 @@ class TagORM(BaseORM):
 class ItemTagORM(Base):
 
     __tablename__ = 'item_tags'
+    # PK (item_id, tag_id) не помогает искать Item по тегу
+    __table_args__ = (
+        Index('ix_item_tags_tag_id_item_id', 'tag_id', 'item_id'),
+    )
 
     item_id: Mapped[int] = mapped_column(
         ForeignKey('items.id', ondelete='CASCADE'),
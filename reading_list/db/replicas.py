@@ -0,0 +1,58 @@
+"""Маршрутизация чтения между primary и репликами.
+
+GET-роуты читают с реплик (round robin или наименее занятый пул), кроме
+пользователей, которые недавно писали: их реплика могла еще не получить
+изменения, поэтому в течение окна sticky_seconds они читают из primary
+(read-your-writes). Окно помнится в процессе - между воркерами не
+разделяется, как и user_tags_cache.
+"""
+import itertools
+import time
+from typing import Callable, Literal, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from reading_list.utils.cache import TTLCache
+
+ReadBalance = Literal['round_robin', 'least_connections']
+# сколько недавно писавших пользователей помнится одновременно
+STICKY_USERS_MAXSIZE = 100_000
+
+
+class ReplicaRouter:
+    def __init__(  # noqa: WPS211
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        balance: ReadBalance = 'round_robin',
+        sticky_seconds: float = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replicas = tuple(replicas)
+        self.balance = balance
+        self.recent_writers: TTLCache[int, bool] = TTLCache(
+            maxsize=STICKY_USERS_MAXSIZE, ttl=sticky_seconds, clock=clock,
+        )
+        self._round_robin = itertools.cycle(self.replicas)
+
+    def mark_write(self, user_id: int) -> None:
+        """Пользователь записал: открывает (продлевает) окно чтения из primary."""
+        if self.replicas:
+            self.recent_writers.set(user_id, True)
+
+    def engine_for_read(self, user_id: int) -> AsyncEngine:
+        if not self.replicas or self.recent_writers.get(user_id):
+            return self.primary
+        if self.balance == 'least_connections':
+            return min(self.replicas, key=_checked_out)
+        return next(self._round_robin)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.dispose()
+
+
+def _checked_out(replica: AsyncEngine) -> int:
+    # при равенстве min берет первую - порядок из DATABASE_READ_URLS
+    return replica.pool.checkedout()
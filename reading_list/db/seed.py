@@ -1,11 +1,255 @@
+"""Сиды: демо-данные по умолчанию и генератор синтетического датасета.
+
+    python -m reading_list.db.seed
+    python -m reading_list.db.seed --users 10000 --items-per-user 1000
+
+С параметрами строится детерминированный датасет (один --seed - одни и те
+же строки): число Item на пользователя распределено с длинным хвостом,
+теги популярны по Ципфу. Строки пишутся пакетными Core INSERT с заранее
+выданными id, без ORM и RETURNING - поэтому только в пустую базу.
+"""
+import argparse
 import asyncio
+import bisect
+import itertools
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.engine import AsyncSessionLocal, engine
 from reading_list.db.models.item import ItemKind, ItemORM, ItemPriority, ItemStatus
-from reading_list.db.models.tag import TagORM
+from reading_list.db.models.tag import ItemTagORM, TagORM
 from reading_list.db.models.user import UserORM
+from reading_list.jobs.reconcile_stats import reconcile_stats
+
+# конец "истории" датасета фиксирован, иначе created_at зависел бы от now()
+DATASET_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+DATASET_SPAN = timedelta(days=3 * 365)
+WORDS = (
+    'clean', 'code', 'architecture', 'python', 'async', 'patterns',
+    'database', 'design', 'systems', 'notes', 'distributed', 'testing',
+    'history', 'rome', 'greece', 'myths', 'earth', 'sky', 'blue', 'green',
+    'deep', 'shallow', 'guide', 'introduction', 'advanced', 'practical',
+    'modern', 'theory', 'essays', 'letters', 'novel', 'stories', 'war',
+    'peace', 'city', 'river', 'mountain', 'memory', 'time', 'machine',
+    'learning', 'data', 'network', 'security', 'performance', 'postgres',
+    'queries', 'indexes', 'cache', 'kernel', 'compiler', 'language',
+    'philosophy', 'science', 'biology', 'physics', 'music', 'cinema',
+    'poetry', 'travel',
+)
+TAG_WORDS = (
+    'work', 'learning', 'important', 'hobby', 'reading', 'later', 'fun',
+    'backend', 'frontend', 'ops', 'research', 'fiction', 'history',
+    'science', 'classics', 'favorites', 'gift', 'club', 'reference',
+    'someday',
+)
+# сколько тегов у Item: чаще один-два, без тегов - заметная доля
+TAG_FANOUT_WEIGHTS = {0: 20, 1: 35, 2: 25, 3: 12, 4: 5, 5: 3}
+KIND_WEIGHTS = {ItemKind.book: 40, ItemKind.article: 60}
+STATUS_WEIGHTS = {
+    ItemStatus.planned: 50, ItemStatus.reading: 15, ItemStatus.done: 35,
+}
+PRIORITY_WEIGHTS = {
+    ItemPriority.low: 25, ItemPriority.normal: 55, ItemPriority.high: 20,
+}
+NOTES_SHARE = 0.6
+MAX_NOTES_WORDS = 400
+CORPUS_WORDS = 64 * 1024
+
+
+@dataclass(frozen=True)
+class DatasetConfig:
+    users: int
+    items_per_user: int
+    tags_per_user: int = 20
+    seed: int = 42
+    # sigma логнормального распределения Item по пользователям; 0 - поровну
+    skew: float = 1.0
+    batch_size: int = 10_000
+
+
+def items_per_user(config: DatasetConfig) -> list[int]:
+    """Число Item у каждого пользователя, в сумме ровно users * items_per_user."""
+    rnd = random.Random(f'{config.seed}:users')  # noqa: S311
+    weights = [rnd.lognormvariate(0, config.skew) for _ in range(config.users)]
+    total = config.users * config.items_per_user
+    weights_sum = sum(weights)
+    shares = [total * weight / weights_sum for weight in weights]
+    counts = [math.floor(share) for share in shares]
+    # остаток - пользователям с наибольшей дробной частью
+    by_remainder = sorted(
+        range(config.users),
+        key=lambda idx: counts[idx] - shares[idx],
+    )
+    for idx in by_remainder[:total - sum(counts)]:
+        counts[idx] += 1
+    return counts
+
+
+def generate_users(config: DatasetConfig) -> Iterator[dict[str, Any]]:
+    for user_id in range(1, config.users + 1):
+        yield {
+            'id': user_id,
+            'email': f'user{user_id}@example.com',
+            'display_name': f'User {user_id}',
+        }
+
+
+def generate_tags(config: DatasetConfig) -> Iterator[dict[str, Any]]:
+    for user_id in range(1, config.users + 1):
+        for idx in range(config.tags_per_user):
+            name = TAG_WORDS[idx % len(TAG_WORDS)]
+            if idx >= len(TAG_WORDS):
+                name = f'{name}-{idx // len(TAG_WORDS)}'
+            yield {
+                'id': _tag_id(config, user_id, idx),
+                'user_id': user_id,
+                'name': name,
+            }
+
+
+def generate_items(  # noqa: WPS210
+    config: DatasetConfig,
+) -> Iterator[tuple[dict[str, Any], list[int]]]:
+    """Пары (строка items, id тегов Item); id идут подряд с 1."""
+    rnd = random.Random(f'{config.seed}:items')  # noqa: S311
+    # заметки - срезы одного длинного "текста": на 10M строк выбирать
+    # каждое слово отдельно заметно дольше самих INSERT
+    corpus = rnd.choices(WORDS, k=CORPUS_WORDS)
+    # вес тега ~ 1 / ранг: первые теги пользователя самые популярные
+    tag_weights = list(itertools.accumulate(
+        1 / rank for rank in range(1, config.tags_per_user + 1)
+    ))
+    fanout = _cumulative(TAG_FANOUT_WEIGHTS)
+    kinds = _cumulative(KIND_WEIGHTS)
+    statuses = _cumulative(STATUS_WEIGHTS)
+    priorities = _cumulative(PRIORITY_WEIGHTS)
+    item_ids = itertools.count(1)
+    for user_id, n_items in enumerate(items_per_user(config), start=1):
+        user_tag_ids = [
+            _tag_id(config, user_id, idx) for idx in range(config.tags_per_user)
+        ]
+        for _ in range(n_items):
+            created_at = DATASET_END - DATASET_SPAN * rnd.random()
+            updated_at = min(
+                created_at + timedelta(days=rnd.expovariate(1 / 30)),
+                DATASET_END,
+            )
+            n_tags = min(_pick(rnd, fanout), config.tags_per_user)
+            tag_ids = sorted(set(rnd.choices(
+                user_tag_ids, cum_weights=tag_weights, k=n_tags,
+            ))) if n_tags else []
+            item_status = _pick(rnd, statuses)
+            yield {
+                'id': next(item_ids),
+                'user_id': user_id,
+                'title': _title(rnd),
+                'kind': _pick(rnd, kinds),
+                'status': item_status,
+                'priority': _pick(rnd, priorities),
+                'notes': _notes(rnd, corpus),
+                'created_at': created_at,
+                'updated_at': updated_at,
+                'done_at': (
+                    updated_at if item_status == ItemStatus.done else None
+                ),
+            }, tag_ids
+
+
+async def generate_dataset(  # noqa: WPS210
+    config: DatasetConfig,
+    db_engine: AsyncEngine = engine,
+) -> dict[str, int]:
+    """Пишет датасет пакетами по batch_size, транзакция на пакет."""
+    async with db_engine.connect() as conn:
+        if await conn.scalar(select(func.count()).select_from(UserORM)):
+            raise RuntimeError('Dataset generator needs an empty database')
+
+    totals = {'users': 0, 'tags': 0, 'items': 0, 'item_tags': 0}
+    started = time.perf_counter()
+    for table, rows in (
+        (UserORM.__table__, generate_users(config)),
+        (TagORM.__table__, generate_tags(config)),
+    ):
+        for batch in _batches(rows, config.batch_size):
+            async with db_engine.begin() as conn:
+                await conn.execute(insert(table), batch)
+            totals[table.name] += len(batch)
+
+    for item_batch in _batches(generate_items(config), config.batch_size):
+        links = [
+            {'item_id': item['id'], 'tag_id': tag_id}
+            for item, tag_ids in item_batch
+            for tag_id in tag_ids
+        ]
+        async with db_engine.begin() as conn:
+            await conn.execute(
+                insert(ItemORM.__table__), [item for item, _ in item_batch],
+            )
+            if links:
+                await conn.execute(insert(ItemTagORM.__table__), links)
+        totals['items'] += len(item_batch)
+        totals['item_tags'] += len(links)
+        elapsed = time.perf_counter() - started
+        print(
+            f'Seed: {totals["items"]} items, {totals["item_tags"]} links, '
+            f'{totals["items"] / elapsed:.0f} items/s',
+            file=sys.stderr,
+        )
+
+    if db_engine.dialect.name == 'postgresql':
+        # id выданы явно - sequence нужно догнать, иначе следующий INSERT
+        # приложения упрется в занятый id
+        async with db_engine.begin() as conn:
+            for model in (UserORM, TagORM, ItemORM):
+                max_id = select(func.coalesce(func.max(model.id), 1))
+                await conn.execute(select(func.setval(
+                    func.pg_get_serial_sequence(model.__tablename__, 'id'),
+                    max_id.scalar_subquery(),
+                )))
+    # строки писались в обход сервисов - счетчики строятся из них целиком
+    await reconcile_stats(db_engine)
+    return totals
+
+
+def _batches(rows: Iterator[Any], size: int) -> Iterator[list[Any]]:
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def _tag_id(config: DatasetConfig, user_id: int, idx: int) -> int:
+    return (user_id - 1) * config.tags_per_user + idx + 1
+
+
+def _cumulative(weights: dict[Any, int]) -> tuple[tuple[Any, ...], list[int]]:
+    return tuple(weights), list(itertools.accumulate(weights.values()))
+
+
+def _pick(rnd: random.Random, cumulative: tuple[tuple[Any, ...], list[int]]) -> Any:
+    # random.choices без пересчета накопленных весов на каждый вызов
+    population, cum_weights = cumulative
+    return population[bisect.bisect(cum_weights, rnd.random() * cum_weights[-1])]
+
+
+def _title(rnd: random.Random) -> str:
+    words = rnd.choices(WORDS, k=rnd.randint(2, 7))
+    return ' '.join(words).capitalize()
+
+
+def _notes(rnd: random.Random, corpus: list[str]) -> str | None:
+    if rnd.random() >= NOTES_SHARE:
+        return None
+    # медиана ~20 слов, хвост до пары абзацев
+    n_words = min(max(int(rnd.lognormvariate(3, 0.8)), 1), MAX_NOTES_WORDS)
+    start = rnd.randrange(len(corpus) - n_words)
+    return ' '.join(corpus[start:start + n_words]).capitalize() + '.'
 
 
 async def run_seed() -> None:
@@ -78,6 +322,7 @@ async def run_seed() -> None:
                 status=ItemStatus.done,
                 priority=ItemPriority.low,
                 notes='Просто для интереса, уже прочитано.',
+                done_at=datetime.now(timezone.utc),
                 tags=[tag_hobby],
             ),
             ItemORM(
@@ -114,7 +359,35 @@ async def run_seed() -> None:
 
         session.add_all(items_melinoe + items_zagreus)
         await session.commit()
+    await reconcile_stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument('--users', type=int, help='без него - демо-данные')
+    parser.add_argument('--items-per-user', type=int, default=100)
+    parser.add_argument('--tags-per-user', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--batch-size', type=int, default=10_000)
+    args = parser.parse_args()
+
+    if args.users is None:
+        asyncio.run(run_seed())
+        return
+    config = DatasetConfig(
+        users=args.users,
+        items_per_user=args.items_per_user,
+        tags_per_user=args.tags_per_user,
+        seed=args.seed,
+        skew=args.skew,
+        batch_size=args.batch_size,
+    )
+    totals = asyncio.run(generate_dataset(config))
+    print(f'Seed: done, {totals}')
 
 
 if __name__ == '__main__':
-    asyncio.run(run_seed())
+    main()
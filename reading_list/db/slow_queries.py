@@ -0,0 +1,193 @@
+"""Журнал медленных SQL-запросов с планами выполнения.
+
+Запрос дольше порога пишется JSON-строкой в ротируемый файл: текст,
+"форма" параметров (типы и длины, без значений), роут и длительность.
+Для доли таких запросов план снимается в фоне на отдельном соединении
+того engine, который выполнил запрос (primary или реплика); транзакция
+EXPLAIN откатывается: запрос пользователя не ждет EXPLAIN, а EXPLAIN
+ANALYZE не оставляет следов. Одновременно снимается не больше
+explain_concurrency планов, остальные записи пишутся без плана.
+"""
+import asyncio
+import json
+import logging
+import random
+import re
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from reading_list.config import Settings
+from reading_list.utils.metrics import request_stats
+
+# execution option, которым помечены собственные EXPLAIN журнала
+SKIP_OPTION = 'skip_slow_query_log'
+# SELECT с побочными эффектами: ANALYZE повторил бы их (сдвинул sequence,
+# взял блокировку), поэтому для них снимается план без выполнения
+VOLATILE_RE = re.compile(
+    r'\b(?:nextval|setval|pg_advisory\w*|pg_try_advisory\w*)\s*\('
+    r'|\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b|\bFOR\s+(?:KEY\s+)?SHARE\b',
+    re.IGNORECASE,
+)
+
+
+class SlowQueryLog:
+    def __init__(  # noqa: WPS211
+        self,
+        path: str,
+        threshold_ms: float,
+        explain_rate: float = 0,
+        explain_concurrency: int = 2,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+    ):
+        self.threshold_seconds = threshold_ms / 1000
+        self.explain_rate = explain_rate
+        self.explain_concurrency = explain_concurrency
+        self._tasks: set[asyncio.Task] = set()
+        self._logger = logging.getLogger(f'{__name__}:{path}')
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        if not self._logger.handlers:
+            handler = RotatingFileHandler(
+                path, maxBytes=max_bytes, backupCount=backups, encoding='utf-8',
+            )
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self._logger.addHandler(handler)
+
+    @classmethod
+    def from_settings(cls, settings: Settings):
+        return cls(
+            path=settings.slow_query_log,
+            threshold_ms=settings.slow_query_threshold_ms,
+            explain_rate=settings.slow_query_explain_rate,
+            explain_concurrency=settings.slow_query_explain_concurrency,
+            max_bytes=settings.slow_query_log_max_bytes,
+            backups=settings.slow_query_log_backups,
+        )
+
+    def record(  # noqa: WPS211
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+        elapsed: float,
+    ) -> None:
+        """Вызывается из after_cursor_execute для каждого запроса."""
+        if elapsed < self.threshold_seconds:
+            return
+        if context is not None and context.execution_options.get(SKIP_OPTION):
+            return
+        stats = request_stats.get()
+        entry = {
+            'ts': datetime.now(timezone.utc).isoformat(),
+            'duration_ms': round(elapsed * 1000, 3),
+            'method': stats.scope.get('method') if stats else None,
+            'route': stats.route if stats else None,
+            'dialect': conn.dialect.name,
+            'statement': statement,
+            'parameters': parameter_shapes(parameters, executemany),
+        }
+        if executemany or random.random() >= self.explain_rate:
+            self._write(entry)
+            return
+        # задачи регистрируются синхронно, так что self._tasks - точный
+        # счетчик занятых слотов; лишние EXPLAIN не ставятся в очередь
+        if len(self._tasks) >= self.explain_concurrency:
+            entry['plan_error'] = 'skipped: explain concurrency limit'
+            self._write(entry)
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._explain_and_write(conn.engine, entry, statement, parameters),
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait_pending(self) -> None:
+        """Дождаться фоновых EXPLAIN (тесты, остановка приложения)."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _explain_and_write(
+        self,
+        sync_engine: Engine,
+        entry: dict[str, Any],
+        statement: str,
+        parameters: Any,
+    ) -> None:
+        try:
+            entry['plan'] = await self._explain(
+                AsyncEngine(sync_engine), statement, parameters,
+            )
+        except Exception as exc:  # noqa: B902
+            # журнал не должен ронять приложение: план просто не снят
+            entry['plan_error'] = repr(exc)
+        self._write(entry)
+
+    async def _explain(
+        self,
+        engine: AsyncEngine,
+        statement: str,
+        parameters: Any,
+    ) -> Any:
+        dialect_name = engine.dialect.name
+        if dialect_name == 'postgresql':
+            options = 'FORMAT JSON'
+            # ANALYZE выполняет запрос: для DML и volatile SELECT - нельзя
+            if is_analyze_safe(statement):
+                options = f'ANALYZE, BUFFERS, {options}'
+            explain = f'EXPLAIN ({options}) {statement}'
+        elif dialect_name == 'sqlite':
+            explain = f'EXPLAIN QUERY PLAN {statement}'
+        else:
+            return None
+
+        async with engine.connect() as conn:
+            rows = (await conn.exec_driver_sql(
+                explain,
+                tuple(parameters) if isinstance(parameters, list) else parameters,
+                execution_options={SKIP_OPTION: True},
+            )).all()
+            await conn.rollback()
+
+        if dialect_name == 'postgresql':
+            plan = rows[0][0]
+            return json.loads(plan) if isinstance(plan, str) else plan
+        return [row.detail for row in rows]
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self._logger.info(json.dumps(entry, default=str, ensure_ascii=False))
+
+
+def is_analyze_safe(statement: str) -> bool:
+    """SELECT без побочных эффектов - его можно выполнить под ANALYZE."""
+    if statement.lstrip()[:6].upper() != 'SELECT':
+        return False
+    return VOLATILE_RE.search(statement) is None
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """Типы и размеры параметров - значения в журнал не попадают."""
+    if executemany:
+        return {
+            'rows': len(parameters),
+            'row': parameter_shapes(parameters[0]) if parameters else None,
+        }
+    if isinstance(parameters, dict):
+        return {
+            name: _value_shape(param_value)
+            for name, param_value in parameters.items()
+        }
+    return [_value_shape(param_value) for param_value in parameters or ()]
+
+
+def _value_shape(param_value: Any) -> str:
+    type_name = type(param_value).__name__
+    if isinstance(param_value, (str, bytes, list, tuple)):
+        return f'{type_name}[{len(param_value)}]'
+    return type_name
@@ -0,0 +1,87 @@
+"""Сверка user_item_stats с items/item_tags/tags.
+
+Счетчики меняются дельтами вместе с записями; расходиться они могут
+только из-за записей в обход сервисов (ручной SQL, гонки bulk-операций).
+Задача пересчитывает их из источника пачками пользователей, транзакция
+на пачку, и дописывает разницу дельтой - параллельные записи не
+затираются.
+
+    python -m reading_list.jobs.reconcile_stats
+    python -m reading_list.jobs.reconcile_stats --user-id 42
+"""
+import argparse
+import asyncio
+import logging
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from reading_list.db.engine import engine
+from reading_list.db.models.user import UserORM
+from reading_list.repositories.stats import UserItemStatsRepository
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_BATCH_SIZE = 500
+
+
+async def reconcile_stats(
+    db_engine: AsyncEngine = engine,
+    user_ids: Sequence[int] | None = None,
+    batch_size: int = RECONCILE_BATCH_SIZE,
+) -> int:
+    """Пересчитывает счетчики user_ids (None - всех); возвращает число правок."""
+    drift = 0
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        async for batch in _user_batches(session, user_ids, batch_size):
+            fixed = await UserItemStatsRepository(session).reconcile(batch)
+            await session.commit()
+            if fixed:
+                logger.warning(
+                    'User stats drift: users %s..%s, %s counters fixed',
+                    batch[0], batch[-1], fixed,
+                )
+            drift += fixed
+    return drift
+
+
+async def _user_batches(
+    session: AsyncSession,
+    user_ids: Sequence[int] | None,
+    batch_size: int,
+) -> AsyncIterator[list[int]]:
+    if user_ids is not None:
+        for start in range(0, len(user_ids), batch_size):
+            yield list(user_ids[start:start + batch_size])
+        return
+    last_user_id = 0
+    while True:
+        batch = list((await session.scalars(
+            select(UserORM.id).where(
+                UserORM.id > last_user_id,
+            ).order_by(UserORM.id).limit(batch_size),
+        )).all())
+        if not batch:
+            return
+        yield batch
+        last_user_id = batch[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument('--user-id', type=int, action='append')
+    parser.add_argument('--batch-size', type=int, default=RECONCILE_BATCH_SIZE)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    drift = asyncio.run(reconcile_stats(
+        user_ids=args.user_id, batch_size=args.batch_size,
+    ))
+    print(f'Reconcile: {drift} counters fixed')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,15 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from reading_list.api.router import api_router
-from reading_list.db.engine import engine
+from reading_list.db import engine as db_engine
 from reading_list.error_handlers import register_exception_handlers
+from reading_list.middleware import MetricsMiddleware
+from reading_list.utils.metrics import REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
 
 
 @asynccontextmanager
@@ -12,7 +17,16 @@ async def lifespan(app_main: FastAPI):
     # startup
     yield
     # shutdown
-    await engine.dispose()
+    if db_engine.slow_query_log is not None:
+        await db_engine.slow_query_log.wait_pending()
+    await db_engine.engine.dispose()
+    await db_engine.replica_router.dispose()
+
+
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE,
+    )
 
 
 def create_app() -> FastAPI:
@@ -22,7 +36,11 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
     register_exception_handlers(main_app)
+    main_app.add_middleware(MetricsMiddleware)
     main_app.include_router(api_router, prefix='/api/v1')
+    main_app.add_api_route(
+        '/metrics', metrics, include_in_schema=False,
+    )
 
     return main_app
 
@@ -0,0 +1,114 @@
+import time
+from typing import Iterable
+
+from fastapi.routing import iter_route_contexts
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from reading_list.config import settings
+from reading_list.utils.metrics import (  # noqa: WPS318, WPS319
+    COUNT_BUCKETS,
+    REGISTRY,
+    RequestStats,
+    request_stats,
+)
+from reading_list.utils.timing import server_timing_header
+
+SERVER_TIMING_REQUEST_HEADER = b'x-server-timing'
+
+http_requests = REGISTRY.counter(
+    'http_requests_total', 'HTTP requests.', 'method', 'route', 'status',
+)
+http_request_seconds = REGISTRY.histogram(
+    'http_request_duration_seconds', 'HTTP request latency.',
+    'method', 'route',
+)
+http_request_db_queries = REGISTRY.histogram(
+    'http_request_db_queries', 'SQL statements per HTTP request.',
+    'method', 'route',
+    buckets=COUNT_BUCKETS,
+)
+http_request_db_seconds = REGISTRY.histogram(
+    'http_request_db_seconds', 'Database time per HTTP request.',
+    'method', 'route',
+)
+
+
+class MetricsMiddleware:
+    """Чистый ASGI: латентность и работа с БД по шаблону роута.
+
+    Шаблон (`/api/v1/items/{item_id}`) строится по scope['route'], который
+    роутер заполняет при сопоставлении пути; полные шаблоны с префиксами
+    собираются из app.routes один раз, на первом запросе. По запросу
+    (SERVER_TIMING или заголовок X-Server-Timing) добавляет в ответ
+    Server-Timing.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._templates: dict[int, str] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        if self._templates is None:
+            self._templates = route_templates(scope['app'].routes)
+        stats = RequestStats(
+            scope=scope,
+            templates=self._templates,
+            detailed=_wants_server_timing(scope),
+        )
+        token = request_stats.set(stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:  # noqa: WPS430
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if stats.detailed:
+                    timing = server_timing_header(
+                        stats, time.perf_counter() - started,
+                    )
+                    message['headers'] = [
+                        *message.get('headers', []),
+                        (b'server-timing', timing.encode()),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            request_stats.reset(token)
+            route = stats.route
+            method = scope['method']
+            http_requests.labels(method, route, str(status_code)).inc()
+            http_request_seconds.labels(method, route).observe(elapsed)
+            http_request_db_queries.labels(method, route).observe(stats.queries)
+            http_request_db_seconds.labels(method, route).observe(
+                stats.db_seconds,
+            )
+
+
+def _wants_server_timing(scope: Scope) -> bool:
+    if settings.server_timing:
+        return True
+    return any(
+        name == SERVER_TIMING_REQUEST_HEADER for name, _ in scope['headers']
+    )
+
+
+
+def route_templates(routes: Iterable[BaseRoute]) -> dict[int, str]:
+    """id(роут) -> полный шаблон пути, с префиксами include_router.
+
+    Роут, подключенный несколько раз, получает шаблон первого включения.
+    """
+    templates: dict[int, str] = {}
+    for context in iter_route_contexts(list(routes)):
+        if context.path_format is not None:
+            templates.setdefault(id(context.original_route), context.path_format)
+    return templates
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import inspect
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from reading_list.utils.timing import orm_timed
+
 TModel = TypeVar('TModel')
 
 
@@ -13,21 +16,36 @@ class BaseCrudRepository(ABC, Generic[TModel]):
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # публичные корутины репозиториев попадают в orm;Server-Timing
+        super().__init_subclass__(**kwargs)
+        for name, attr in list(vars(cls).items()):
+            if not name.startswith('_') and inspect.iscoroutinefunction(attr):
+                setattr(cls, name, orm_timed(attr))
+
     @abstractmethod
     async def get_by_id(self, obj_id: int) -> TModel | None:
         raise NotImplementedError
 
+    @orm_timed
     async def add(self, orm_model: TModel) -> TModel:
         self.db.add(orm_model)
         await self.db.flush()
         return orm_model
 
+    @orm_timed
     async def delete(self, db_obj: TModel) -> None:
         await self.db.delete(db_obj)
 
+    @orm_timed
     async def commit(self) -> None:
         await self.db.commit()
 
+    @orm_timed
+    async def rollback(self) -> None:
+        await self.db.rollback()
+
+    @orm_timed
     async def refresh(
         self,
         db_obj: TModel,
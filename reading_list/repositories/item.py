@@ -1,12 +1,133 @@
-from typing import Any, Sequence
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Collection, Sequence
 
-from sqlalchemy import Select, and_, func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import (  # noqa: WPS318, WPS319
+    BigInteger,
+    Row,
+    Select,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    type_coerce,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncResult
 
 from reading_list.api.schemas.item_filter import ItemFilter
-from reading_list.db.models.item import ItemORM
-from reading_list.db.models.tag import TagORM
+from reading_list.db.models.item import ItemORM, ItemPriority, ItemStatus
+from reading_list.db.models.tag import ItemTagORM
 from reading_list.repositories.base_crud import BaseCrudRepository
+from reading_list.repositories.search import SearchBackend, get_search_backend
+from reading_list.repositories.stats import month_column
+from reading_list.utils.cursor import (  # noqa: WPS318, WPS319
+    INVALID_CURSOR_MSG,
+    decode_cursor,
+    encode_cursor,
+)
+from reading_list.utils.errors import ValidationError
+
+SORT_COLUMN_MAP = {
+    'created_at': ItemORM.created_at,
+    'updated_at': ItemORM.updated_at,
+    'priority': ItemORM.priority,
+}
+TOTAL_COLUMN = 'total'
+EXPORT_CHUNK_SIZE = 1000
+# колонки ItemOut: листинг и экспорт читают их Core-строками, без ORM
+ITEM_COLUMNS = (
+    ItemORM.id,
+    ItemORM.user_id,
+    ItemORM.title,
+    ItemORM.kind,
+    ItemORM.status,
+    ItemORM.priority,
+    ItemORM.notes,
+    ItemORM.created_at,
+    ItemORM.updated_at,
+)
+TAG_IDS_COLUMN = 'tag_ids'
+FACET_COLUMNS = {
+    'status': ItemORM.status,
+    'kind': ItemORM.kind,
+    'priority': ItemORM.priority,
+}
+ITEM_COLUMNS_BY_NAME = {column.key: column for column in ITEM_COLUMNS}
+# колонки, которые импорт пишет в items; остальное - server_default
+IMPORT_COLUMNS = (
+    'id', 'user_id', 'title', 'kind', 'status', 'priority', 'notes', 'done_at',
+)
+DONE_MONTH_COLUMN = 'done_month'
+
+
+@dataclass
+class ItemListing:
+    items: list[Row]
+    total: int | None
+    has_more: bool = False
+    next_cursor: str | None = None
+    tag_ids: dict[int, list[int]] = field(default_factory=dict)
+
+
+def tag_ids_column(dialect_name: str) -> Any:
+    """id тегов Item агрегатом в коррелированном подзапросе.
+
+    В отличие от joinedload(ItemORM.tags) строка Item не размножается
+    на число тегов, и LIMIT не приходится заворачивать в подзапрос.
+    """
+    if dialect_name == 'postgresql':
+        agg = func.array_agg(ItemTagORM.tag_id, type_=ARRAY(BigInteger))
+    else:
+        agg = func.json_group_array(ItemTagORM.tag_id)
+    return select(agg).where(
+        ItemTagORM.item_id == ItemORM.id,
+    ).scalar_subquery().label(TAG_IDS_COLUMN)
+
+
+def item_columns(fields: Collection[str] | None = None) -> list[Any]:
+    """Колонки под поля ItemOut (None - все); tag_ids - отдельный агрегат.
+
+    id выбирается всегда: это ключ tag_ids и тай-брейкер курсора.
+    """
+    if fields is None:
+        return list(ITEM_COLUMNS)
+    return [ItemORM.id, *(
+        column for name, column in ITEM_COLUMNS_BY_NAME.items()
+        if name in fields and name != 'id'
+    )]
+
+
+def bulk_done_at(status: ItemStatus, moment: datetime) -> Any:
+    """done_at для UPDATE по фильтру, меняющего status.
+
+    Уже done Item свой done_at сохраняют, ставшие done получают moment.
+    """
+    if status != ItemStatus.done:
+        return None
+    return case(
+        (ItemORM.status == ItemStatus.done, ItemORM.done_at),
+        else_=literal(moment, ItemORM.done_at.type),
+    )
+
+
+def parse_tag_ids(raw_tag_ids: Any) -> list[int]:
+    if raw_tag_ids is None:
+        return []
+    if isinstance(raw_tag_ids, str):
+        raw_tag_ids = json.loads(raw_tag_ids)
+    return sorted(raw_tag_ids)
 
 
 class ItemRepository(BaseCrudRepository[ItemORM]):
@@ -16,69 +137,485 @@ class ItemRepository(BaseCrudRepository[ItemORM]):
         res = await self.db.execute(stmt)
         return res.scalar_one_or_none()
 
-    async def get_item_for_user(
+    async def get_item_with_tag_ids(
         self,
         item_id: int,
         user_id: int,
-        with_tags: bool = False,
-    ) -> ItemORM | None:
-        stmt = select(ItemORM).where(
+        for_update: bool = False,
+    ) -> tuple[ItemORM, list[int]] | None:
+        """Item и id его тегов одним запросом, без загрузки TagORM.
+
+        for_update=True блокирует строку Item до конца транзакции: по
+        прочитанным значениям считаются дельты user_item_stats, и
+        параллельная запись того же Item не должна их устареть.
+        """
+        stmt = select(
+            ItemORM, tag_ids_column(self._dialect_name),
+        ).where(
             ItemORM.id == item_id,
             ItemORM.user_id == user_id,
         )
-        if with_tags:
-            stmt = stmt.options(joinedload(ItemORM.tags))
+        if for_update:
+            stmt = stmt.with_for_update(of=ItemORM).execution_options(
+                populate_existing=True,
+            )
+        row = (await self.db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], parse_tag_ids(row.tag_ids)
 
-        res = await self.db.execute(stmt)
-        return res.unique().scalar_one_or_none()
+    async def get_item_row(
+        self,
+        item_id: int,
+        user_id: int,
+        fields: Collection[str] | None = None,
+    ) -> Row | None:
+        """Item Core-строкой только с колонками под fields (см. item_columns)."""
+        stmt = select(*item_columns(fields)).where(
+            ItemORM.id == item_id,
+            ItemORM.user_id == user_id,
+        )
+        if fields is None or TAG_IDS_COLUMN in fields:
+            stmt = stmt.add_columns(tag_ids_column(self._dialect_name))
+        return (await self.db.execute(stmt)).one_or_none()
+
+    async def get_fingerprint(
+        self,
+        user_id: int,
+    ) -> tuple[int, datetime | None]:
+        """Число Item пользователя и max(updated_at) - для ETag списка.
+
+        Любая запись либо меняет число строк, либо двигает updated_at;
+        оба агрегата считаются по индексу (user_id, updated_at, id).
+        """
+        stmt = select(
+            func.count(ItemORM.id), func.max(ItemORM.updated_at),
+        ).where(ItemORM.user_id == user_id)
+        count, last_updated_at = (await self.db.execute(stmt)).one()
+        return count, last_updated_at
+
+    async def get_item_version(
+        self,
+        item_id: int,
+        user_id: int,
+    ) -> datetime | None:
+        stmt = select(ItemORM.updated_at).where(
+            ItemORM.id == item_id,
+            ItemORM.user_id == user_id,
+        )
+        return await self.db.scalar(stmt)
 
     async def get_with_filters(
         self,
         user_id: int,
         filters: ItemFilter,
-    ) -> tuple[list[ItemORM], int]:
-        base_stmt, count_stmt = self._build_base_queries(user_id)
-        base_stmt, count_stmt = self._apply_filters(
-            base_stmt, count_stmt, filters
+        fields: Collection[str] | None = None,
+    ) -> ItemListing:
+        """Страница Item за один запрос; total - согласно filters.count.
+
+        Item приходят Core-строками только с колонками под fields
+        (см. item_columns), tag_ids - если он среди fields.
+        """
+        base_stmt, count_stmt = self.build_list_queries(
+            user_id, filters, self.search, item_columns(fields),
         )
-        base_stmt = self._apply_sorting(base_stmt, filters)
-        base_stmt = self._apply_pagination_and_options(base_stmt, filters)
+        total: int | None = None
+        with_total_column = False
+        if filters.count == 'estimate' and self._dialect_name == 'postgresql':
+            total = await self._estimate_count(count_stmt)
+        elif filters.count != 'none':
+            base_stmt = self._with_total_column(base_stmt, count_stmt, filters)
+            with_total_column = True
+
+        with_tag_ids = fields is None or TAG_IDS_COLUMN in fields
+        if with_tag_ids:
+            base_stmt = base_stmt.add_columns(
+                tag_ids_column(self._dialect_name),
+            )
         items_result = await self.db.execute(base_stmt)
-        db_items = list(items_result.unique().scalars().all())
-        total = (await self.db.execute(count_stmt)).scalar_one()
-        return db_items, total
+        rows = list(items_result.all())
+
+        if with_total_column:
+            # на пустой странице оконной функции не из чего взять число
+            total = rows[0].total if rows else await self._count_if_needed(
+                count_stmt, filters,
+            )
+
+        listing = ItemListing(items=[], total=total)
+        if len(rows) > filters.limit:
+            rows = rows[:filters.limit]
+            listing.has_more = True
+            listing.next_cursor = self._build_cursor(
+                rows[-1].sort_value, rows[-1].id, filters,
+            )
+        listing.items = rows
+        if with_tag_ids:
+            listing.tag_ids = {
+                row.id: parse_tag_ids(row.tag_ids) for row in rows
+            }
+        return listing
+
+    async def get_facets(
+        self,
+        user_id: int,
+        filters: ItemFilter,
+    ) -> dict[str, dict[Any, int]]:
+        """Число Item под filters по значениям status/kind/priority и тегам.
+
+        Два запроса: сгруппированные колонки Item (GROUPING SETS на
+        Postgres, UNION ALL на SQLite) и теги через item_tags.
+        Пагинация и сортировка из filters не учитываются.
+        """
+        columns_stmt, tags_stmt = self._apply_filters(
+            select(*FACET_COLUMNS.values()).where(ItemORM.user_id == user_id),
+            select(ItemTagORM.tag_id, func.count()).join(
+                ItemORM, ItemORM.id == ItemTagORM.item_id,
+            ).where(ItemORM.user_id == user_id),
+            filters,
+            self.search,
+        )
+        facets: dict[str, dict[Any, int]] = {name: {} for name in FACET_COLUMNS}
+        if self._dialect_name == 'postgresql':
+            # по строке на значение; колонки вне своего набора - NULL,
+            # а сами они NOT NULL, поэтому набор виден по непустой колонке
+            grouped = columns_stmt.add_columns(
+                func.count().label('count'),
+            ).group_by(func.grouping_sets(*(
+                tuple_(column) for column in FACET_COLUMNS.values()
+            )))
+            for row in (await self.db.execute(grouped)).mappings():
+                name = next(
+                    name for name in FACET_COLUMNS if row[name] is not None
+                )
+                facets[name][row[name]] = row['count']
+        else:
+            filtered = columns_stmt.subquery()
+            grouped = union_all(*(
+                select(
+                    literal(name).label('facet'),
+                    type_coerce(filtered.c[name], String).label('value'),
+                    func.count().label('count'),
+                ).group_by(filtered.c[name])
+                for name in FACET_COLUMNS
+            ))
+            for row in await self.db.execute(grouped):
+                facets[row.facet][row.value] = row.count
+
+        tags_stmt = tags_stmt.group_by(ItemTagORM.tag_id)
+        facets[TAG_IDS_COLUMN] = dict((await self.db.execute(tags_stmt)).all())
+        return facets
+
+    async def lock_ids(self, user_id: int, filters: ItemFilter) -> list[int]:
+        """id Item под filters, заблокированные FOR UPDATE до конца транзакции.
 
-    async def get_tags_for_user_by_ids(
+        Bulk-операции дальше работают только с этими строками: параллельная
+        запись не изменит ни их набор, ни значения между подсчетом дельт
+        user_item_stats и UPDATE/DELETE. SQLite FOR UPDATE не выводит -
+        пишущая транзакция там и так одна.
+        """
+        stmt = select(ItemORM.id).where(
+            ItemORM.user_id == user_id,
+            *self._filter_conditions(filters, self.search),
+        ).with_for_update()
+        return list((await self.db.scalars(stmt)).all())
+
+    async def get_stat_groups(
         self,
         user_id: int,
-        tag_ids: list[int],
-    ) -> Sequence[TagORM]:
-        if not tag_ids:
+        item_ids: list[int],
+    ) -> tuple[list[Row], dict[int, int]]:
+        """Item из item_ids, сгруппированные по счетчикам user_item_stats.
+
+        Строки (status, kind, priority, done_month, count) и число Item
+        по тегам - из них bulk-операции считают дельты счетчиков.
+        """
+        ids_condition = self._ids_condition(item_ids)
+        done_month = month_column(
+            self._dialect_name, ItemORM.done_at,
+        ).label(DONE_MONTH_COLUMN)
+        groups_stmt = select(
+            *FACET_COLUMNS.values(), done_month, func.count().label('count'),
+        ).where(
+            ItemORM.user_id == user_id, ids_condition,
+        ).group_by(*FACET_COLUMNS.values(), done_month)
+        tags_stmt = select(ItemTagORM.tag_id, func.count()).join(
+            ItemORM, ItemORM.id == ItemTagORM.item_id,
+        ).where(
+            ItemORM.user_id == user_id, ids_condition,
+        ).group_by(ItemTagORM.tag_id)
+        groups = list((await self.db.execute(groups_stmt)).all())
+        return groups, dict((await self.db.execute(tags_stmt)).all())
+
+    async def stream_with_filters(
+        self,
+        user_id: int,
+        filters: ItemFilter,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncResult:
+        """Все Item под фильтром через серверный курсор, без ORM-объектов.
+
+        limit/offset/cursor из filters не учитываются, порядок - как в
+        листинге.
+        """
+        sort_expr = self._sort_expression(filters, self.search)
+        stmt = select(
+            *ITEM_COLUMNS, tag_ids_column(self._dialect_name),
+        ).where(
+            ItemORM.user_id == user_id,
+            *self._filter_conditions(filters, self.search),
+        )
+        stmt = self._apply_sorting(stmt, filters, sort_expr)
+        return await self.db.stream(
+            stmt.execution_options(yield_per=chunk_size),
+        )
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> list[ItemORM]:
+        """Многострочный INSERT ... RETURNING; порядок совпадает с rows."""
+        if not rows:
             return []
+        stmt = insert(ItemORM).returning(
+            ItemORM, sort_by_parameter_order=True,
+        )
+        res = await self.db.scalars(stmt, rows)
+        return list(res.all())
+
+    async def add_item_tags(self, links: list[dict[str, int]]) -> None:
+        """Связи item_tags одним executemany."""
+        if links:
+            await self.db.execute(insert(ItemTagORM), links)
+
+    async def load_items(
+        self,
+        rows: list[dict[str, Any]],
+        tag_ids: list[list[int]],
+    ) -> list[int]:
+        """Массовая загрузка Item и их тегов (tag_ids[i] - теги rows[i]).
+
+        На Postgres - COPY через asyncpg с заранее выданными id,
+        иначе - INSERT ... RETURNING id. Возвращает id по порядку rows.
+        """
+        if not rows:
+            return []
+        if self._dialect_name == 'postgresql':
+            item_ids = await self._copy_items(rows)
+        else:
+            stmt = insert(ItemORM.__table__).returning(
+                ItemORM.id, sort_by_parameter_order=True,
+            )
+            item_ids = list((await self.db.scalars(stmt, rows)).all())
+        links = [
+            (item_id, tag_id)
+            for item_id, item_tag_ids in zip(item_ids, tag_ids)
+            for tag_id in item_tag_ids
+        ]
+        if self._dialect_name == 'postgresql':
+            await self._copy_records(ItemTagORM.__tablename__, links, (
+                'item_id', 'tag_id',
+            ))
+        else:
+            await self.add_item_tags([
+                {'item_id': item_id, 'tag_id': tag_id}
+                for item_id, tag_id in links
+            ])
+        return item_ids
+
+    async def replace_item_tags(self, item_id: int, tag_ids: list[int]) -> None:
+        """Набор тегов Item целиком: DELETE старых связей и INSERT новых."""
+        await self.db.execute(
+            delete(ItemTagORM).where(ItemTagORM.item_id == item_id),
+        )
+        await self.add_item_tags([
+            {'item_id': item_id, 'tag_id': tag_id} for tag_id in tag_ids
+        ])
 
-        stmt = select(TagORM).where(
-            TagORM.user_id == user_id,
-            TagORM.id.in_(tag_ids),
+    async def remove_item_tags(self, item_id: int, tag_ids: list[int]) -> None:
+        await self.db.execute(
+            delete(ItemTagORM).where(
+                ItemTagORM.item_id == item_id,
+                ItemTagORM.tag_id.in_(tag_ids),
+            ),
         )
+
+    async def update_by_ids(
+        self,
+        user_id: int,
+        item_ids: list[int],
+        values: dict[str, Any],
+    ) -> int:
+        """Один UPDATE по id из lock_ids; возвращает число строк."""
+        stmt = update(ItemORM).where(
+            ItemORM.user_id == user_id,
+            self._ids_condition(item_ids),
+        ).values(**values).execution_options(synchronize_session=False)
         res = await self.db.execute(stmt)
-        return list(res.scalars().all())
+        return res.rowcount
+
+    async def delete_by_ids(self, user_id: int, item_ids: list[int]) -> int:
+        """Один DELETE по id из lock_ids; item_tags чистит FK CASCADE."""
+        stmt = delete(ItemORM).where(
+            ItemORM.user_id == user_id,
+            self._ids_condition(item_ids),
+        ).execution_options(synchronize_session=False)
+        res = await self.db.execute(stmt)
+        return res.rowcount
+
+    def _ids_condition(self, item_ids: list[int]) -> Any:
+        """ItemORM.id IN item_ids одним параметром - без лимита bind-параметров."""
+        if self._dialect_name == 'postgresql':
+            return ItemORM.id == any_(
+                bindparam(None, item_ids, type_=ARRAY(BigInteger)),
+            )
+        ids_table = func.json_each(json.dumps(item_ids)).table_valued('value')
+        return ItemORM.id.in_(select(ids_table.c.value))
+
+    async def _copy_items(self, rows: list[dict[str, Any]]) -> list[int]:
+        # id выдаются заранее одним запросом к sequence: COPY не умеет
+        # RETURNING, а id нужны для item_tags
+        id_sequence = func.pg_get_serial_sequence(ItemORM.__tablename__, 'id')
+        id_stmt = select(func.nextval(id_sequence)).select_from(
+            func.generate_series(1, len(rows)),
+        )
+        item_ids = list((await self.db.scalars(id_stmt)).all())
+        records = [
+            (item_id, *(row[name] for name in IMPORT_COLUMNS[1:]))
+            for item_id, row in zip(item_ids, rows)
+        ]
+        await self._copy_records(
+            ItemORM.__tablename__, records, IMPORT_COLUMNS,
+        )
+        return item_ids
+
+    async def _copy_records(
+        self,
+        table_name: str,
+        records: list[tuple[Any, ...]],
+        columns: Sequence[str],
+    ) -> None:
+        if not records:
+            return
+        conn = await self.db.connection()
+        raw_conn = await conn.get_raw_connection()
+        # asyncpg.Connection в той же транзакции, что и сессия
+        try:
+            await raw_conn.driver_connection.copy_records_to_table(
+                table_name, records=records, columns=list(columns),
+            )
+        except Exception as exc:  # noqa: B902
+            # ошибки asyncpg в обход DBAPI SQLAlchemy не оборачивает:
+            # нарушение ограничений (класс 23) - как у обычного INSERT
+            if str(getattr(exc, 'sqlstate', '')).startswith('23'):
+                raise IntegrityError(f'COPY {table_name}', None, exc) from exc
+            raise
+
+    @property
+    def search(self) -> SearchBackend:
+        return get_search_backend(self._dialect_name)
+
+    @property
+    def _dialect_name(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    async def _count_if_needed(
+        self,
+        count_stmt: Select,
+        filters: ItemFilter,
+    ) -> int:
+        if not filters.cursor and filters.offset == 0:
+            return 0
+        return (await self.db.execute(count_stmt)).scalar_one()
+
+    async def _estimate_count(self, count_stmt: Select) -> int:
+        """Оценка числа строк из плана Postgres без выполнения запроса."""
+        ids_stmt = count_stmt.with_only_columns(ItemORM.id)
+        conn = await self.db.connection()
+        compiled = ids_stmt.compile(
+            dialect=conn.dialect,
+            compile_kwargs={'render_postcompile': True},
+        )
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        res = await conn.exec_driver_sql(
+            f'EXPLAIN (FORMAT JSON) {compiled}', params,
+        )
+        plan = res.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    @staticmethod
+    def _with_total_column(
+        base_stmt: Select,
+        count_stmt: Select,
+        filters: ItemFilter,
+    ) -> Select:
+        # Окно считает строки до LIMIT в том же проходе; с курсором в
+        # выборке уже нет предыдущих страниц - тогда считает подзапрос
+        if filters.cursor:
+            total_expr = count_stmt.scalar_subquery()
+        else:
+            total_expr = func.count().over()
+        return base_stmt.add_columns(total_expr.label(TOTAL_COLUMN))
+
+    @classmethod
+    def build_list_queries(
+        cls,
+        user_id: int,
+        filters: ItemFilter,
+        search: SearchBackend,
+        columns: Sequence[Any] = ITEM_COLUMNS,
+    ) -> tuple[Select, Select]:
+        """Запрос страницы и запрос общего числа для get_with_filters."""
+        sort_expr = cls._sort_expression(filters, search)
+        base_stmt, count_stmt = cls._build_base_queries(
+            user_id, sort_expr, columns,
+        )
+        base_stmt, count_stmt = cls._apply_filters(
+            base_stmt, count_stmt, filters, search,
+        )
+        base_stmt = cls._apply_sorting(base_stmt, filters, sort_expr)
+        base_stmt = cls._apply_pagination_and_options(
+            base_stmt, filters, sort_expr,
+        )
+        return base_stmt, count_stmt
 
     @staticmethod
     def _build_base_queries(
         user_id: int,
+        sort_expr: Any,
+        columns: Sequence[Any],
     ) -> tuple[Select, Select]:
-        base_stmt = select(ItemORM).where(ItemORM.user_id == user_id)
+        # значение сортировки отдается рядом с Item - из него строится
+        # курсор, в том числе для вычисляемой релевантности. Только
+        # колонки: листинг read-only, identity map и ItemORM ему не нужны
+        base_stmt = select(
+            *columns, sort_expr.label('sort_value'),
+        ).where(ItemORM.user_id == user_id)
         count_stmt = select(
-            func.count(func.distinct(ItemORM.id)),
+            func.count(ItemORM.id),
         ).where(ItemORM.user_id == user_id)
         return base_stmt, count_stmt
 
-    @staticmethod
-    def _apply_filters(   # noqa: WPS210
+    @classmethod
+    def _apply_filters(
+        cls,
         base_stmt: Select,
         count_stmt: Select,
         filters: ItemFilter,
+        search: SearchBackend,
     ) -> tuple[Select, Select]:
+        conditions = cls._filter_conditions(filters, search)
+        if conditions:
+            cond = and_(*conditions)
+            base_stmt = base_stmt.where(cond)
+            count_stmt = count_stmt.where(cond)
+
+        return base_stmt, count_stmt
+
+    @staticmethod
+    def _filter_conditions(   # noqa: WPS210
+        filters: ItemFilter,
+        search: SearchBackend,
+    ) -> list[Any]:
+        """Условия WHERE по ItemFilter - без JOIN, годятся и для UPDATE/DELETE."""
         conditions: list[Any] = []
 
         filter_pairs = (
@@ -92,7 +629,7 @@ class ItemRepository(BaseCrudRepository[ItemORM]):
                 conditions.append(col == filter_val)
 
         if filters.q:
-            conditions.append(ItemORM.title.ilike(f'%{filters.q}%'))
+            conditions.append(search.condition(filters.q))
 
         if filters.created_from is not None:
             conditions.append(ItemORM.created_at >= filters.created_from)
@@ -102,49 +639,107 @@ class ItemRepository(BaseCrudRepository[ItemORM]):
 
         tag_ids = filters.tag_ids or []
         if tag_ids:
-            base_stmt = base_stmt.join(ItemORM.tags)
-            count_stmt = count_stmt.join(ItemORM.tags)
-            conditions.append(TagORM.id.in_(tag_ids))
-            base_stmt = base_stmt.distinct()
+            conditions.append(_tag_condition(set(tag_ids), filters.tag_mode))
 
-        if conditions:
-            cond = and_(*conditions)
-            base_stmt = base_stmt.where(cond)
-            count_stmt = count_stmt.where(cond)
+        return conditions
 
-        return base_stmt, count_stmt
+    @staticmethod
+    def _sort_expression(filters: ItemFilter, search: SearchBackend) -> Any:
+        if filters.sort_by == 'relevance':
+            if not filters.q:
+                raise ValidationError('sort_by=relevance requires q')
+            return search.rank(filters.q)
+        return SORT_COLUMN_MAP.get(filters.sort_by, ItemORM.created_at)
 
     @staticmethod
     def _apply_sorting(
         stmt: Select,
         filters: ItemFilter,
+        sort_expr: Any,
     ) -> Select:
-        sort_column_map = {
-            'created_at': ItemORM.created_at,
-            'updated_at': ItemORM.updated_at,
-            'priority': ItemORM.priority,
-        }
-
-        sort_by = filters.sort_by or 'created_at'
         sort_dir = filters.sort_dir or 'desc'
 
-        sort_col = sort_column_map.get(sort_by, ItemORM.created_at)
-
+        # id - тай-брейкер: без него порядок при равных значениях
+        # не определен и keyset-курсор может пропускать строки
         if sort_dir == 'asc':
-            return stmt.order_by(sort_col.asc())
-        return stmt.order_by(sort_col.desc())
+            return stmt.order_by(sort_expr.asc(), ItemORM.id.asc())
+        return stmt.order_by(sort_expr.desc(), ItemORM.id.desc())
 
-    @staticmethod
+    @classmethod
     def _apply_pagination_and_options(
+        cls,
         stmt: Select,
         filters: ItemFilter,
+        sort_expr: Any,
     ) -> Select:
-        return (
-            stmt.offset(
-                filters.offset
-            ).limit(
-                filters.limit
-            ).options(
-                joinedload(ItemORM.tags)
+        # +1 строка, чтобы понять, есть ли следующая страница
+        if filters.cursor:
+            stmt = stmt.where(cls._keyset_condition(filters, sort_expr))
+        else:
+            stmt = stmt.offset(filters.offset)
+        return stmt.limit(filters.limit + 1)
+
+    @staticmethod
+    def _keyset_condition(filters: ItemFilter, sort_expr: Any) -> Any:
+        payload = decode_cursor(filters.cursor)
+        if (
+            payload.get('sort_by') != filters.sort_by
+            or payload.get('sort_dir') != filters.sort_dir
+        ):
+            raise ValidationError(
+                'Cursor does not match sort_by/sort_dir of the request'
             )
+
+        try:
+            cursor_id = int(payload['id'])
+            cursor_value = _parse_sort_value(filters.sort_by, payload['value'])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValidationError(INVALID_CURSOR_MSG) from exc
+
+        sort_key = tuple_(sort_expr, ItemORM.id)
+        if filters.sort_dir == 'asc':
+            return sort_key > (cursor_value, cursor_id)
+        return sort_key < (cursor_value, cursor_id)
+
+    @staticmethod
+    def _build_cursor(
+        sort_value: Any,
+        item_id: int,
+        filters: ItemFilter,
+    ) -> str:
+        return encode_cursor({
+            'sort_by': filters.sort_by,
+            'sort_dir': filters.sort_dir,
+            'value': sort_value,
+            'id': item_id,
+        })
+
+
+def _parse_sort_value(sort_by: str, sort_value: Any) -> Any:
+    if sort_by == 'priority':
+        return ItemPriority(sort_value)
+    if sort_by == 'relevance':
+        return float(sort_value)
+    return datetime.fromisoformat(sort_value)
+
+
+def _tag_condition(tag_ids: set[int], tag_mode: str) -> Any:
+    """Условие по тегам только через item_tags, без JOIN с tags и DISTINCT.
+
+    Полусоединение не размножает строки Item (оконный count() считает их
+    верно), а подзапрос читает лишь списки Item выбранных тегов по индексу
+    (tag_id, item_id) - его стоимость не зависит от размера библиотеки.
+    """
+    tagged = select(ItemTagORM.item_id).where(ItemTagORM.tag_id.in_(tag_ids))
+    if tag_mode == 'none':
+        # коррелирует только с items: в facets item_tags есть и снаружи
+        return ~tagged.where(
+            ItemTagORM.item_id == ItemORM.id,
+        ).correlate(ItemORM).exists()
+    if tag_mode == 'all' and len(tag_ids) > 1:
+        # пара (item_id, tag_id) уникальна - count() равен числу
+        # совпавших тегов Item
+        tagged = tagged.group_by(ItemTagORM.item_id).having(
+            func.count() == len(tag_ids),
         )
+    return ItemORM.id.in_(tagged)
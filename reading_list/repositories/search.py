@@ -0,0 +1,113 @@
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Float, column, false, func, literal_column, select, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from reading_list.config import settings
+from reading_list.db.models.item import ItemORM
+from reading_list.db.models.search import FTS_TABLE, SEARCH_VECTOR_COLUMN, TS_CONFIG
+
+WORD_RE = re.compile(r'\w+')
+
+
+class SearchBackend(ABC):
+    """Как превратить ItemFilter.q в условие WHERE и оценку релевантности."""
+
+    @abstractmethod
+    def condition(self, query: str) -> Any:
+        ...
+
+    @abstractmethod
+    def rank(self, query: str) -> Any:
+        """Выражение релевантности: больше - лучше."""
+
+
+class IlikeSearchBackend(SearchBackend):
+    """Запасной вариант без индекса: подстрока в title."""
+
+    def condition(self, query: str) -> Any:
+        return ItemORM.title.ilike(f'%{query}%')
+
+    def rank(self, query: str) -> Any:
+        return literal_column('0', Float)
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector по title/notes (GIN) плюс pg_trgm по title.
+
+    Trigram-ветка сохраняет старую семантику ILIKE по подстроке
+    (`clea` находит `Clean`), но тоже идет через GIN-индекс.
+    """
+
+    search_vector = literal_column(
+        f'items.{SEARCH_VECTOR_COLUMN}', TSVECTOR,
+    )
+
+    def condition(self, query: str) -> Any:
+        return self.search_vector.op('@@')(self._ts_query(query)) | (
+            ItemORM.title.ilike(f'%{query}%')
+        )
+
+    def rank(self, query: str) -> Any:
+        return (
+            func.ts_rank_cd(self.search_vector, self._ts_query(query))
+            + func.similarity(ItemORM.title, query)
+        )
+
+    @staticmethod
+    def _ts_query(query: str) -> Any:
+        # regconfig литералом: VARCHAR-параметр asyncpg не приводит к нему
+        ts_config = literal_column(f"'{TS_CONFIG}'::regconfig")
+        return func.websearch_to_tsquery(ts_config, query)
+
+
+class SqliteFtsSearchBackend(SearchBackend):
+    """FTS5 по внешней таблице items_fts: префиксный поиск по словам."""
+
+    fts = table(FTS_TABLE, column('rowid'))
+    column_weights = (10.0, 1.0)
+
+    def condition(self, query: str) -> Any:
+        match_query = self._match_query(query)
+        if match_query is None:
+            return false()
+        return ItemORM.id.in_(
+            select(self.fts.c.rowid).where(self._match(match_query))
+        )
+
+    def rank(self, query: str) -> Any:
+        match_query = self._match_query(query)
+        if match_query is None:
+            return literal_column('0', Float)
+        # bm25 тем меньше, чем релевантнее; совпадение в title весит
+        # больше, чем в notes - как веса A/B в Postgres-бэкенде
+        bm25 = func.bm25(literal_column(FTS_TABLE), *self.column_weights)
+        return -select(bm25).where(
+            self.fts.c.rowid == ItemORM.id,
+            self._match(match_query),
+        ).scalar_subquery()
+
+    @staticmethod
+    def _match(match_query: str) -> Any:
+        return literal_column(FTS_TABLE).op('MATCH')(match_query)
+
+    @staticmethod
+    def _match_query(query: str) -> str | None:
+        words = WORD_RE.findall(query)
+        if not words:
+            return None
+        return ' '.join(f'"{word}"*' for word in words)
+
+
+@lru_cache
+def get_search_backend(dialect_name: str) -> SearchBackend:
+    if settings.search_backend == 'ilike':
+        return IlikeSearchBackend()
+    if dialect_name == 'postgresql':
+        return PostgresSearchBackend()
+    if dialect_name == 'sqlite':
+        return SqliteFtsSearchBackend()
+    return IlikeSearchBackend()
@@ -0,0 +1,195 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Iterable, Mapping, Sequence
+
+from sqlalchemy import (  # noqa: WPS318, WPS319
+    BigInteger,
+    String,
+    cast,
+    delete,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from reading_list.db.models.item import ItemORM
+from reading_list.db.models.stats import UserItemStatORM
+from reading_list.db.models.tag import ItemTagORM, TagORM
+
+ITEMS_KEY = 'items'
+TAGS_KEY = 'tags'
+DONE_PREFIX = 'done:'
+TAG_PREFIX = 'tag:'
+MONTH_FORMAT = '%Y-%m'
+
+
+def month_of(moment: datetime | None) -> str | None:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        # SQLite отдает наивное время, хранится оно в UTC
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime(MONTH_FORMAT)
+
+
+def item_stat_keys(
+    status: Any,
+    kind: Any,
+    priority: Any,
+    done_month: str | None,
+    tag_ids: Iterable[int] = (),
+) -> list[str]:
+    """Счетчики, в которые входит один Item."""
+    keys = [
+        ITEMS_KEY,
+        f'status:{status}',
+        f'kind:{kind}',
+        f'priority:{priority}',
+        *(tag_key(tag_id) for tag_id in tag_ids),
+    ]
+    if done_month is not None:
+        keys.append(f'{DONE_PREFIX}{done_month}')
+    return keys
+
+
+def tag_key(tag_id: int) -> str:
+    return f'{TAG_PREFIX}{tag_id}'
+
+
+def stat_deltas(
+    before: Iterable[str] = (),
+    after: Iterable[str] = (),
+) -> Counter[str]:
+    deltas = Counter(after)
+    deltas.subtract(before)
+    return deltas
+
+
+def month_column(dialect_name: str, column: Any) -> Any:
+    """YYYY-MM по UTC - как month_of, но в SQL."""
+    if dialect_name == 'postgresql':
+        return func.to_char(func.timezone('UTC', column), 'YYYY-MM')
+    return func.strftime(MONTH_FORMAT, column)
+
+
+class UserItemStatsRepository:
+    """Счетчики user_item_stats: дельты на запись и сверка с источником."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_for_user(self, user_id: int) -> dict[str, int]:
+        stmt = select(UserItemStatORM.name, UserItemStatORM.value).where(
+            UserItemStatORM.user_id == user_id,
+        )
+        return dict((await self.db.execute(stmt)).all())
+
+    async def apply(self, user_id: int, deltas: Mapping[str, int]) -> None:
+        """value += delta для каждого счетчика одним INSERT ... ON CONFLICT.
+
+        Без commit: дельта уходит в транзакции вызвавшей записи.
+        """
+        await self._add([
+            {'user_id': user_id, 'name': name, 'value': delta}
+            for name, delta in sorted(deltas.items()) if delta
+        ])
+
+    async def drop(self, user_id: int, names: Sequence[str]) -> None:
+        await self.db.execute(delete(UserItemStatORM).where(
+            UserItemStatORM.user_id == user_id,
+            UserItemStatORM.name.in_(names),
+        ))
+
+    async def reconcile(self, user_ids: Sequence[int]) -> int:
+        """Пересчитывает счетчики user_ids из items/item_tags/tags.
+
+        Источник и текущие значения сравниваются одним запросом (один
+        снимок), расхождение пишется дельтой через тот же ON CONFLICT,
+        что и apply: дельта записи, закоммиченной после снимка, ляжет
+        поверх и не будет затерта. Лишний счетчик уходит в ноль.
+        Возвращает число поправленных счетчиков.
+        """
+        source = self._source_stmt(user_ids).subquery()
+        combined = union_all(
+            select(source.c.user_id, source.c.name, source.c.value),
+            select(
+                UserItemStatORM.user_id,
+                UserItemStatORM.name,
+                (-UserItemStatORM.value).label('value'),
+            ).where(UserItemStatORM.user_id.in_(user_ids)),
+        ).subquery()
+        drift = cast(func.sum(combined.c.value), BigInteger)
+        stmt = select(
+            combined.c.user_id, combined.c.name, drift.label('drift'),
+        ).group_by(combined.c.user_id, combined.c.name).having(drift != 0)
+        rows = [
+            {'user_id': row.user_id, 'name': row.name, 'value': row.drift}
+            for row in await self.db.execute(stmt)
+        ]
+        await self._add(rows)
+        return len(rows)
+
+    async def _add(self, rows: list[dict[str, Any]]) -> None:
+        """value += value строки; нет строки - она создается."""
+        if not rows:
+            return
+        stmt = self._insert()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserItemStatORM.user_id, UserItemStatORM.name],
+            set_={'value': UserItemStatORM.value + stmt.excluded.value},
+        )
+        await self.db.execute(stmt, rows)
+
+    def _insert(self) -> Any:
+        if self.db.get_bind().dialect.name == 'postgresql':
+            return postgresql.insert(UserItemStatORM)
+        return sqlite.insert(UserItemStatORM)
+
+    def _source_stmt(self, user_ids: Sequence[int]) -> Any:
+        dialect_name = self.db.get_bind().dialect.name
+        own_items = ItemORM.user_id.in_(user_ids)
+        grouped_columns = [
+            select(
+                ItemORM.user_id,
+                (literal(f'{name}:') + cast(column, String)).label('name'),
+                func.count().label('value'),
+            ).where(own_items).group_by(ItemORM.user_id, column)
+            for name, column in (
+                ('status', ItemORM.status),
+                ('kind', ItemORM.kind),
+                ('priority', ItemORM.priority),
+            )
+        ]
+        done_month = month_column(dialect_name, ItemORM.done_at)
+        return union_all(
+            select(
+                ItemORM.user_id,
+                literal(ITEMS_KEY).label('name'),
+                func.count().label('value'),
+            ).where(own_items).group_by(ItemORM.user_id),
+            *grouped_columns,
+            select(
+                ItemORM.user_id,
+                (literal(DONE_PREFIX) + done_month).label('name'),
+                func.count().label('value'),
+            ).where(
+                own_items, ItemORM.done_at.is_not(None),
+            ).group_by(ItemORM.user_id, done_month),
+            select(
+                ItemORM.user_id,
+                (literal(TAG_PREFIX) + cast(ItemTagORM.tag_id, String)).label(
+                    'name',
+                ),
+                func.count().label('value'),
+            ).join(
+                ItemORM, ItemORM.id == ItemTagORM.item_id,
+            ).where(own_items).group_by(ItemORM.user_id, ItemTagORM.tag_id),
+            select(
+                TagORM.user_id,
+                literal(TAGS_KEY).label('name'),
+                func.count().label('value'),
+            ).where(TagORM.user_id.in_(user_ids)).group_by(TagORM.user_id),
+        )
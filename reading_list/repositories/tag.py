@@ -1,8 +1,10 @@
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
 
-from reading_list.db.models.tag import TagORM
+from reading_list.db.models.base import utcnow
+from reading_list.db.models.item import ItemORM
+from reading_list.db.models.tag import ItemTagORM, TagORM
 from reading_list.repositories.base_crud import BaseCrudRepository
 
 
@@ -13,14 +15,15 @@ class TagRepository(BaseCrudRepository[TagORM]):
         res = await self.db.execute(stmt)
         return res.scalar_one_or_none()
 
-    async def get_for_user(self, user_id: int) -> Sequence[TagORM]:
+    async def get_for_user(self, user_id: int) -> Sequence[Row]:
+        """Теги пользователя Core-строками (id, user_id, name), без TagORM."""
         stmt = (
-            select(TagORM).where(
+            select(TagORM.id, TagORM.user_id, TagORM.name).where(
                 TagORM.user_id == user_id
             ).order_by(TagORM.name.asc())
         )
         res = await self.db.execute(stmt)
-        return list(res.scalars().all())
+        return list(res.all())
 
     async def get_by_name_for_user(
         self, user_id: int, name: str
@@ -31,3 +34,14 @@ class TagRepository(BaseCrudRepository[TagORM]):
         )
         res = await self.db.execute(stmt)
         return res.scalar_one_or_none()
+
+    async def touch_tagged_items(self, tag_id: int) -> None:
+        """Сдвигает updated_at у Item с тегом: их tag_ids вот-вот изменятся."""
+        stmt = update(ItemORM).where(
+            ItemORM.id.in_(
+                select(ItemTagORM.item_id).where(ItemTagORM.tag_id == tag_id),
+            ),
+        ).values(updated_at=utcnow()).execution_options(
+            synchronize_session=False,
+        )
+        await self.db.execute(stmt)
@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from reading_list.api.schemas.item import ItemOut
+from reading_list.api.schemas.item_filter import ExportFormat
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+CSV_FIELDS = tuple(ItemOut.model_fields)
+# сколько строк склеивать в один chunk ответа
+ROWS_PER_CHUNK = 500
+
+
+async def encode_items(
+    items: AsyncIterator[ItemOut],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    encode_chunk = _encode_csv if export_format == 'csv' else _encode_ndjson
+    if export_format == 'csv':
+        yield _encode_csv([], with_header=True)
+
+    chunk: list[ItemOut] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield encode_chunk(chunk)
+            chunk = []
+    if chunk:
+        yield encode_chunk(chunk)
+
+
+def _encode_ndjson(chunk: list[ItemOut]) -> bytes:
+    return ''.join(
+        json.dumps(item.model_dump(mode='json'), ensure_ascii=False) + '\n'
+        for item in chunk
+    ).encode()
+
+
+def _encode_csv(chunk: list[ItemOut], with_header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if with_header:
+        writer.writerow(CSV_FIELDS)
+    for item in chunk:
+        row = item.model_dump(mode='json')
+        # id тегов одной ячейкой через пробел
+        row['tag_ids'] = ' '.join(str(tag_id) for tag_id in item.tag_ids)
+        writer.writerow(row[name] for name in CSV_FIELDS)
+    return buffer.getvalue().encode()
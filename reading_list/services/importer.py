@@ -0,0 +1,158 @@
+"""Инкрементальный разбор тела импорта Item: NDJSON и CSV.
+
+Тело читается кусками и никогда не собирается целиком; на выходе -
+(номер строки, запись) либо (номер строки, None, причина ошибки).
+Строка длиннее import_max_line_bytes не буферизуется: она попадает
+в отчет ошибкой, а ее остаток до перевода строки отбрасывается.
+"""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator
+
+from reading_list.api.schemas.item_filter import ExportFormat
+from reading_list.config import settings
+
+ImportRecord = tuple[int, dict[str, Any] | None, str | None]
+# (номер, строка, ошибка): строки нет, если ее не удалось прочитать
+ImportLine = tuple[int, str | None, str | None]
+INVALID_UTF8_MSG = 'Invalid UTF-8'
+LINE_TOO_LONG_MSG = 'Line longer than {0} bytes'
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes],
+    import_format: ExportFormat,
+) -> AsyncIterator[ImportRecord]:
+    lines = _iter_lines(chunks, settings.import_max_line_bytes)
+    if import_format == 'csv':
+        records = _iter_csv_records(lines)
+    else:
+        records = _iter_ndjson_records(lines)
+    async for record in records:
+        yield record
+
+
+async def _iter_lines(  # noqa: WPS231
+    chunks: AsyncIterator[bytes],
+    max_line_bytes: int,
+) -> AsyncIterator[ImportLine]:
+    """Строки тела; буфер - только текущая строка, не больше max_line_bytes."""
+    # b'\n' не встречается внутри многобайтовых символов UTF-8,
+    # поэтому резать байты по нему безопасно до декодирования
+    buffer = bytearray()
+    line_no = 0
+    # текущая строка уже в отчете как слишком длинная - ждем ее конца
+    overflow = False
+    async for chunk in chunks:
+        view = memoryview(chunk)
+        start = 0
+        newline = chunk.find(b'\n')
+        while newline >= 0:
+            line_no += 1
+            if overflow:
+                overflow = False
+            else:
+                buffer += view[start:newline]
+                yield (line_no, *_decode(buffer, max_line_bytes))
+            buffer.clear()
+            start = newline + 1
+            newline = chunk.find(b'\n', start)
+        if overflow:
+            continue
+        buffer += view[start:]
+        if len(buffer) > max_line_bytes:
+            overflow = True
+            buffer.clear()
+            yield line_no + 1, None, LINE_TOO_LONG_MSG.format(max_line_bytes)
+    if buffer:
+        yield (line_no + 1, *_decode(buffer, max_line_bytes))
+
+
+def _decode(
+    raw_line: bytearray,
+    max_line_bytes: int,
+) -> tuple[str | None, str | None]:
+    if len(raw_line) > max_line_bytes:
+        return None, LINE_TOO_LONG_MSG.format(max_line_bytes)
+    try:
+        return raw_line.decode().rstrip('\r'), None
+    except UnicodeDecodeError:
+        return None, INVALID_UTF8_MSG
+
+
+async def _iter_ndjson_records(
+    lines: AsyncIterator[ImportLine],
+) -> AsyncIterator[ImportRecord]:
+    async for line_no, line, error in lines:
+        if line is None:
+            yield line_no, None, error
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_no, None, f'Invalid JSON: {exc}'
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, 'Expected a JSON object'
+            continue
+        yield line_no, record, None
+
+
+async def _iter_csv_records(  # noqa: WPS210, WPS231
+    lines: AsyncIterator[ImportLine],
+) -> AsyncIterator[ImportRecord]:
+    max_record_size = settings.import_max_line_bytes
+    header: list[str] | None = None
+    pending: list[str] = []
+    pending_size = 0
+    quotes = 0
+    # запись длиннее лимита уже в отчете: ее строки до закрывающей
+    # кавычки считаются, но не копятся
+    skipping = False
+    start_line = 0
+    async for line_no, line, error in lines:
+        if not pending and not skipping:
+            start_line = line_no
+        if line is None:
+            # битая строка портит и запись, которую она продолжала
+            if not skipping:
+                yield start_line, None, error
+            pending, pending_size, quotes, skipping = [], 0, 0, False
+            continue
+        quotes += line.count('"')
+        if not skipping:
+            pending.append(line)
+            pending_size += len(line)
+            if pending_size > max_record_size:
+                yield start_line, None, LINE_TOO_LONG_MSG.format(
+                    max_record_size,
+                )
+                pending, pending_size, skipping = [], 0, True
+        # нечетное число кавычек - поле с переводом строки еще не закрыто
+        if quotes % 2:
+            continue
+        quotes = 0
+        if skipping:
+            skipping = False
+            continue
+        cells = next(csv.reader(io.StringIO('\n'.join(pending))), [])
+        pending, pending_size = [], 0
+        if header is None:
+            header = cells
+        elif any(cells):
+            yield start_line, _csv_record(header, cells), None
+    if pending:
+        yield start_line, None, 'Unterminated quoted field'
+
+
+def _csv_record(header: list[str], cells: list[str]) -> dict[str, Any]:
+    # пустая ячейка - значение по умолчанию, как у отсутствующего ключа
+    record: dict[str, Any] = {
+        name: cell for name, cell in zip(header, cells) if cell != ''
+    }
+    if 'tag_ids' in record:
+        record['tag_ids'] = record['tag_ids'].split()
+    return record
@@ -1,10 +1,84 @@
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import (  # noqa: WPS318, WPS319
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Iterable,
+    TypeVar,
+)
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncResult
+
 from reading_list.api.schemas.common import PageMeta
-from reading_list.api.schemas.item import ItemCreate, ItemOut, ItemPage, ItemUpdate
-from reading_list.api.schemas.item_filter import ItemFilter
-from reading_list.db.models.item import ItemORM
-from reading_list.repositories.item import ItemRepository
+from reading_list.api.schemas.item import (  # noqa: WPS318, WPS319
+    ITEM_FIELDS,
+    ItemBatchOut,
+    ItemBatchResult,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemFacets,
+    ItemFieldsOut,
+    ItemFieldsPage,
+    ItemImportOut,
+    ItemOut,
+    ItemUpdate,
+)
+from reading_list.api.schemas.item_filter import (  # noqa: WPS318, WPS319
+    ExportFormat,
+    ItemExportFilter,
+    ItemFilter,
+)
+from reading_list.db.models.base import utcnow
+from reading_list.db.models.item import (  # noqa: WPS318, WPS319
+    ItemKind,
+    ItemORM,
+    ItemPriority,
+    ItemStatus,
+)
+from reading_list.repositories.item import (  # noqa: WPS318, WPS319
+    TAG_IDS_COLUMN,
+    ItemRepository,
+    bulk_done_at,
+    parse_tag_ids,
+)
+from reading_list.repositories.stats import (  # noqa: WPS318, WPS319
+    UserItemStatsRepository,
+    item_stat_keys,
+    month_of,
+    stat_deltas,
+    tag_key,
+)
+from reading_list.repositories.tag import TagRepository
 from reading_list.services.abstract_crud import AbstractCrudService
+from reading_list.services.export import encode_items
+from reading_list.services.importer import iter_records
+from reading_list.services.tag import get_user_tags, user_tags_cache
 from reading_list.utils.errors import EntityNotFoundError, ValidationError
+from reading_list.utils.timing import serialize_timed
+
+logger = logging.getLogger(__name__)
+
+TResult = TypeVar('TResult')
+
+IMPORT_BATCH_SIZE = 1000
+
+# поля ItemFilter, которые сужают выборку (а не листают ее)
+BULK_FILTER_FIELDS = (
+    'status',
+    'kind',
+    'priority',
+    'tag_ids',
+    'q',
+    'created_from',
+    'created_to',
+)
 
 
 class ItemsService(
@@ -12,83 +86,211 @@ class ItemsService(
 ):
     def __init__(self, repo: ItemRepository, user_id: int):
         self.repo = repo
+        self.tag_repo = TagRepository(repo.db)
+        self.stats_repo = UserItemStatsRepository(repo.db)
         self.user_id = user_id
         self.not_found_msg = 'Item not found'
 
     async def get_by_id(self, obj_id: int) -> ItemOut:
-        db_item = await self.repo.get_item_for_user(
-            item_id=obj_id,
-            user_id=self.user_id,
-            with_tags=True,
-        )
-        if db_item is None:
+        row = await self.repo.get_item_row(obj_id, self.user_id)
+        if row is None:
             raise EntityNotFoundError(self.not_found_msg)
-        return self._to_item_out(db_item)
+        return self._to_item_out(row, parse_tag_ids(row.tag_ids))
+
+    async def get_item_fields(
+        self,
+        obj_id: int,
+        fields: Collection[str] = ITEM_FIELDS,
+    ) -> ItemFieldsOut:
+        """Item только с полями fields; остальные в SQL не выбираются."""
+        row = await self.repo.get_item_row(obj_id, self.user_id, fields)
+        if row is None:
+            raise EntityNotFoundError(self.not_found_msg)
+        tag_ids = []
+        if TAG_IDS_COLUMN in fields:
+            tag_ids = parse_tag_ids(row.tag_ids)
+        return self._to_fields_out(row, tag_ids, fields)
+
+    async def fingerprint(self) -> tuple[Any, ...]:
+        """Меняется при любой записи в Item пользователя (для ETag)."""
+        return (self.user_id, *await self.repo.get_fingerprint(self.user_id))
 
-    async def get(self, filters: ItemFilter | None = None) -> ItemPage:
+    async def facets_fingerprint(self) -> tuple[Any, ...]:
+        """fingerprint плюс теги: новый тег - новая строка с нулем в facets."""
+        user_tags = await get_user_tags(self.tag_repo, self.user_id)
+        return (*await self.fingerprint(), user_tags.etag)
+
+    async def item_version(self, obj_id: int) -> datetime | None:
+        return await self.repo.get_item_version(obj_id, self.user_id)
+
+    async def get(
+        self,
+        filters: ItemFilter | None = None,
+        fields: Collection[str] = ITEM_FIELDS,
+    ) -> ItemFieldsPage:
         filters = filters or ItemFilter()
-        db_items, total = await self.repo.get_with_filters(
+        listing = await self.repo.get_with_filters(
             user_id=self.user_id,
             filters=filters,
+            fields=fields,
         )
-        return ItemPage(
-            items_list=[self._to_item_out(db_item) for db_item in db_items],
+        return ItemFieldsPage(
+            items_list=[
+                self._to_fields_out(
+                    row, listing.tag_ids.get(row.id, []), fields,
+                )
+                for row in listing.items
+            ],
             meta=PageMeta(
-                total=total,
+                total=listing.total,
                 limit=filters.limit,
                 offset=filters.offset,
+                has_more=listing.has_more,
+                next_cursor=listing.next_cursor,
             ),
         )
 
-    async def create(self, payload: ItemCreate) -> ItemOut:
-        item_for_db = ItemORM(
-            user_id=self.user_id,
-            title=payload.title,
-            kind=payload.kind,
-            status=payload.status,
-            priority=payload.priority,
-            notes=payload.notes,
+    async def facets(self, filters: ItemFilter) -> ItemFacets:
+        """Счетчики для фильтров; значения без Item - с нулем."""
+        counts = await self.repo.get_facets(self.user_id, filters)
+        user_tags = await get_user_tags(self.tag_repo, self.user_id)
+        return ItemFacets(
+            total=sum(counts['status'].values()),
+            status=_zero_filled(counts['status'], ItemStatus),
+            kind=_zero_filled(counts['kind'], ItemKind),
+            priority=_zero_filled(counts['priority'], ItemPriority),
+            tag_ids=_zero_filled(
+                counts[TAG_IDS_COLUMN],
+                sorted(user_tags.ids.union(counts[TAG_IDS_COLUMN])),
+            ),
         )
 
-        await self._apply_tags_by_ids(item_for_db, payload.tag_ids)
+    async def export(self, filters: ItemExportFilter) -> AsyncIterator[bytes]:
+        """Поток байтов со всеми Item под фильтром в постоянной памяти.
 
-        await self.repo.add(item_for_db)
-        await self.repo.commit()
-        await self.repo.refresh(item_for_db, attribute_names=['tags'])
+        Запрос выполняется сразу, чтобы ошибки фильтра вернулись обычным
+        ответом, а не оборвали уже начатый поток.
+        """
+        rows = await self.repo.stream_with_filters(self.user_id, filters)
+        return encode_items(self._iter_items(rows), filters.format)
 
-        return self._to_item_out(item_for_db)
+    async def create(self, payload: ItemCreate) -> ItemOut:
+        return await self._retry_stale_tags(lambda: self._create(payload))
 
-    async def update(self, obj_id: int, payload: ItemUpdate) -> ItemOut:
-        db_item = await self.repo.get_item_for_user(
-            item_id=obj_id,
-            user_id=self.user_id,
-            with_tags=True,
+    async def create_many(self, payloads: list[ItemCreate]) -> ItemBatchOut:
+        """Пакетное создание: одна проверка тегов, один INSERT, один commit.
+
+        Item с чужими или несуществующими тегами не создается, но и не
+        мешает остальным - причина возвращается в его результате.
+        """
+        return await self._retry_stale_tags(
+            lambda: self._create_many(payloads),
         )
-        if db_item is None:
-            raise EntityNotFoundError(self.not_found_msg)
 
-        payload_dict = payload.model_dump(exclude_unset=True)
-        tag_ids = payload_dict.pop('tag_ids', None)
+    async def import_items(
+        self,
+        chunks: AsyncIterator[bytes],
+        import_format: ExportFormat,
+    ) -> ItemImportOut:
+        """Импорт из потока NDJSON/CSV пачками по IMPORT_BATCH_SIZE.
 
-        for field, field_val in payload_dict.items():
-            setattr(db_item, field, field_val)
+        Каждая пачка - отдельная транзакция: при обрыве уже загруженное
+        остается. Невалидные строки пропускаются и попадают в отчет.
+        """
+        report = ItemImportOut()
+        batch: list[tuple[int, ItemCreate]] = []
+        async for line_no, record, error in iter_records(chunks, import_format):
+            report.processed += 1
+            if record is not None:
+                try:
+                    batch.append((line_no, ItemCreate.model_validate(record)))
+                except PydanticValidationError as exc:
+                    error = _format_validation_error(exc)
+            if error is not None:
+                report.add_error(line_no, error)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await self._import_batch(batch, report)
+                batch = []
+        if batch:
+            await self._import_batch(batch, report)
+        return report
+
+    async def update_many(
+        self,
+        filters: ItemFilter,
+        payload: ItemBulkUpdate,
+    ) -> int:
+        """Обновляет все Item пользователя под фильтром одним UPDATE.
 
-        await self._apply_tags_by_ids(db_item, tag_ids)
+        Пагинация и сортировка из filters не учитываются. Строки
+        блокируются до UPDATE, дельты user_item_stats считаются по их
+        группам.
+        """
+        values = payload.model_dump(exclude_unset=True)
+        if not values:
+            raise ValidationError('Nothing to update')
+        item_ids = await self.repo.lock_ids(self.user_id, filters)
+        if not item_ids:
+            return 0
+        groups, _ = await self.repo.get_stat_groups(self.user_id, item_ids)
+        done_at = datetime.now(timezone.utc)
+        if values.get('status') is not None:
+            values['done_at'] = bulk_done_at(values['status'], done_at)
+        affected = await self.repo.update_by_ids(
+            self.user_id, item_ids, values,
+        )
+        deltas: Counter[str] = Counter()
+        for group in groups:
+            after = _bulk_updated_keys(group, values, month_of(done_at))
+            for stat_name, delta in stat_deltas(
+                item_stat_keys(*group[:4]), after,
+            ).items():
+                deltas[stat_name] += delta * group.count
+        await self.stats_repo.apply(self.user_id, deltas)
+        await self.repo.commit()
+        return affected
 
+    async def delete_many(self, filters: ItemFilter) -> int:
+        """Удаляет все Item пользователя под фильтром одним DELETE."""
+        if not any(
+            getattr(filters, field) for field in BULK_FILTER_FIELDS
+        ):
+            raise ValidationError('Bulk delete requires at least one filter')
+        item_ids = await self.repo.lock_ids(self.user_id, filters)
+        if not item_ids:
+            return 0
+        groups, tag_counts = await self.repo.get_stat_groups(
+            self.user_id, item_ids,
+        )
+        affected = await self.repo.delete_by_ids(self.user_id, item_ids)
+        deltas: Counter[str] = Counter()
+        for group in groups:
+            for stat_name in item_stat_keys(*group[:4]):
+                deltas[stat_name] -= group.count
+        for tag_id, tag_count in tag_counts.items():
+            deltas[tag_key(tag_id)] -= tag_count
+        await self.stats_repo.apply(self.user_id, deltas)
         await self.repo.commit()
-        await self.repo.refresh(db_item, attribute_names=['tags'])
+        return affected
 
-        return self._to_item_out(db_item)
+    async def update(self, obj_id: int, payload: ItemUpdate) -> ItemOut:
+        return await self._retry_stale_tags(
+            lambda: self._update(obj_id, payload),
+        )
 
     async def delete(self, obj_id: int) -> int:
-        db_item = await self.repo.get_item_for_user(
+        found = await self.repo.get_item_with_tag_ids(
             item_id=obj_id,
             user_id=self.user_id,
+            for_update=True,
         )
-        if db_item is None:
+        if found is None:
             raise EntityNotFoundError(self.not_found_msg)
+        db_item, tag_ids = found
+        deltas = stat_deltas(before=_stat_keys(db_item, tag_ids))
 
         await self.repo.delete(db_item)
+        await self.stats_repo.apply(self.user_id, deltas)
         await self.repo.commit()
         return obj_id
 
@@ -97,52 +299,253 @@ class ItemsService(
         obj_id: int,
         tag_ids: list[int],
     ) -> ItemOut:
-        db_item = await self.repo.get_item_for_user(
+        found = await self.repo.get_item_with_tag_ids(
             item_id=obj_id,
             user_id=self.user_id,
-            with_tags=True,
+            for_update=True,
         )
-        if db_item is None:
+        if found is None:
             raise EntityNotFoundError(self.not_found_msg)
+        db_item, current_tag_ids = found
 
-        if not tag_ids:
-            return self._to_item_out(db_item)
+        ids_to_remove = set(tag_ids).intersection(current_tag_ids)
+        if not ids_to_remove:
+            return self._to_item_out(db_item, current_tag_ids)
 
-        ids_to_remove = set(tag_ids)
-        db_item.tags = [
-            tag for tag in db_item.tags
-            if tag.id not in ids_to_remove
-        ]
+        await self.repo.remove_item_tags(db_item.id, list(ids_to_remove))
+        db_item.updated_at = utcnow()
+        await self.stats_repo.apply(self.user_id, stat_deltas(
+            before=[tag_key(tag_id) for tag_id in ids_to_remove],
+        ))
+        await self.repo.commit()
 
+        return self._to_item_out(db_item, [
+            tag_id for tag_id in current_tag_ids
+            if tag_id not in ids_to_remove
+        ])
+
+    async def _create(self, payload: ItemCreate) -> ItemOut:
+        tag_ids = list(dict.fromkeys(payload.tag_ids or []))
+        missing = await self._missing_tag_ids(tag_ids)
+        if missing:
+            raise _missing_tags_error(missing)
+
+        item_for_db = ItemORM(**self._item_values(payload))
+        await self.repo.add(item_for_db)
+        await self.repo.add_item_tags([
+            {'item_id': item_for_db.id, 'tag_id': tag_id} for tag_id in tag_ids
+        ])
+        await self.stats_repo.apply(self.user_id, stat_deltas(
+            after=_stat_keys(item_for_db, tag_ids),
+        ))
         await self.repo.commit()
-        await self.repo.refresh(db_item, attribute_names=['tags'])
 
-        return self._to_item_out(db_item)
+        return self._to_item_out(item_for_db, sorted(tag_ids))
 
-    async def _apply_tags_by_ids(
+    async def _create_many(
         self,
-        db_item: ItemORM,
-        tag_ids: list[int] | None,
-    ) -> None:
-        if tag_ids is None:
-            return
+        payloads: list[ItemCreate],
+    ) -> ItemBatchOut:
+        missing_tag_ids = await self._missing_tag_ids([
+            tag_id for payload in payloads for tag_id in payload.tag_ids or []
+        ])
 
-        if not tag_ids:
-            db_item.tags = []
-            return
+        results: list[ItemBatchResult] = []
+        accepted: list[tuple[int, ItemCreate]] = []
+        for index, payload in enumerate(payloads):
+            missing = missing_tag_ids.intersection(payload.tag_ids or [])
+            if missing:
+                results.append(ItemBatchResult(
+                    index=index, error=str(_missing_tags_error(missing)),
+                ))
+            else:
+                accepted.append((index, payload))
+
+        rows = [self._item_values(payload) for _, payload in accepted]
+        tag_ids_per_item = [
+            list(dict.fromkeys(payload.tag_ids or [])) for _, payload in accepted
+        ]
+        db_items = await self.repo.insert_many(rows)
+        await self.repo.add_item_tags([
+            {'item_id': db_item.id, 'tag_id': tag_id}
+            for db_item, item_tag_ids in zip(db_items, tag_ids_per_item)
+            for tag_id in item_tag_ids
+        ])
+        await self.stats_repo.apply(
+            self.user_id, _created_deltas(rows, tag_ids_per_item),
+        )
+        await self.repo.commit()
+
+        for db_item, (index, payload) in zip(db_items, accepted):
+            tag_ids = sorted(set(payload.tag_ids or []))
+            results.append(ItemBatchResult(
+                index=index, item=self._to_item_out(db_item, tag_ids),
+            ))
+        results.sort(key=lambda batch_result: batch_result.index)
+        return ItemBatchOut(
+            created=len(db_items),
+            failed=len(payloads) - len(db_items),
+            results=results,
+        )
+
+    async def _update(self, obj_id: int, payload: ItemUpdate) -> ItemOut:
+        found = await self.repo.get_item_with_tag_ids(
+            item_id=obj_id,
+            user_id=self.user_id,
+            for_update=True,
+        )
+        if found is None:
+            raise EntityNotFoundError(self.not_found_msg)
+        db_item, current_tag_ids = found
+        stats_before = _stat_keys(db_item, current_tag_ids)
+
+        payload_dict = payload.model_dump(exclude_unset=True)
+        tag_ids = payload_dict.pop('tag_ids', None)
 
-        tags = await self.repo.get_tags_for_user_by_ids(self.user_id, tag_ids)
-        found_ids = {tag.id for tag in tags}
-        missing = set(tag_ids) - found_ids
+        new_status = payload_dict.get('status')
+        if new_status is not None and new_status != db_item.status:
+            payload_dict['done_at'] = _done_at(new_status)
+        for field, field_val in payload_dict.items():
+            setattr(db_item, field, field_val)
+
+        if tag_ids is not None:
+            tag_ids = list(dict.fromkeys(tag_ids))
+            missing = await self._missing_tag_ids(tag_ids)
+            if missing:
+                raise _missing_tags_error(missing)
+            await self.repo.replace_item_tags(db_item.id, tag_ids)
+            current_tag_ids = sorted(tag_ids)
+            # связи живут в item_tags; без этого смена одних тегов
+            # не изменила бы ни Item, ни его ETag
+            db_item.updated_at = utcnow()
+
+        await self.stats_repo.apply(self.user_id, stat_deltas(
+            stats_before, _stat_keys(db_item, current_tag_ids),
+        ))
+        await self.repo.commit()
+
+        return self._to_item_out(db_item, current_tag_ids)
+
+    async def _missing_tag_ids(self, tag_ids: list[int]) -> set[int]:
+        """Какие из tag_ids не принадлежат пользователю.
+
+        Проверка идет по user_tags_cache; БД читается только при промахе
+        кэша или если какого-то id в кэше нет. Тег, удаленный в другом
+        процессе, кэш еще считает своим - его отсекает FK item_tags
+        (см. _retry_stale_tags).
+        """
+        if not tag_ids:
+            return set()
+        user_tags = await get_user_tags(self.tag_repo, self.user_id)
+        missing = set(tag_ids) - user_tags.ids
         if missing:
-            raise ValidationError(
-                f'Tags not found or do not belong to user: {sorted(missing)}'
+            user_tags = await get_user_tags(
+                self.tag_repo, self.user_id, refresh=True,
             )
+            missing -= user_tags.ids
+        return missing
+
+    async def _retry_stale_tags(
+        self,
+        write: Callable[[], Awaitable[TResult]],
+    ) -> TResult:
+        """write(), а при IntegrityError - откат и вторая попытка.
+
+        Связь item_tags с тегом, удаленным в другом процессе, падает
+        на FK. После сброса user_tags_cache проверка тегов во второй
+        попытке видит свежий набор и отвечает обычной ошибкой 400.
+        """
+        try:
+            return await write()
+        except IntegrityError:
+            await self.repo.rollback()
+            user_tags_cache.invalidate(self.user_id)
+            return await write()
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, ItemCreate]],
+        report: ItemImportOut,
+    ) -> None:
+        errors, imported = await self._retry_stale_tags(
+            lambda: self._load_batch(batch),
+        )
+        for line_no, error in errors:
+            report.add_error(line_no, error)
+        report.imported += imported
+        report.batches += 1
+        logger.info(
+            'Item import: user %s, batch %s, %s imported, %s failed',
+            self.user_id, report.batches, report.imported, report.failed,
+        )
+
+    async def _load_batch(
+        self,
+        batch: list[tuple[int, ItemCreate]],
+    ) -> tuple[list[tuple[int, str]], int]:
+        """Одна транзакция импорта: (ошибки по строкам, число загруженных)."""
+        missing_tag_ids = await self._missing_tag_ids([
+            tag_id for _, payload in batch for tag_id in payload.tag_ids or []
+        ])
+
+        errors: list[tuple[int, str]] = []
+        accepted: list[ItemCreate] = []
+        for line_no, payload in batch:
+            missing = missing_tag_ids.intersection(payload.tag_ids or [])
+            if missing:
+                errors.append((line_no, str(_missing_tags_error(missing))))
+            else:
+                accepted.append(payload)
+
+        rows = [self._item_values(payload) for payload in accepted]
+        tag_ids_per_item = [
+            list(dict.fromkeys(payload.tag_ids or [])) for payload in accepted
+        ]
+        item_ids = await self.repo.load_items(rows, tag_ids_per_item)
+        await self.stats_repo.apply(
+            self.user_id, _created_deltas(rows, tag_ids_per_item),
+        )
+        await self.repo.commit()
+        return errors, len(item_ids)
+
+    async def _iter_items(self, rows: AsyncResult) -> AsyncIterator[ItemOut]:
+        async for row in rows:
+            yield self._to_item_out(row, parse_tag_ids(row.tag_ids))
 
-        db_item.tags = list(tags)
+    def _item_values(self, payload: ItemCreate) -> dict[str, Any]:
+        return {
+            'user_id': self.user_id,
+            'title': payload.title,
+            'kind': payload.kind,
+            'status': payload.status,
+            'priority': payload.priority,
+            'notes': payload.notes,
+            'done_at': _done_at(payload.status),
+        }
 
     @staticmethod
-    def _to_item_out(db_item: ItemORM) -> ItemOut:
+    @serialize_timed
+    def _to_fields_out(
+        row: Row,
+        tag_ids: list[int],
+        fields: Collection[str],
+    ) -> ItemFieldsOut:
+        # только выбранные поля: остальные остаются незаданными, и
+        # json_response(exclude_unset=True) их не выводит
+        values = {
+            name: getattr(row, name)
+            for name in fields if name != TAG_IDS_COLUMN
+        }
+        if TAG_IDS_COLUMN in fields:
+            values[TAG_IDS_COLUMN] = tag_ids
+        return ItemFieldsOut.model_validate(values)
+
+    @staticmethod
+    @serialize_timed
+    def _to_item_out(
+        db_item: ItemORM | Row,
+        tag_ids: list[int],
+    ) -> ItemOut:
         return ItemOut(
             id=db_item.id,
             user_id=db_item.user_id,
@@ -153,5 +556,75 @@ class ItemsService(
             notes=db_item.notes,
             created_at=db_item.created_at,
             updated_at=db_item.updated_at,
-            tag_ids=[tag.id for tag in db_item.tags],
+            tag_ids=tag_ids,
         )
+
+
+def _format_validation_error(exc: PydanticValidationError) -> str:
+    return '; '.join(
+        '{0}: {1}'.format(
+            '.'.join(str(part) for part in error['loc']), error['msg'],
+        )
+        for error in exc.errors()
+    )
+
+
+def _missing_tags_error(missing: set[int]) -> ValidationError:
+    return ValidationError(
+        f'Tags not found or do not belong to user: {sorted(missing)}'
+    )
+
+
+def _zero_filled(counts: dict[Any, int], values: Iterable[Any]) -> dict[Any, int]:
+    return {facet_value: counts.get(facet_value, 0) for facet_value in values}
+
+
+def _done_at(item_status: ItemStatus) -> datetime | None:
+    if item_status == ItemStatus.done:
+        return datetime.now(timezone.utc)
+    return None
+
+
+def _stat_keys(db_item: ItemORM, tag_ids: Iterable[int]) -> list[str]:
+    return item_stat_keys(
+        db_item.status,
+        db_item.kind,
+        db_item.priority,
+        month_of(db_item.done_at),
+        tag_ids,
+    )
+
+
+def _created_deltas(
+    rows: list[dict[str, Any]],
+    tag_ids_per_item: list[list[int]],
+) -> Counter[str]:
+    deltas: Counter[str] = Counter()
+    for row, tag_ids in zip(rows, tag_ids_per_item):
+        deltas.update(item_stat_keys(
+            row['status'],
+            row['kind'],
+            row['priority'],
+            month_of(row['done_at']),
+            tag_ids,
+        ))
+    return deltas
+
+
+def _bulk_updated_keys(
+    group: Row,
+    values: dict[str, Any],
+    done_month: str | None,
+) -> list[str]:
+    """Счетчики группы из get_stat_groups после UPDATE с values."""
+    new_status = values.get('status') or group.status
+    if new_status != ItemStatus.done:
+        done_month = None
+    elif group.status == ItemStatus.done:
+        done_month = group.done_month
+    return item_stat_keys(
+        new_status,
+        values.get('kind') or group.kind,
+        values.get('priority') or group.priority,
+        done_month,
+    )
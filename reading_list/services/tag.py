@@ -1,24 +1,95 @@
+from dataclasses import dataclass
+
+from sqlalchemy import Row
+
 from reading_list.api.schemas.tag import TagCreate, TagOut
+from reading_list.config import settings
 from reading_list.db.models.tag import TagORM
+from reading_list.repositories.stats import (  # noqa: WPS318, WPS319
+    TAGS_KEY,
+    UserItemStatsRepository,
+    tag_key,
+)
 from reading_list.repositories.tag import TagRepository
 from reading_list.services.abstract_crud import AbstractCrudService
+from reading_list.utils.cache import TTLCache
 from reading_list.utils.errors import ConflictError, EntityNotFoundError
+from reading_list.utils.etag import make_etag
+from reading_list.utils.metrics import REGISTRY, CallbackMetric
+from reading_list.utils.timing import serialize_timed
+
+
+@dataclass(frozen=True)
+class UserTags:
+    tags: tuple[TagOut, ...]  # в порядке name, как отдает TagService.get
+    ids: frozenset[int]
+    etag: str
+
+
+user_tags_cache: TTLCache[int, UserTags] = TTLCache(
+    maxsize=settings.tag_cache_size,
+    ttl=settings.tag_cache_ttl,
+)
+REGISTRY.register(CallbackMetric(
+    'tag_cache_events_total',
+    'User tag cache lookups and removals by outcome.',
+    lambda: [
+        ((event,), event_count)
+        for event, event_count in user_tags_cache.stats.as_dict().items()
+    ],
+    labelnames=('event',),
+    type_name='counter',
+))
+
+
+async def get_user_tags(
+    repo: TagRepository,
+    user_id: int,
+    *,
+    refresh: bool = False,
+) -> UserTags:
+    """Теги пользователя из user_tags_cache, при промахе - из БД.
+
+    Запись живет tag_cache_ttl или до invalidate из TagService: изменения
+    тегов в другом процессе видны здесь (и в ETag списка) не позже TTL.
+    refresh=True читает БД в обход кэша: тег могли создать в другом
+    процессе, и его инвалидация сюда не дошла.
+    """
+    user_tags = None if refresh else user_tags_cache.get(user_id)
+    if user_tags is None:
+        tags = tuple(
+            TagService.to_tag_out(tag)
+            for tag in await repo.get_for_user(user_id)
+        )
+        user_tags = UserTags(
+            tags=tags,
+            ids=frozenset(tag.id for tag in tags),
+            etag=make_etag(user_id, *((tag.id, tag.name) for tag in tags)),
+        )
+        user_tags_cache.set(user_id, user_tags)
+    return user_tags
 
 
 class TagService(AbstractCrudService[TagCreate, TagCreate, TagOut, None]):
     def __init__(self, repo: TagRepository, user_id: int):
         self.repo = repo
+        self.stats_repo = UserItemStatsRepository(repo.db)
         self.user_id = user_id
 
     async def get_by_id(self, obj_id: int) -> TagOut:
         tag = await self.repo.get_by_id(obj_id)
         if tag is None or tag.user_id != self.user_id:
             raise EntityNotFoundError('Tag not found')
-        return self._to_tag_out(tag)
+        return self.to_tag_out(tag)
+
+    async def get_etag(self) -> str:
+        """ETag списка тегов: считается по тому же кэшу, что и get()."""
+        user_tags = await get_user_tags(self.repo, self.user_id)
+        return user_tags.etag
 
     async def get(self, filters: None = None) -> list[TagOut]:
-        tags = await self.repo.get_for_user(self.user_id)
-        return [self._to_tag_out(tag) for tag in tags]
+        user_tags = await get_user_tags(self.repo, self.user_id)
+        return list(user_tags.tags)
 
     async def create(self, payload: TagCreate) -> TagOut:
         existing = await self.repo.get_by_name_for_user(
@@ -32,9 +103,11 @@ class TagService(AbstractCrudService[TagCreate, TagCreate, TagOut, None]):
             name=payload.name,
         )
         await self.repo.add(tag)
+        await self.stats_repo.apply(self.user_id, {TAGS_KEY: 1})
         await self.repo.commit()
+        user_tags_cache.invalidate(self.user_id)
         await self.repo.refresh(tag)
-        return self._to_tag_out(tag)
+        return self.to_tag_out(tag)
 
     async def update(self, obj_id: int, payload: TagCreate) -> TagOut:
         tag: TagORM = await self.repo.get_by_id(obj_id)
@@ -43,19 +116,26 @@ class TagService(AbstractCrudService[TagCreate, TagCreate, TagOut, None]):
 
         tag.name = payload.name
         await self.repo.commit()
+        user_tags_cache.invalidate(self.user_id)
         await self.repo.refresh(tag)
-        return self._to_tag_out(tag)
+        return self.to_tag_out(tag)
 
     async def delete(self, obj_id: int) -> int:
         tag = await self.repo.get_by_id(obj_id)
         if tag is None or tag.user_id != self.user_id:
             raise EntityNotFoundError('Tag not found')
+        await self.repo.touch_tagged_items(tag.id)
         await self.repo.delete(tag)
+        # связи item_tags уходят по FK CASCADE, с ними и счетчик тега
+        await self.stats_repo.apply(self.user_id, {TAGS_KEY: -1})
+        await self.stats_repo.drop(self.user_id, [tag_key(tag.id)])
         await self.repo.commit()
+        user_tags_cache.invalidate(self.user_id)
         return obj_id
 
     @staticmethod
-    def _to_tag_out(tag: TagORM) -> TagOut:
+    @serialize_timed
+    def to_tag_out(tag: TagORM | Row) -> TagOut:
         return TagOut(
             id=tag.id,
             user_id=tag.user_id,
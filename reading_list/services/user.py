@@ -1,5 +1,22 @@
-from reading_list.api.schemas.user import UserCreate, UserOut, UserUpdate
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from reading_list.api.schemas.user import (  # noqa: WPS318, WPS319
+    UserCreate,
+    UserItemStatsOut,
+    UserOut,
+    UserUpdate,
+)
+from reading_list.db.models.item import ItemKind, ItemPriority, ItemStatus
 from reading_list.db.models.user import UserORM
+from reading_list.repositories.stats import (  # noqa: WPS318, WPS319
+    DONE_PREFIX,
+    ITEMS_KEY,
+    TAG_PREFIX,
+    TAGS_KEY,
+    UserItemStatsRepository,
+    month_of,
+)
 from reading_list.repositories.user import UserRepository
 from reading_list.services.abstract_crud import AbstractCrudService
 from reading_list.utils.errors import ConflictError, EntityNotFoundError
@@ -18,6 +35,15 @@ class UserService(
             raise EntityNotFoundError('User not found')
         return self._to_user_out(user)
 
+    async def get_stats(self, obj_id: int) -> UserItemStatsOut:
+        """Готовые счетчики одним чтением по PK, без агрегатов по items."""
+        stats_repo = UserItemStatsRepository(self.repo.db)
+        counters = await stats_repo.get_for_user(obj_id)
+        # счетчиков нет и у пользователя без Item и тегов
+        if not counters and await self.repo.get_by_id(obj_id) is None:
+            raise EntityNotFoundError('User not found')
+        return self._to_stats_out(obj_id, counters)
+
     async def get(self, filters: None = None) -> list[UserOut]:
         users = await self.repo.get_all()
         return [self._to_user_out(user) for user in users]
@@ -74,3 +100,46 @@ class UserService(
             display_name=user.display_name,
             created_at=user.created_at,
         )
+
+    @staticmethod
+    def _to_stats_out(
+        user_id: int,
+        counters: dict[str, int],
+    ) -> UserItemStatsOut:
+        done_by_month = _prefixed(counters, DONE_PREFIX)
+        return UserItemStatsOut(
+            user_id=user_id,
+            items=counters.get(ITEMS_KEY, 0),
+            tags=counters.get(TAGS_KEY, 0),
+            status=_zero_filled(counters, 'status', ItemStatus),
+            kind=_zero_filled(counters, 'kind', ItemKind),
+            priority=_zero_filled(counters, 'priority', ItemPriority),
+            done_this_month=done_by_month.get(
+                month_of(datetime.now(timezone.utc)), 0,
+            ),
+            done_by_month=done_by_month,
+            items_per_tag={
+                int(tag_id): tag_count
+                for tag_id, tag_count in _prefixed(counters, TAG_PREFIX).items()
+            },
+        )
+
+
+def _prefixed(counters: dict[str, int], prefix: str) -> dict[str, int]:
+    """Ненулевые счетчики с prefix, ключ - остаток имени."""
+    return {
+        name.removeprefix(prefix): stat_value
+        for name, stat_value in sorted(counters.items())
+        if name.startswith(prefix) and stat_value
+    }
+
+
+def _zero_filled(
+    counters: dict[str, int],
+    column: str,
+    values: Iterable[Any],
+) -> dict[Any, int]:
+    return {
+        column_value: counters.get(f'{column}:{column_value}', 0)
+        for column_value in values
+    }
@@ -0,0 +1,25 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from reading_list.utils.errors import ValidationError
+
+INVALID_CURSOR_MSG = 'Invalid cursor'
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """Упаковывает позицию keyset-пагинации в непрозрачную строку."""
+    raw = json.dumps(payload, separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValidationError(INVALID_CURSOR_MSG) from exc
+    if not isinstance(payload, dict):
+        raise ValidationError(INVALID_CURSOR_MSG)
+    return payload
@@ -0,0 +1,23 @@
+"""Слабые ETag из "отпечатков" данных и сравнение с If-None-Match."""
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(
+        repr(parts).encode(), digest_size=16,
+    ).hexdigest()
+    # слабый: совпадение означает те же данные, а не те же байты
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Слабое сравнение по RFC 9110: W/ не учитывается, * - любой."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix('W/')
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == opaque:
+            return True
+    return False
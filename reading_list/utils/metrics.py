@@ -0,0 +1,278 @@
+"""Метрики в памяти процесса и их вывод в текстовом формате Prometheus.
+
+Без внешних зависимостей и блокировок: все пишется из одного event loop.
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterable, Iterator, Sequence, TypeVar
+
+# секунды: от долей миллисекунды до таймаута пула по умолчанию
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+# запросы мимо роутов не размножают серии по сырым путям
+UNMATCHED_ROUTE = 'unmatched'
+
+TChild = TypeVar('TChild')
+TMetric = TypeVar('TMetric', bound='Metric')
+Sample = tuple[str, tuple[str, ...], float]
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами, как у Prometheus (le)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # последний счетчик - значения больше всех границ (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0  # noqa: WPS125
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Пары (le, число наблюдений <= le), последняя - +Inf."""
+        bounds = [*(repr(bound) for bound in self.buckets), '+Inf']
+        running = 0
+        pairs = []
+        for bound, bucket_count in zip(bounds, self.counts):
+            running += bucket_count
+            pairs.append((bound, running))
+        return pairs
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': dict(self.cumulative()),
+        }
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Metric(ABC):
+    """Семейство метрик с одним именем: по значению на набор меток."""
+
+    type_name = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """(суффикс имени, значения меток, значение)."""
+
+    def render(self) -> Iterator[str]:
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} {self.type_name}'
+        for suffix, labelvalues, sample_value in self.samples():
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f'{self.name}{suffix}{labels} {_format_value(sample_value)}'
+
+
+class _LabeledMetric(Metric, Generic[TChild]):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._children: dict[tuple[str, ...], TChild] = {}
+
+    def labels(self, *labelvalues: str) -> TChild:
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f'{self.name} expects {self.labelnames}')
+            child = self._new_child()
+            self._children[labelvalues] = child
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> TChild:
+        ...
+
+
+class CounterMetric(_LabeledMetric[Counter]):
+    """Имя задается целиком, с _total: формат 0.0.4 не добавляет суффикс."""
+
+    type_name = 'counter'
+
+    def samples(self) -> Iterable[Sample]:
+        for labelvalues, child in self._children.items():
+            yield '', labelvalues, child.value
+
+    def _new_child(self) -> Counter:
+        return Counter()
+
+
+class HistogramMetric(_LabeledMetric[Histogram]):
+    type_name = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bucket_bounds = tuple(buckets)
+
+    def samples(self) -> Iterable[Sample]:
+        for labelvalues, child in self._children.items():
+            for bound, bucket_count in child.cumulative():
+                yield '_bucket', (*labelvalues, bound), bucket_count
+            yield '_sum', labelvalues, child.sum
+            yield '_count', labelvalues, child.count
+
+    def _new_child(self) -> Histogram:
+        return Histogram(self.bucket_bounds)
+
+
+class CallbackMetric(Metric):
+    """Значения снимаются в момент выдачи: размер пула, кэша и т.п."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        labelnames: Sequence[str] = (),
+        type_name: str = 'gauge',
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self._collect = collect
+
+    def samples(self) -> Iterable[Sample]:
+        for labelvalues, sample_value in self._collect():
+            yield '', labelvalues, sample_value
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: TMetric) -> TMetric:
+        if metric.name in self._metrics:
+            raise ValueError(f'Metric {metric.name} is already registered')
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        *labelnames: str,
+    ) -> CounterMetric:
+        return self.register(CounterMetric(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        *labelnames: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> HistogramMetric:
+        return self.register(
+            HistogramMetric(name, documentation, labelnames, buckets),
+        )
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+@dataclass
+class RequestStats:
+    """Счетчики текущего запроса; БД пишут хуки engine.
+
+    Разбивка orm/serialize (utils.timing) считается, только если
+    detailed - ее запросили для заголовка Server-Timing.
+    """
+
+    scope: dict[str, Any] = field(default_factory=dict, repr=False)
+    # id(роут) -> полный шаблон с префиксами include_router
+    templates: dict[int, str] = field(default_factory=dict, repr=False)
+    queries: int = 0
+    db_seconds: float = 0
+    detailed: bool = False
+    orm_seconds: float = 0
+    serialize_seconds: float = 0
+    orm_depth: int = 0
+
+    @property
+    def route(self) -> str:
+        """Шаблон роута; известен, как только роутер сопоставил путь."""
+        return route_template(self.scope, self.templates)
+
+
+# изменяемый объект, а не значение: greenlet SQLAlchemy видит копию
+# контекста, и присваивание из него до middleware не дошло бы
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    'request_stats', default=None,
+)
+
+REGISTRY = Registry()
+
+
+def route_template(
+    scope: dict[str, Any],
+    templates: dict[int, str] | None = None,
+) -> str:
+    # scope['route'] - исходный роут, его path_format без префиксов
+    # include_router; полный шаблон берется из templates
+    route = scope.get('route')
+    path_format = getattr(route, 'path_format', None)
+    if path_format is None:
+        return UNMATCHED_ROUTE
+    if templates:
+        path_format = templates.get(id(route), path_format)
+    return scope.get('root_path', '') + path_format
+
+
+def _format_labels(
+    labelnames: tuple[str, ...],
+    labelvalues: tuple[str, ...],
+) -> str:
+    if len(labelvalues) > len(labelnames):
+        # у _bucket гистограммы на одну метку больше - le
+        labelnames = (*labelnames, 'le')
+    if not labelnames:
+        return ''
+    pairs = ','.join(
+        f'{name}="{_escape(str(label_value))}"'
+        for name, label_value in zip(labelnames, labelvalues)
+    )
+    return f'{{{pairs}}}'
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', r'\\').replace(
+        '"', r'\"',
+    ).replace('\n', r'\n')
+
+
+def _format_value(sample_value: float) -> str:
+    if sample_value == int(sample_value):
+        return str(int(sample_value))
+    return repr(sample_value)
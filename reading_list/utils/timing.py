@@ -0,0 +1,65 @@
+"""Таймеры разбивки запроса для Server-Timing: orm и serialize."""
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+from reading_list.utils.metrics import RequestStats, request_stats
+
+TFunc = TypeVar('TFunc', bound=Callable[..., Any])
+
+
+def orm_timed(method: Callable[..., Awaitable[Any]]) -> Any:
+    """Время метода репозитория за вычетом SQL в нем - гидрация ORM.
+
+    Вложенные вызовы репозиториев учитываются один раз, во внешнем.
+    """
+    @wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        stats = _detailed_stats()
+        if stats is None or stats.orm_depth:
+            return await method(*args, **kwargs)
+        stats.orm_depth += 1
+        db_before = stats.db_seconds
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            stats.orm_depth -= 1
+            elapsed = time.perf_counter() - started
+            stats.orm_seconds += elapsed - (stats.db_seconds - db_before)
+    return wrapper
+
+
+def serialize_timed(func: TFunc) -> TFunc:
+    """Время сборки pydantic-схем ответа из ORM-объектов."""
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        stats = _detailed_stats()
+        if stats is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.serialize_seconds += time.perf_counter() - started
+    return wrapper  # type: ignore[return-value]
+
+
+def server_timing_header(stats: RequestStats, total_seconds: float) -> str:
+    durations = (
+        ('db', stats.db_seconds),
+        ('orm', stats.orm_seconds),
+        ('serialize', stats.serialize_seconds),
+        ('total', total_seconds),
+    )
+    entries = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in durations]
+    # число запросов - не длительность, поэтому в desc
+    entries.insert(1, f'db-count;desc="{stats.queries}"')
+    return ', '.join(entries)
+
+
+def _detailed_stats() -> RequestStats | None:
+    stats = request_stats.get()
+    if stats is None or not stats.detailed:
+        return None
+    return stats
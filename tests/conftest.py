@@ -1,6 +1,27 @@
 import asyncio
+import os
+import tempfile
 
 import pytest
+import pytest_asyncio
+
+# Интеграционные тесты гоняются на SQLite-файле; настройки читаются
+# при импорте reading_list.config, поэтому окружение задается до него.
+_TEST_DB_DIR = tempfile.mkdtemp(prefix='reading_list_tests_')
+os.environ.setdefault(
+    'DATABASE_URL',
+    f'sqlite+aiosqlite:///{_TEST_DB_DIR}/test.db',
+)
+os.environ.setdefault('DEBUG', 'false')
+
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from reading_list.db.engine import AsyncSessionLocal, engine  # noqa: E402
+from reading_list.db.models.base import Base  # noqa: E402
+from reading_list.db.models.item import ItemORM  # noqa: E402, F401
+from reading_list.db.models.user import UserORM  # noqa: E402
+from reading_list.services.tag import user_tags_cache  # noqa: E402
+from tests.query_budget import count_queries  # noqa: E402
 
 
 @pytest.fixture(scope="session")
@@ -8,3 +29,42 @@ def event_loop():
     loop = asyncio.new_event_loop()
     yield loop
     loop.close()
+
+
+@pytest_asyncio.fixture
+async def db_engine():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    # кэш живет на процесс и пережил бы пересоздание таблиц
+    user_tags_cache.clear()
+    yield engine
+    # aiosqlite-соединения привязаны к event loop конкретного теста
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def user_id(db_engine) -> int:
+    async with AsyncSessionLocal() as session:
+        user = UserORM(email='melinoe@example.com', display_name='Melinoe')
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+@pytest_asyncio.fixture
+async def client(db_engine):
+    from reading_list.main import create_app
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(
+        transport=transport,
+        base_url='http://test',
+    ) as http_client:
+        yield http_client
+
+
+@pytest.fixture
+def query_budget():
+    """count_queries: `with query_budget(max_queries=2): ...`."""
+    return count_queries
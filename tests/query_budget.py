@@ -0,0 +1,79 @@
+"""Бюджет SQL-запросов для тестов и детектор N+1.
+
+Считает выражения, которые AsyncSessionLocal (и все, что идет через его
+engine) отправляет в БД внутри блока:
+
+    with count_queries(max_queries=2) as queries:
+        await client.get('/api/v1/items')
+
+Повтор одного и того же текста с другими параметрами - типичный N+1 -
+тоже ошибка, если не разрешен явно через max_repeats.
+"""
+import re
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+
+from reading_list.db.engine import AsyncSessionLocal
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Запросов больше бюджета или есть повторяющиеся."""
+
+
+@dataclass
+class QueryLog:
+    statements: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def repeated(self, max_repeats: int) -> dict[str, int]:
+        counts = Counter(
+            WHITESPACE_RE.sub(' ', statement).strip()
+            for statement in self.statements
+        )
+        return {
+            statement: repeats
+            for statement, repeats in counts.items()
+            if repeats > max_repeats
+        }
+
+
+@contextmanager
+def count_queries(
+    max_queries: int | None = None,
+    max_repeats: int | None = 1,
+) -> Iterator[QueryLog]:
+    """max_repeats=None отключает поиск N+1 (например, для пакетных INSERT)."""
+    log = QueryLog()
+    sync_engine = AsyncSessionLocal.kw['bind'].sync_engine
+
+    def _collect(conn, cursor, statement, *args):  # noqa: WPS430
+        log.statements.append(statement)
+
+    event.listen(sync_engine, 'before_cursor_execute', _collect)
+    try:
+        yield log
+    finally:
+        event.remove(sync_engine, 'before_cursor_execute', _collect)
+
+    if max_queries is not None and len(log) > max_queries:
+        raise QueryBudgetExceeded(
+            f'{len(log)} queries, budget {max_queries}:\n'
+            + '\n'.join(log.statements),
+        )
+    if max_repeats is not None:
+        repeated = log.repeated(max_repeats)
+        if repeated:
+            raise QueryBudgetExceeded(
+                'Possible N+1, repeated statements:\n' + '\n'.join(
+                    f'{repeats}x {statement}'
+                    for statement, repeats in repeated.items()
+                ),
+            )
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from reading_list.utils.etag import etag_matches
+
+ITEMS_URL = '/api/v1/items'
+TAGS_URL = '/api/v1/tags'
+
+
+async def _revalidate(client, url: str, etag: str, **params):
+    return await client.get(
+        url, params=params, headers={'If-None-Match': etag},
+    )
+
+
+async def _tick():
+    # updated_at в SQLite хранится с точностью до миллисекунды
+    await asyncio.sleep(0.002)
+
+
+def test_etag_matches_weak_lists_and_star():
+    assert etag_matches('"x", W/"abc"', 'W/"abc"')
+    assert etag_matches('*', 'W/"abc"')
+    assert not etag_matches('W/"abd"', 'W/"abc"')
+    assert not etag_matches(None, 'W/"abc"')
+
+
+@pytest.mark.asyncio
+async def test_item_list_etag_changes_on_writes(client, user_id):
+    tag_id = (await client.post(TAGS_URL, json={'name': 'work'})).json()['id']
+    item_id = (await client.post(
+        ITEMS_URL, json={'title': 'Item', 'kind': 'book'},
+    )).json()['id']
+
+    first = await client.get(ITEMS_URL)
+    etag = first.headers['ETag']
+    cached = await _revalidate(client, ITEMS_URL, etag)
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == etag
+    assert cached.content == b''
+
+    other_page = await _revalidate(client, ITEMS_URL, etag, status='done')
+    assert other_page.status_code == 200
+
+    await _tick()
+    await client.patch(f'{ITEMS_URL}/{item_id}', json={'tag_ids': [tag_id]})
+    tagged = await _revalidate(client, ITEMS_URL, etag)
+    assert tagged.status_code == 200
+    assert tagged.json()['items_list'][0]['tag_ids'] == [tag_id]
+
+    await _tick()
+    await client.delete(f'{TAGS_URL}/{tag_id}')
+    untagged = await _revalidate(client, ITEMS_URL, tagged.headers['ETag'])
+    assert untagged.status_code == 200
+    assert untagged.json()['items_list'][0]['tag_ids'] == []
+
+
+@pytest.mark.asyncio
+async def test_item_etag_changes_when_tags_removed(client, user_id):
+    tag_id = (await client.post(TAGS_URL, json={'name': 'work'})).json()['id']
+    item_id = (await client.post(ITEMS_URL, json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag_id],
+    })).json()['id']
+    item_url = f'{ITEMS_URL}/{item_id}'
+    etag = (await client.get(item_url)).headers['ETag']
+
+    assert (await _revalidate(client, item_url, etag)).status_code == 304
+
+    await _tick()
+    await client.request(
+        'DELETE', f'{item_url}/tags', json={'tag_ids': [tag_id]},
+    )
+    assert (await _revalidate(client, item_url, etag)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_tag_list_etag_changes_on_new_tag(client, user_id):
+    await client.post(TAGS_URL, json={'name': 'work'})
+    etag = (await client.get(TAGS_URL)).headers['ETag']
+
+    assert (await _revalidate(client, TAGS_URL, etag)).status_code == 304
+
+    await client.post(TAGS_URL, json={'name': 'home'})
+    assert (await _revalidate(client, TAGS_URL, etag)).status_code == 200
@@ -0,0 +1,29 @@
+import pytest
+
+from reading_list.utils.metrics import Histogram
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [('0.1', 2), ('1.0', 3), ('+Inf', 4)]
+    assert histogram.count == 4
+
+
+@pytest.mark.asyncio
+async def test_pool_endpoint_reports_checkouts(client, user_id):
+    await client.get('/api/v1/items')
+
+    resp = await client.get('/api/v1/internal/pool')
+
+    assert resp.status_code == 200
+    stats = resp.json()
+    assert stats['class'] == 'InstrumentedPool'
+    assert stats['checked_out'] == 0
+    assert stats['idle'] >= 1
+    assert stats['checkout_seconds']['count'] >= 1
+    assert stats['checkout_seconds']['buckets']['+Inf'] == (
+        stats['checkout_seconds']['count']
+    )
@@ -0,0 +1,49 @@
+import pytest
+
+from reading_list.api.schemas.common import MAX_BATCH_SIZE
+
+BATCH_URL = '/api/v1/items:batch'
+
+
+@pytest.mark.asyncio
+async def test_batch_creates_items_with_tags(client, user_id):
+    tag = (await client.post('/api/v1/tags', json={'name': 'work'})).json()
+
+    resp = await client.post(BATCH_URL, json={'items': [
+        {'title': 'First', 'kind': 'book', 'tag_ids': [tag['id'], tag['id']]},
+        {'title': 'Second', 'kind': 'article', 'status': 'done'},
+    ]})
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert (body['created'], body['failed']) == (2, 0)
+    first, second = (res['item'] for res in body['results'])
+    assert first['tag_ids'] == [tag['id']]
+    assert second['status'] == 'done'
+
+    listing = (await client.get('/api/v1/items')).json()
+    assert listing['meta']['total'] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_foreign_tags_per_item(client, user_id):
+    resp = await client.post(BATCH_URL, json={'items': [
+        {'title': 'Bad', 'kind': 'book', 'tag_ids': [404]},
+        {'title': 'Good', 'kind': 'book'},
+    ]})
+
+    body = resp.json()
+    bad, good = body['results']
+    assert (body['created'], body['failed']) == (1, 1)
+    assert bad['index'] == 0 and bad['item'] is None
+    assert '404' in bad['error']
+    assert good['index'] == 1 and good['item']['title'] == 'Good'
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_limited(client, user_id):
+    too_many = [{'title': 'x', 'kind': 'book'}] * (MAX_BATCH_SIZE + 1)
+
+    resp = await client.post(BATCH_URL, json={'items': too_many})
+
+    assert resp.status_code == 422
@@ -0,0 +1,110 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.models.tag import ItemTagORM
+
+ITEMS_URL = '/api/v1/items'
+OTHER_USER = {'X-User-Id': '2'}
+
+
+@pytest_asyncio.fixture
+async def later_tag(client, user_id) -> int:
+    await client.post('/api/v1/users', json={
+        'email': 'zagreus@example.com', 'display_name': 'Zagreus',
+    })
+    tag_id = (await client.post(
+        '/api/v1/tags', json={'name': 'later'},
+    )).json()['id']
+    for idx in range(3):
+        await client.post(ITEMS_URL, json={
+            'title': f'Later {idx}', 'kind': 'book', 'tag_ids': [tag_id],
+        })
+    await client.post(ITEMS_URL, json={'title': 'Now', 'kind': 'book'})
+    await client.post(
+        ITEMS_URL, json={'title': 'Foreign', 'kind': 'book'},
+        headers=OTHER_USER,
+    )
+    return tag_id
+
+
+async def _statuses(client, headers=None) -> dict[str, str]:
+    resp = await client.get(ITEMS_URL, headers=headers)
+    return {
+        item['title']: item['status'] for item in resp.json()['items_list']
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_by_tag(client, later_tag):
+    resp = await client.patch(
+        ITEMS_URL, params={'tag_ids': [later_tag]}, json={'status': 'done'},
+    )
+
+    assert resp.json() == {'affected': 3}
+    assert await _statuses(client) == {
+        'Later 0': 'done', 'Later 1': 'done', 'Later 2': 'done',
+        'Now': 'planned',
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_is_scoped_to_user(client, later_tag):
+    resp = await client.patch(ITEMS_URL, json={'priority': 'high'})
+
+    assert resp.json() == {'affected': 4}
+    foreign = (await client.get(ITEMS_URL, headers=OTHER_USER)).json()
+    assert foreign['items_list'][0]['priority'] == 'normal'
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_requires_changes(client, later_tag):
+    resp = await client.patch(ITEMS_URL, json={})
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('field', ['status', 'kind', 'priority'])
+async def test_bulk_update_rejects_null(client, later_tag, field):
+    resp = await client.patch(ITEMS_URL, json={field: None})
+
+    assert resp.status_code == 422
+    assert set((await _statuses(client)).values()) == {'planned'}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_can_clear_notes(client, later_tag):
+    resp = await client.patch(ITEMS_URL, json={'notes': None})
+
+    assert resp.json() == {'affected': 4}
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_by_tag(client, later_tag):
+    resp = await client.delete(ITEMS_URL, params={'tag_ids': [later_tag]})
+
+    assert resp.json() == {'affected': 3}
+    assert await _statuses(client) == {'Now': 'planned'}
+    async with AsyncSessionLocal() as session:
+        links = await session.scalar(
+            select(func.count()).select_from(ItemTagORM),
+        )
+    assert links == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_without_matches(client, later_tag):
+    resp = await client.delete(ITEMS_URL, params={'status': 'done'})
+
+    assert resp.json() == {'affected': 0}
+    assert len(await _statuses(client)) == 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_without_filter_is_rejected(client, later_tag):
+    resp = await client.delete(ITEMS_URL)
+
+    assert resp.status_code == 400
+    assert len(await _statuses(client)) == 4
@@ -0,0 +1,65 @@
+import pytest
+import pytest_asyncio
+
+ITEMS_URL = '/api/v1/items'
+
+
+async def _meta(client, **params) -> dict:
+    resp = await client.get(ITEMS_URL, params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()['meta']
+
+
+@pytest_asyncio.fixture
+async def tagged_items(client, user_id) -> list[int]:
+    tag_ids = []
+    for name in ('work', 'later'):
+        resp = await client.post('/api/v1/tags', json={'name': name})
+        tag_ids.append(resp.json()['id'])
+    for idx in range(5):
+        # у первых трех Item оба тега - JOIN размножил бы их строки
+        await client.post(ITEMS_URL, json={
+            'title': f'Item {idx}',
+            'kind': 'book',
+            'tag_ids': tag_ids if idx < 3 else [],
+        })
+    return tag_ids
+
+
+@pytest.mark.asyncio
+async def test_exact_total_with_tag_filter(client, tagged_items):
+    meta = await _meta(client, tag_ids=tagged_items, limit=2)
+
+    assert meta['total'] == 3
+    assert meta['has_more'] is True
+
+
+@pytest.mark.asyncio
+async def test_exact_total_with_cursor(client, tagged_items):
+    first = await _meta(client, limit=2)
+    second = await _meta(client, limit=2, cursor=first['next_cursor'])
+
+    assert first['total'] == second['total'] == 5
+
+
+@pytest.mark.asyncio
+async def test_exact_total_past_last_page(client, tagged_items):
+    meta = await _meta(client, offset=10)
+
+    assert meta['total'] == 5
+    assert meta['has_more'] is False
+
+
+@pytest.mark.asyncio
+async def test_count_none_skips_total(client, tagged_items):
+    meta = await _meta(client, count='none', limit=4)
+
+    assert meta['total'] is None
+    assert meta['has_more'] is True
+
+
+@pytest.mark.asyncio
+async def test_estimate_falls_back_to_exact_on_sqlite(client, tagged_items):
+    meta = await _meta(client, count='estimate', status='planned')
+
+    assert meta['total'] == 5
@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+
+import pytest
+import pytest_asyncio
+
+EXPORT_URL = '/api/v1/items/export'
+
+
+@pytest_asyncio.fixture
+async def library(client, user_id) -> int:
+    tag_id = (await client.post(
+        '/api/v1/tags', json={'name': 'work'},
+    )).json()['id']
+    await client.post('/api/v1/items:batch', json={'items': [
+        {
+            'title': f'Item {idx}',
+            'kind': 'book',
+            'status': 'done' if idx % 2 else 'planned',
+            'notes': 'line one\nline "two"',
+            'tag_ids': [tag_id] if idx % 2 else [],
+        }
+        for idx in range(7)
+    ]})
+    return tag_id
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_filtered_items(client, library):
+    resp = await client.get(EXPORT_URL, params={'status': 'done'})
+
+    assert resp.status_code == 200
+    assert resp.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row['title'] for row in rows] == ['Item 5', 'Item 3', 'Item 1']
+    assert all(row['tag_ids'] == [library] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_export_csv_has_header_and_all_rows(client, library):
+    resp = await client.get(
+        EXPORT_URL, params={'format': 'csv', 'sort_dir': 'asc'},
+    )
+
+    assert resp.headers['content-type'].startswith('text/csv')
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert [row['title'] for row in rows] == [f'Item {idx}' for idx in range(7)]
+    assert rows[0]['notes'] == 'line one\nline "two"'
+    assert rows[1]['tag_ids'] == str(library)
+    assert rows[0]['tag_ids'] == ''
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_invalid_filters_before_streaming(
+    client, library,
+):
+    resp = await client.get(EXPORT_URL, params={'sort_by': 'relevance'})
+
+    assert resp.status_code == 400
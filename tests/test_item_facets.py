@@ -0,0 +1,66 @@
+import pytest
+
+ITEMS_URL = '/api/v1/items'
+FACETS_URL = f'{ITEMS_URL}/facets'
+
+
+async def _seed_library(client) -> list[int]:
+    tag_ids = [
+        (await client.post('/api/v1/tags', json={'name': name})).json()['id']
+        for name in ('work', 'fun', 'unused')
+    ]
+    work, fun, _ = tag_ids
+    await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': 'A', 'kind': 'book', 'status': 'done', 'tag_ids': [work]},
+        {'title': 'B', 'kind': 'book', 'status': 'planned', 'tag_ids': [work, fun]},
+        {'title': 'C', 'kind': 'article', 'status': 'done', 'priority': 'high'},
+    ]})
+    return tag_ids
+
+
+@pytest.mark.asyncio
+async def test_facets_count_every_filter_value(client, user_id, query_budget):
+    work, fun, unused = await _seed_library(client)
+    await client.get('/api/v1/tags')
+
+    # отпечаток для ETag, колонки Item и теги
+    with query_budget(max_queries=3):
+        resp = await client.get(FACETS_URL)
+
+    assert resp.status_code == 200
+    assert resp.json() == {
+        'total': 3,
+        'status': {'planned': 1, 'reading': 0, 'done': 2},
+        'kind': {'book': 2, 'article': 1},
+        'priority': {'low': 0, 'normal': 2, 'high': 1},
+        'tag_ids': {str(work): 2, str(fun): 1, str(unused): 0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_facets_apply_item_filter(client, user_id):
+    work, fun, _ = await _seed_library(client)
+
+    by_status = (await client.get(FACETS_URL, params={'status': 'done'})).json()
+    by_tag = (await client.get(FACETS_URL, params={'tag_ids': fun})).json()
+
+    assert by_status['total'] == 2
+    assert by_status['kind'] == {'book': 1, 'article': 1}
+    assert by_status['tag_ids'][str(work)] == 1
+    assert by_tag['total'] == 1
+    assert by_tag['status']['planned'] == 1
+    assert by_tag['tag_ids'][str(work)] == 1
+
+
+@pytest.mark.asyncio
+async def test_facets_etag_changes_with_new_tag(client, user_id):
+    await _seed_library(client)
+    first = await client.get(FACETS_URL)
+
+    await client.post('/api/v1/tags', json={'name': 'later'})
+    second = await client.get(
+        FACETS_URL, headers={'If-None-Match': first.headers['etag']},
+    )
+
+    assert second.status_code == 200
+    assert len(second.json()['tag_ids']) == 4
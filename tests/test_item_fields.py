@@ -0,0 +1,71 @@
+import pytest
+
+ITEMS_URL = '/api/v1/items'
+
+
+async def _create_item(client) -> dict:
+    tag = (await client.post('/api/v1/tags', json={'name': 'work'})).json()
+    resp = await client.post(ITEMS_URL, json={
+        'title': 'Item',
+        'kind': 'book',
+        'notes': 'long notes ' * 100,
+        'tag_ids': [tag['id']],
+    })
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_list_defers_notes_by_default(client, user_id, query_budget):
+    created = await _create_item(client)
+
+    with query_budget(max_repeats=None) as queries:
+        resp = await client.get(ITEMS_URL)
+
+    item = resp.json()['items_list'][0]
+    assert 'notes' not in item
+    assert item['tag_ids'] == created['tag_ids']
+    assert not any('notes' in statement for statement in queries.statements)
+
+
+@pytest.mark.asyncio
+async def test_fields_project_columns(client, user_id, query_budget):
+    created = await _create_item(client)
+
+    with query_budget(max_repeats=None) as queries:
+        listing = await client.get(ITEMS_URL, params={'fields': 'title,status'})
+    single = await client.get(
+        f'{ITEMS_URL}/{created["id"]}', params={'fields': 'notes'},
+    )
+
+    assert listing.json()['items_list'] == [
+        {'id': created['id'], 'title': 'Item', 'status': 'planned'},
+    ]
+    page_query = queries.statements[-1]
+    assert 'item_tags' not in page_query
+    assert 'items.kind' not in page_query
+    assert single.json() == {'id': created['id'], 'notes': created['notes']}
+
+
+@pytest.mark.asyncio
+async def test_single_item_has_notes_and_etag_per_fields(client, user_id):
+    created = await _create_item(client)
+    url = f'{ITEMS_URL}/{created["id"]}'
+
+    full = await client.get(url)
+    sparse = await client.get(url, params={'fields': 'title'})
+
+    assert full.json() == created
+    assert full.headers['etag'] != sparse.headers['etag']
+    cached = await client.get(
+        url, params={'fields': 'title'},
+        headers={'If-None-Match': sparse.headers['etag']},
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_unknown_field_is_rejected(client, user_id):
+    resp = await client.get(ITEMS_URL, params={'fields': 'title,password'})
+
+    assert resp.status_code == 400
+    assert 'password' in resp.json()['detail']
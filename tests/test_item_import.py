@@ -0,0 +1,202 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from reading_list.config import settings
+from reading_list.db.engine import AsyncSessionLocal, engine
+from reading_list.db.models.tag import ItemTagORM
+from reading_list.repositories.item import ItemRepository
+from reading_list.services import item as item_service
+
+requires_postgres = pytest.mark.skipif(
+    engine.dialect.name != 'postgresql', reason='COPY есть только в Postgres',
+)
+
+IMPORT_URL = '/api/v1/items/import'
+ITEMS_URL = '/api/v1/items'
+
+
+def _chunked(body: bytes, size: int = 7):
+    # мелкие куски режут строки и многобайтовые символы посередине
+    async def chunks():
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+    return chunks()
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_reports_bad_lines(client, user_id, monkeypatch):
+    monkeypatch.setattr(item_service, 'IMPORT_BATCH_SIZE', 2)
+    tag_id = (await client.post(
+        '/api/v1/tags', json={'name': 'work'},
+    )).json()['id']
+    lines = [
+        json.dumps({'title': 'Чистый код', 'kind': 'book', 'tag_ids': [tag_id]}),
+        '{not json',
+        json.dumps({'title': 'No kind'}),
+        '',
+        json.dumps({'title': 'Foreign tag', 'kind': 'book', 'tag_ids': [999]}),
+        json.dumps({'title': 'Post', 'kind': 'article', 'status': 'done'}),
+        json.dumps({'title': 'Last', 'kind': 'book'}),
+    ]
+
+    resp = await client.post(
+        IMPORT_URL,
+        content=_chunked('\n'.join(lines).encode()),
+        headers={'content-type': 'application/x-ndjson'},
+    )
+
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report['processed'] == 6
+    assert report['imported'] == 3
+    assert report['failed'] == 3
+    assert report['batches'] == 2
+    assert [error['line'] for error in report['errors']] == [2, 3, 5]
+
+    listing = (await client.get(
+        ITEMS_URL, params={'sort_dir': 'asc'},
+    )).json()['items_list']
+    assert [item['title'] for item in listing] == ['Чистый код', 'Post', 'Last']
+    assert listing[0]['tag_ids'] == [tag_id]
+
+
+@pytest.mark.asyncio
+async def test_import_csv_roundtrips_export(client, user_id):
+    tag_id = (await client.post(
+        '/api/v1/tags', json={'name': 'work'},
+    )).json()['id']
+    await client.post('/api/v1/items:batch', json={'items': [
+        {
+            'title': f'Item {idx}',
+            'kind': 'book',
+            'notes': 'line one\nline "two"' if idx % 2 else None,
+            'tag_ids': [tag_id] if idx % 2 else [],
+        }
+        for idx in range(4)
+    ]})
+    exported = (await client.get(
+        f'{ITEMS_URL}/export', params={'format': 'csv', 'sort_dir': 'asc'},
+    )).content
+
+    resp = await client.post(
+        IMPORT_URL, params={'format': 'csv'}, content=_chunked(exported),
+    )
+
+    assert resp.json()['imported'] == 4
+    assert resp.json()['errors'] == []
+    listing = (await client.get(ITEMS_URL, params={
+        'sort_dir': 'asc', 'limit': 100, 'fields': 'title,notes,tag_ids',
+    })).json()['items_list']
+    originals, imported = listing[:4], listing[4:]
+    for original, copy in zip(originals, imported):
+        assert copy['id'] != original['id']
+        assert copy['title'] == original['title']
+        assert copy['notes'] == original['notes']
+        assert copy['tag_ids'] == original['tag_ids']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('import_format', ['ndjson', 'csv'])
+async def test_import_reports_invalid_utf8(client, user_id, import_format):
+    if import_format == 'csv':
+        body = 'title,kind\nGood,book\n'.encode() + b'Bad \xff\xfe,book\nLast,book'
+    else:
+        body = b'\n'.join([
+            json.dumps({'title': 'Good', 'kind': 'book'}).encode(),
+            b'{"title": "Bad \xff\xfe", "kind": "book"}',
+            json.dumps({'title': 'Last', 'kind': 'book'}).encode(),
+        ])
+
+    resp = await client.post(
+        IMPORT_URL, params={'format': import_format}, content=_chunked(body),
+    )
+
+    assert resp.status_code == 200
+    report = resp.json()
+    assert report['imported'] == 2
+    bad_line = 3 if import_format == 'csv' else 2
+    assert [error['line'] for error in report['errors']] == [bad_line]
+    assert 'UTF-8' in report['errors'][0]['error']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('import_format', ['ndjson', 'csv'])
+async def test_import_reports_too_long_lines(
+    client, user_id, monkeypatch, import_format,
+):
+    monkeypatch.setattr(settings, 'import_max_line_bytes', 40)
+    if import_format == 'csv':
+        # каждая строка короче лимита, но запись целиком - длиннее
+        lines = [
+            'title,kind,notes',
+            'Good,book,',
+            'Long,book,"' + 'x' * 20,
+            'x' * 30,
+            'x' * 20 + '"',
+            'Last,book,',
+        ]
+    else:
+        lines = [
+            json.dumps({'title': 'Good', 'kind': 'book'}),
+            json.dumps({'title': 'x' * 100, 'kind': 'book'}),
+            json.dumps({'title': 'Last', 'kind': 'book'}),
+        ]
+
+    resp = await client.post(
+        IMPORT_URL,
+        params={'format': import_format},
+        content=_chunked('\n'.join(lines).encode()),
+    )
+
+    report = resp.json()
+    assert report['imported'] == 2
+    long_line = 3 if import_format == 'csv' else 2
+    assert [error['line'] for error in report['errors']] == [long_line]
+    assert '40 bytes' in report['errors'][0]['error']
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_import_copies_items_and_tags(client, user_id, monkeypatch):
+    monkeypatch.setattr(item_service, 'IMPORT_BATCH_SIZE', 2)
+    tag_id = (await client.post(
+        '/api/v1/tags', json={'name': 'work'},
+    )).json()['id']
+    lines = [
+        json.dumps({'title': f'Item {idx}', 'kind': 'book', 'tag_ids': [tag_id]})
+        for idx in range(3)
+    ]
+
+    resp = await client.post(IMPORT_URL, content='\n'.join(lines).encode())
+
+    assert resp.json()['imported'] == 3
+    listing = (await client.get(
+        ITEMS_URL, params={'sort_dir': 'asc'},
+    )).json()['items_list']
+    assert [item['title'] for item in listing] == [
+        'Item 0', 'Item 1', 'Item 2',
+    ]
+    assert all(item['tag_ids'] == [tag_id] for item in listing)
+    stats = (await client.get(f'/api/v1/users/{user_id}/stats')).json()
+    assert stats['items_per_tag'] == {str(tag_id): 3}
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_copy_constraint_errors_are_integrity_errors(user_id):
+    async with AsyncSessionLocal() as session:
+        repo = ItemRepository(session)
+        with pytest.raises(IntegrityError):
+            await repo.load_items([{
+                'user_id': user_id, 'title': 'Item', 'kind': 'book',
+                'status': 'planned', 'priority': 'normal', 'notes': None,
+                'done_at': None,
+            }], [[999]])
+        await session.rollback()
+        links = await session.scalar(
+            select(func.count()).select_from(ItemTagORM),
+        )
+    assert links == 0
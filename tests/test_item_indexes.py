@@ -0,0 +1,56 @@
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from reading_list.api.schemas.item_filter import ItemFilter
+from reading_list.repositories.item import ItemRepository
+from reading_list.repositories.search import SqliteFtsSearchBackend
+
+# Полный проход по таблице без индекса: "SCAN items", но не
+# "SCAN items USING INDEX ..." (обход индекса ради сортировки - ок)
+FULL_SCAN_RE = re.compile(r'\bSCAN (items|item_tags|tags)\b(?! USING)')
+
+FILTER_COMBINATIONS = [
+    {},
+    {'status': 'planned'},
+    {'kind': 'book'},
+    {'priority': 'high'},
+    {'status': 'done', 'kind': 'article'},
+    {'tag_ids': [1, 2]},
+    {'status': 'reading', 'tag_ids': [1]},
+    {'q': 'clean'},
+    {
+        'created_from': datetime(2025, 1, 1),
+        'created_to': datetime(2025, 12, 31),
+    },
+    {'sort_by': 'updated_at'},
+    {'sort_by': 'priority', 'sort_dir': 'asc'},
+    {'q': 'clean', 'sort_by': 'relevance'},
+]
+
+
+async def _query_plan(conn, stmt) -> list[str]:
+    compiled = stmt.compile(
+        dialect=conn.dialect,
+        compile_kwargs={'literal_binds': True},
+    )
+    rows = await conn.execute(text(f'EXPLAIN QUERY PLAN {compiled}'))
+    return [row.detail for row in rows]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('filter_kwargs', FILTER_COMBINATIONS)
+async def test_listing_queries_use_indexes(db_engine, filter_kwargs):
+    filters = ItemFilter(**filter_kwargs)
+    base_stmt, count_stmt = ItemRepository.build_list_queries(
+        1, filters, SqliteFtsSearchBackend(),
+    )
+
+    async with db_engine.connect() as conn:
+        for stmt in (base_stmt, count_stmt):
+            plan = await _query_plan(conn, stmt)
+            full_scans = [line for line in plan if FULL_SCAN_RE.search(line)]
+            assert not full_scans, plan
+            assert any('INDEX' in line for line in plan), plan
@@ -0,0 +1,111 @@
+import pytest
+
+from reading_list.api.schemas.item_filter import ItemFilter
+from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.models.item import ItemPriority
+from reading_list.repositories.item import ItemRepository
+from reading_list.repositories.tag import TagRepository
+
+ITEMS_URL = '/api/v1/items'
+PRIORITIES = tuple(ItemPriority)
+
+
+async def _create_items(client, count: int) -> list[int]:
+    created = []
+    for idx in range(count):
+        resp = await client.post(ITEMS_URL, json={
+            'title': f'Item {idx}',
+            'kind': 'book',
+            'priority': PRIORITIES[idx % len(PRIORITIES)],
+        })
+        assert resp.status_code == 201
+        created.append(resp.json()['id'])
+    return created
+
+
+async def _walk_cursor(client, params: dict) -> list[int]:
+    seen = []
+    cursor = None
+    while True:
+        page_params = dict(params)
+        if cursor:
+            page_params['cursor'] = cursor
+        resp = await client.get(ITEMS_URL, params=page_params)
+        assert resp.status_code == 200
+        body = resp.json()
+        seen.extend(item['id'] for item in body['items_list'])
+        cursor = body['meta']['next_cursor']
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('sort_by', ['created_at', 'updated_at', 'priority'])
+@pytest.mark.parametrize('sort_dir', ['asc', 'desc'])
+async def test_cursor_walk_matches_offset_order(
+    client, user_id, sort_by, sort_dir,
+):
+    created = await _create_items(client, 7)
+    params = {'limit': 3, 'sort_by': sort_by, 'sort_dir': sort_dir}
+
+    full = await client.get(ITEMS_URL, params={**params, 'limit': 100})
+    expected = [item['id'] for item in full.json()['items_list']]
+
+    assert sorted(expected) == sorted(created)
+    assert await _walk_cursor(client, params) == expected
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor(client, user_id):
+    await _create_items(client, 2)
+
+    resp = await client.get(ITEMS_URL, params={'limit': 2})
+
+    assert resp.json()['meta']['next_cursor'] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('limit', [0, -1, 1001])
+async def test_out_of_range_limit_is_rejected(client, user_id, limit):
+    await _create_items(client, 2)
+
+    resp = await client.get(ITEMS_URL, params={'limit': limit})
+
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_cursor_with_other_sort_is_rejected(client, user_id):
+    await _create_items(client, 3)
+    first = await client.get(ITEMS_URL, params={'limit': 1})
+    cursor = first.json()['meta']['next_cursor']
+
+    resp = await client.get(
+        ITEMS_URL, params={'cursor': cursor, 'sort_by': 'priority'},
+    )
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_garbage_cursor_is_rejected(client, user_id):
+    resp = await client.get(ITEMS_URL, params={'cursor': 'not-a-cursor'})
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_listing_reads_rows_without_orm_objects(client, user_id):
+    await _create_items(client, 3)
+    await client.post('/api/v1/tags', json={'name': 'work'})
+
+    async with AsyncSessionLocal() as session:
+        listing = await ItemRepository(session).get_with_filters(
+            user_id, ItemFilter(limit=2),
+        )
+        tags = await TagRepository(session).get_for_user(user_id)
+
+        assert [row.title for row in listing.items] == ['Item 2', 'Item 1']
+        assert listing.has_more
+        assert [tag.name for tag in tags] == ['work']
+        assert not session.identity_map
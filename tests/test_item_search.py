@@ -0,0 +1,94 @@
+import pytest
+import pytest_asyncio
+
+ITEMS_URL = '/api/v1/items'
+
+LIBRARY = (
+    ('Clean Architecture', 'Прочитать до конца месяца'),
+    ('Clean Code', 'Про чистый код, перечитать главу про функции'),
+    ('Deep Green Sky', 'В очередь после Clean Code'),
+    ('Мифы Древней Греции', None),
+)
+
+
+async def _search(client, **params) -> list[str]:
+    resp = await client.get(ITEMS_URL, params=params)
+    assert resp.status_code == 200, resp.text
+    return [item['title'] for item in resp.json()['items_list']]
+
+
+@pytest_asyncio.fixture
+async def library(client, user_id):
+    for title, notes in LIBRARY:
+        resp = await client.post(ITEMS_URL, json={
+            'title': title, 'kind': 'book', 'notes': notes,
+        })
+        assert resp.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_search_matches_title_and_notes(client, library):
+    titles = await _search(client, q='clean')
+
+    assert set(titles) == {'Clean Architecture', 'Clean Code', 'Deep Green Sky'}
+
+
+@pytest.mark.asyncio
+async def test_search_matches_word_prefix_and_cyrillic(client, library):
+    assert await _search(client, q='архитект') == []
+    assert await _search(client, q='Древн') == ['Мифы Древней Греции']
+    assert await _search(client, q='arch') == ['Clean Architecture']
+
+
+@pytest.mark.asyncio
+async def test_search_all_words_must_match(client, library):
+    assert await _search(client, q='clean code') == [
+        'Deep Green Sky', 'Clean Code',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_relevance_sort_puts_title_match_first(client, library):
+    by_date = await _search(client, q='code')
+    by_relevance = await _search(client, q='code', sort_by='relevance')
+
+    assert by_date == ['Deep Green Sky', 'Clean Code']
+    assert by_relevance == ['Clean Code', 'Deep Green Sky']
+
+
+@pytest.mark.asyncio
+async def test_relevance_cursor_walk(client, library):
+    params = {'q': 'clean', 'sort_by': 'relevance', 'limit': 100}
+    expected = await _search(client, **params)
+
+    seen = []
+    cursor = None
+    while True:
+        page_params = {**params, 'limit': 1}
+        if cursor:
+            page_params['cursor'] = cursor
+        resp = await client.get(ITEMS_URL, params=page_params)
+        body = resp.json()
+        seen.extend(item['title'] for item in body['items_list'])
+        cursor = body['meta']['next_cursor']
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_relevance_without_query_is_rejected(client, library):
+    resp = await client.get(ITEMS_URL, params={'sort_by': 'relevance'})
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_deleted_item_leaves_index(client, library):
+    items = (await client.get(ITEMS_URL, params={'q': 'architecture'})).json()
+    item_id = items['items_list'][0]['id']
+
+    await client.delete(f'{ITEMS_URL}/{item_id}')
+
+    assert await _search(client, q='architecture') == []
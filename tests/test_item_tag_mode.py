@@ -0,0 +1,67 @@
+import pytest
+import pytest_asyncio
+
+ITEMS_URL = '/api/v1/items'
+
+
+@pytest_asyncio.fixture
+async def library(client, user_id) -> dict:
+    work, fun = [
+        (await client.post('/api/v1/tags', json={'name': name})).json()['id']
+        for name in ('work', 'fun')
+    ]
+    await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': 'Both', 'kind': 'book', 'tag_ids': [work, fun]},
+        {'title': 'Work', 'kind': 'book', 'tag_ids': [work]},
+        {'title': 'Fun', 'kind': 'article', 'tag_ids': [fun]},
+        {'title': 'Untagged', 'kind': 'article'},
+    ]})
+    return {'work': work, 'fun': fun}
+
+
+async def _titles(client, **params) -> set[str]:
+    resp = await client.get(ITEMS_URL, params=params)
+    assert resp.status_code == 200, resp.text
+    assert resp.json()['meta']['total'] == len(resp.json()['items_list'])
+    return {item['title'] for item in resp.json()['items_list']}
+
+
+@pytest.mark.asyncio
+async def test_tag_modes(client, library, query_budget):
+    tag_ids = [library['work'], library['fun']]
+
+    with query_budget(max_repeats=None) as queries:
+        match_all = await _titles(client, tag_ids=tag_ids, tag_mode='all')
+
+    assert match_all == {'Both'}
+    assert await _titles(client, tag_ids=tag_ids) == {'Both', 'Work', 'Fun'}
+    assert await _titles(client, tag_ids=tag_ids, tag_mode='none') == {
+        'Untagged',
+    }
+    assert await _titles(
+        client, tag_ids=[library['work']], tag_mode='none',
+    ) == {'Fun', 'Untagged'}
+    page_query = queries.statements[-1]
+    assert 'DISTINCT' not in page_query
+    assert 'FROM tags' not in page_query
+
+
+@pytest.mark.asyncio
+async def test_tag_mode_in_facets_and_bulk(client, library):
+    facets = (await client.get(f'{ITEMS_URL}/facets', params={
+        'tag_ids': library['work'], 'tag_mode': 'none',
+    })).json()
+    assert facets['total'] == 2
+    assert facets['tag_ids'][str(library['fun'])] == 1
+
+    resp = await client.delete(ITEMS_URL, params={
+        'tag_ids': [library['work'], library['fun']], 'tag_mode': 'all',
+    })
+    assert resp.json() == {'affected': 1}
+
+
+@pytest.mark.asyncio
+async def test_unknown_tag_mode_is_rejected(client, library):
+    resp = await client.get(ITEMS_URL, params={'tag_mode': 'some'})
+
+    assert resp.status_code == 422
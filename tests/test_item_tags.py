@@ -0,0 +1,52 @@
+import pytest
+import pytest_asyncio
+
+ITEMS_URL = '/api/v1/items'
+
+
+@pytest_asyncio.fixture
+async def tag_ids(client, user_id) -> list[int]:
+    created = []
+    for name in ('work', 'learning', 'later'):
+        resp = await client.post('/api/v1/tags', json={'name': name})
+        created.append(resp.json()['id'])
+    return created
+
+
+@pytest.mark.asyncio
+async def test_listing_returns_tag_ids_per_item(client, tag_ids):
+    await client.post(ITEMS_URL, json={
+        'title': 'Tagged', 'kind': 'book', 'tag_ids': tag_ids[::-1],
+    })
+    await client.post(ITEMS_URL, json={'title': 'Untagged', 'kind': 'book'})
+
+    resp = await client.get(ITEMS_URL)
+
+    by_title = {
+        item['title']: item['tag_ids'] for item in resp.json()['items_list']
+    }
+    assert by_title == {'Tagged': sorted(tag_ids), 'Untagged': []}
+
+
+@pytest.mark.asyncio
+async def test_get_item_returns_tag_ids(client, tag_ids):
+    created = await client.post(ITEMS_URL, json={
+        'title': 'Tagged', 'kind': 'book', 'tag_ids': tag_ids[:2],
+    })
+
+    resp = await client.get(f"{ITEMS_URL}/{created.json()['id']}")
+
+    assert resp.json()['tag_ids'] == sorted(tag_ids[:2])
+
+
+@pytest.mark.asyncio
+async def test_get_foreign_item_is_not_found(client, tag_ids):
+    created = await client.post(ITEMS_URL, json={
+        'title': 'Mine', 'kind': 'book',
+    })
+
+    resp = await client.get(
+        f"{ITEMS_URL}/{created.json()['id']}", headers={'X-User-Id': '2'},
+    )
+
+    assert resp.status_code == 404
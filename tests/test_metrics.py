@@ -0,0 +1,111 @@
+import re
+
+import pytest
+
+from reading_list.api.v1.items import router as items_router
+from reading_list.main import app
+from reading_list.middleware import route_templates
+from reading_list.utils.metrics import route_template
+
+METRICS_URL = '/metrics'
+SAMPLE_RE = re.compile(r'^(\w+)(?:\{(.*)\})? (\S+)$')
+LABEL_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    for line in text.splitlines():
+        match = SAMPLE_RE.match(line)
+        if match is None or match.group(1) != name:
+            continue
+        line_labels = dict(LABEL_RE.findall(match.group(2) or ''))
+        if line_labels.items() >= labels.items():
+            return float(match.group(3))
+    raise AssertionError(f'{name} {labels} not found')
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_labeled_by_route_template(client, user_id):
+    item_id = (await client.post('/api/v1/items', json={
+        'title': 'Item', 'kind': 'book',
+    })).json()['id']
+    await client.get(f'/api/v1/items/{item_id}')
+    await client.get('/api/v1/items/999999')
+
+    resp = await client.get(METRICS_URL)
+
+    assert resp.status_code == 200
+    assert resp.headers['content-type'].startswith('text/plain; version=0.0.4')
+    text = resp.text
+    route = '/api/v1/items/{item_id}'
+    for status in ('200', '404'):
+        assert _sample(
+            text, 'http_requests_total',
+            method='GET', route=route, status=status,
+        ) >= 1
+    assert f'route="/api/v1/items/{item_id}"' not in text
+    # по одному запросу к БД на каждый GET /items/{id} как минимум
+    assert _sample(
+        text, 'http_request_db_queries_sum', method='GET', route=route,
+    ) >= 2
+    assert _sample(text, 'db_queries_total') > 0
+    assert '# TYPE http_request_duration_seconds histogram' in text
+
+
+@pytest.mark.asyncio
+async def test_route_label_keeps_router_prefix(client, user_id):
+    # у роута '' из items_router весь шаблон - префиксы include_router
+    await client.get('/api/v1/items')
+    await client.get('/api/v1/no-such-route')
+
+    text = (await client.get(METRICS_URL)).text
+
+    assert _sample(
+        text, 'http_requests_total', method='GET', route='/api/v1/items',
+    ) >= 1
+    assert _sample(
+        text, 'http_requests_total', method='GET', route='unmatched',
+    ) >= 1
+    assert 'route=""' not in text
+    assert 'no-such-route' not in text
+
+
+def test_route_template_adds_root_path_and_prefixes():
+    templates = route_templates(app.routes)
+    item_route = next(
+        route for route in items_router.routes
+        if route.path_format == '/{item_id}' and 'GET' in route.methods
+    )
+
+    label = route_template(
+        {'route': item_route, 'root_path': '/proxy'}, templates,
+    )
+
+    assert label == '/proxy/api/v1/items/{item_id}'
+    assert route_template({'root_path': '/proxy'}, templates) == 'unmatched'
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_opt_in(client, user_id):
+    await client.post('/api/v1/items:batch', json={'items': [
+        {'title': f'Item {idx}', 'kind': 'book'} for idx in range(3)
+    ]})
+
+    plain = await client.get('/api/v1/items')
+    timed = await client.get(
+        '/api/v1/items', headers={'X-Server-Timing': '1'},
+    )
+
+    assert 'server-timing' not in plain.headers
+    entries = dict(
+        entry.strip().split(';', 1)
+        for entry in timed.headers['server-timing'].split(',')
+    )
+    assert list(entries) == ['db', 'db-count', 'orm', 'serialize', 'total']
+    # отпечаток для ETag и сама страница
+    assert entries['db-count'] == 'desc="2"'
+    total = float(entries['total'].removeprefix('dur='))
+    parts = sum(
+        float(entries[name].removeprefix('dur='))
+        for name in ('db', 'orm', 'serialize')
+    )
+    assert 0 < parts <= total
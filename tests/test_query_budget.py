@@ -0,0 +1,58 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.models.item import ItemORM
+from tests.query_budget import QueryBudgetExceeded
+
+ITEMS_URL = '/api/v1/items'
+
+
+@pytest_asyncio.fixture
+async def tagged_items(client, user_id) -> list[int]:
+    tag_ids = [
+        (await client.post('/api/v1/tags', json={'name': name})).json()['id']
+        for name in ('a', 'b')
+    ]
+    created = await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': f'Item {idx}', 'kind': 'book', 'tag_ids': tag_ids}
+        for idx in range(30)
+    ]})
+    return [result['item']['id'] for result in created.json()['results']]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('limit', [5, 30])
+async def test_item_listing_budget_does_not_grow_with_page(
+    client, tagged_items, query_budget, limit,
+):
+    # отпечаток для ETag + страница с total и тегами
+    with query_budget(max_queries=2):
+        resp = await client.get(ITEMS_URL, params={'limit': limit})
+
+    assert len(resp.json()['items_list']) == limit
+
+
+@pytest.mark.asyncio
+async def test_read_endpoints_budget(client, tagged_items, query_budget):
+    with query_budget(max_queries=2):
+        await client.get(f'{ITEMS_URL}/{tagged_items[0]}')
+    with query_budget(max_queries=1):
+        await client.get(f'{ITEMS_URL}/export')
+    await client.get('/api/v1/tags')
+    with query_budget(max_queries=0):
+        await client.get('/api/v1/tags')
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_reported_as_n_plus_one(
+    tagged_items, query_budget,
+):
+    with pytest.raises(QueryBudgetExceeded, match='N\\+1'):
+        with query_budget():
+            async with AsyncSessionLocal() as session:
+                for item_id in tagged_items[:3]:
+                    await session.scalar(
+                        select(ItemORM).where(ItemORM.id == item_id),
+                    )
@@ -0,0 +1,103 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+
+from reading_list.api import deps
+from reading_list.db.engine import engine, make_engine
+from reading_list.db.models.base import Base
+from reading_list.db.models.item import ItemORM
+from reading_list.db.models.user import UserORM
+from reading_list.db.replicas import ReplicaRouter
+
+ITEMS_URL = '/api/v1/items'
+STICKY_SECONDS = 5
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture
+async def replicas(db_engine, user_id, tmp_path) -> list:
+    # два SQLite-файла вместо реплик: у каждой свой Item, чтобы по
+    # ответу было видно, откуда читали
+    engines = [
+        make_engine(f'sqlite+aiosqlite:///{tmp_path}/replica_{idx}.db')
+        for idx in range(2)
+    ]
+    for idx, replica in enumerate(engines):
+        async with replica.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(insert(UserORM), {
+                'id': user_id, 'email': 'melinoe@example.com',
+                'display_name': 'Melinoe',
+            })
+            await conn.execute(insert(ItemORM), {
+                'user_id': user_id, 'title': f'replica {idx}',
+                'kind': 'book', 'status': 'planned',
+            })
+    yield engines
+    for replica in engines:
+        await replica.dispose()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def router(replicas, clock, monkeypatch) -> ReplicaRouter:
+    replica_router = ReplicaRouter(
+        engine, replicas, sticky_seconds=STICKY_SECONDS, clock=clock,
+    )
+    monkeypatch.setattr(deps, 'replica_router', replica_router)
+    return replica_router
+
+
+async def _titles(client) -> list[str]:
+    resp = await client.get(ITEMS_URL)
+    assert resp.status_code == 200, resp.text
+    return [item['title'] for item in resp.json()['items_list']]
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replicas_round_robin(client, router):
+    assert await _titles(client) == ['replica 0']
+    assert await _titles(client) == ['replica 1']
+    assert await _titles(client) == ['replica 0']
+
+
+@pytest.mark.asyncio
+async def test_reads_stick_to_primary_after_write(client, router, clock):
+    resp = await client.post(ITEMS_URL, json={'title': 'Fresh', 'kind': 'book'})
+    assert resp.status_code == 201
+
+    assert await _titles(client) == ['Fresh']
+
+    clock.now += STICKY_SECONDS + 1
+    assert await _titles(client) == ['replica 0']
+    # окно - только у писавшего пользователя
+    await client.post(ITEMS_URL, json={'title': 'Again', 'kind': 'book'})
+    assert router.engine_for_read(user_id=2) in router.replicas
+
+
+@pytest.mark.asyncio
+async def test_least_connections_skips_busy_replica(replicas):
+    router = ReplicaRouter(engine, replicas, balance='least_connections')
+
+    async with replicas[0].connect():
+        assert router.engine_for_read(user_id=1) is replicas[1]
+    assert router.engine_for_read(user_id=1) is replicas[0]
+
+
+def test_without_replicas_everything_reads_primary():
+    router = ReplicaRouter(engine)
+    router.mark_write(1)
+
+    assert router.engine_for_read(user_id=1) is engine
+    assert len(router.recent_writers) == 0
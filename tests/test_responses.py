@@ -0,0 +1,36 @@
+import pytest
+
+from reading_list.api.schemas.item import ITEM_FIELDS, ItemPage
+
+
+@pytest.mark.asyncio
+async def test_fast_json_matches_response_model(client, user_id):
+    tag = (await client.post('/api/v1/tags', json={'name': 'work'})).json()
+    created = await client.post('/api/v1/items', json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag['id']],
+    })
+
+    resp = await client.get('/api/v1/items', params={
+        'fields': ','.join(ITEM_FIELDS),
+    })
+
+    assert created.status_code == 201
+    assert resp.headers['content-type'] == 'application/json'
+    assert 'etag' in resp.headers
+    page = ItemPage.model_validate_json(resp.content)
+    assert page.items_list[0].model_dump(mode='json') == created.json()
+    assert page.items_list[0].tag_ids == [tag['id']]
+
+
+@pytest.mark.asyncio
+async def test_openapi_keeps_response_models(client):
+    schema = (await client.get('/openapi.json')).json()
+
+    get_items = schema['paths']['/api/v1/items']['get']
+    assert get_items['responses']['200']['content']['application/json'][
+        'schema'
+    ] == {'$ref': '#/components/schemas/ItemFieldsPage'}
+    # fields= может убрать из Item что угодно, кроме id
+    sparse_item = schema['components']['schemas']['ItemFieldsOut']
+    assert sparse_item['required'] == ['id']
+    assert tuple(sparse_item['properties']) == ITEM_FIELDS
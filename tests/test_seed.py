@@ -0,0 +1,61 @@
+import pytest
+
+from reading_list.db.seed import (  # noqa: WPS318, WPS319
+    DatasetConfig,
+    generate_dataset,
+    generate_items,
+    items_per_user,
+)
+
+CONFIG = DatasetConfig(users=20, items_per_user=30, tags_per_user=8, batch_size=64)
+
+
+def test_dataset_is_deterministic_under_seed():
+    first = list(generate_items(CONFIG))
+    second = list(generate_items(CONFIG))
+    other = list(generate_items(DatasetConfig(
+        users=20, items_per_user=30, tags_per_user=8, seed=7,
+    )))
+
+    assert first == second
+    assert first != other
+
+
+def test_items_per_user_is_skewed_but_exact():
+    counts = items_per_user(CONFIG)
+    flat = items_per_user(DatasetConfig(users=20, items_per_user=30, skew=0))
+
+    assert sum(counts) == 20 * 30
+    assert max(counts) > 2 * min(counts)
+    assert flat == [30] * 20
+
+
+def test_item_tags_belong_to_owner():
+    for item, tag_ids in generate_items(CONFIG):
+        owner_tags = range(
+            (item['user_id'] - 1) * CONFIG.tags_per_user + 1,
+            item['user_id'] * CONFIG.tags_per_user + 1,
+        )
+        assert tag_ids == sorted(set(tag_ids))
+        assert all(tag_id in owner_tags for tag_id in tag_ids)
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_into_empty_db(client, db_engine):
+    totals = await generate_dataset(CONFIG, db_engine)
+
+    assert totals['users'] == 20
+    assert totals['tags'] == 20 * 8
+    assert totals['items'] == 20 * 30
+    resp = await client.get(
+        '/api/v1/items', params={'limit': 100}, headers={'X-User-Id': '1'},
+    )
+    assert resp.status_code == 200
+    assert len(resp.json()['items_list']) == min(items_per_user(CONFIG)[0], 100)
+    # id выданы генератором, приложение продолжает с max(id) + 1
+    created = await client.post('/api/v1/items', json={
+        'title': 'After seed', 'kind': 'book',
+    })
+    assert created.json()['id'] == 20 * 30 + 1
+    with pytest.raises(RuntimeError):
+        await generate_dataset(CONFIG, db_engine)
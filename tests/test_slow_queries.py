@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from reading_list.db import engine as db_engine
+from reading_list.db.slow_queries import (
+    SlowQueryLog,
+    is_analyze_safe,
+    parameter_shapes,
+)
+
+
+def test_parameter_shapes_hide_values():
+    assert parameter_shapes((1, 'secret', [1, 2])) == ['int', 'str[6]', 'list[2]']
+    assert parameter_shapes([{'a': None}, {'a': 1}], executemany=True) == {
+        'rows': 2, 'row': {'a': 'NoneType'},
+    }
+
+
+@pytest.mark.parametrize(('statement', 'safe'), [
+    ('SELECT * FROM items WHERE id = $1', True),
+    ("SELECT nextval('items_id_seq')", False),
+    ('SELECT pg_advisory_lock(1)', False),
+    ('SELECT id FROM items WHERE id = $1 FOR UPDATE', False),
+    ('SELECT id FROM items FOR NO KEY UPDATE SKIP LOCKED', False),
+    ('UPDATE items SET notes = $1', False),
+])
+def test_analyze_only_for_side_effect_free_select(statement, safe):
+    assert is_analyze_safe(statement) is safe
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_with_route_and_plan(
+    client, user_id, tmp_path, monkeypatch,
+):
+    log_path = tmp_path / 'slow.jsonl'
+    slow_log = SlowQueryLog(
+        str(log_path), threshold_ms=0, explain_rate=1, explain_concurrency=100,
+    )
+    monkeypatch.setattr(db_engine, 'slow_query_log', slow_log)
+
+    resp = await client.get('/api/v1/items', params={'q': 'clean code'})
+    await slow_log.wait_pending()
+
+    assert resp.status_code == 200
+    entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+    listing = [
+        entry for entry in entries
+        if entry['route'] == '/api/v1/items' and 'items_fts' in entry['statement']
+    ]
+    assert listing
+    assert not any(entry['statement'].startswith('EXPLAIN') for entry in entries)
+    entry = listing[0]
+    assert entry['method'] == 'GET'
+    assert 'clean' not in json.dumps(entry['parameters'])
+    assert any('items_fts' in line for line in entry['plan']), entry
+
+
+@pytest.mark.asyncio
+async def test_explains_over_concurrency_limit_are_skipped(
+    client, user_id, tmp_path, monkeypatch,
+):
+    log_path = tmp_path / 'slow.jsonl'
+    slow_log = SlowQueryLog(
+        str(log_path), threshold_ms=0, explain_rate=1, explain_concurrency=1,
+    )
+    monkeypatch.setattr(db_engine, 'slow_query_log', slow_log)
+
+    resp = await client.get('/api/v1/items', params={'q': 'clean code'})
+    await slow_log.wait_pending()
+
+    assert resp.status_code == 200
+    entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+    planned = [entry for entry in entries if 'plan' in entry]
+    skipped = [
+        entry for entry in entries
+        if entry.get('plan_error') == 'skipped: explain concurrency limit'
+    ]
+    assert planned
+    assert skipped
+    assert len(planned) + len(skipped) == len(entries)
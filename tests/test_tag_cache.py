@@ -0,0 +1,128 @@
+import pytest
+from sqlalchemy import delete, insert
+
+from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.models.tag import TagORM
+from reading_list.services.tag import user_tags_cache
+from reading_list.utils.cache import TTLCache
+
+ITEMS_URL = '/api/v1/items'
+TAGS_URL = '/api/v1/tags'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+
+    clock.now = 11
+    assert cache.get('c') is None
+    assert cache.stats.as_dict() == {
+        'hits': 2, 'misses': 2, 'evictions': 2, 'invalidations': 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_item_writes_check_tags_through_cache(client, user_id):
+    tag_id = (await client.post(TAGS_URL, json={'name': 'work'})).json()['id']
+    await client.get(TAGS_URL)
+    hits = user_tags_cache.stats.hits
+
+    created = await client.post(ITEMS_URL, json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag_id],
+    })
+    updated = await client.patch(
+        f"{ITEMS_URL}/{created.json()['id']}",
+        json={'title': 'Renamed', 'tag_ids': []},
+    )
+
+    assert created.json()['tag_ids'] == [tag_id]
+    assert updated.status_code == 200
+    assert updated.json()['tag_ids'] == []
+    assert user_tags_cache.stats.hits == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_tag_deleted_elsewhere_is_rejected_on_item_write(client, user_id):
+    tag_id = (await client.post(TAGS_URL, json={'name': 'work'})).json()['id']
+    await client.get(TAGS_URL)
+    # тег удален в обход TagService - как из другого процесса
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(TagORM).where(TagORM.id == tag_id))
+        await session.commit()
+
+    resp = await client.post(ITEMS_URL, json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag_id],
+    })
+
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_batch_with_tag_deleted_elsewhere_fails_only_its_item(
+    client, user_id,
+):
+    tag_id = (await client.post(TAGS_URL, json={'name': 'work'})).json()['id']
+    await client.get(TAGS_URL)
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(TagORM).where(TagORM.id == tag_id))
+        await session.commit()
+
+    resp = await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': 'Tagged', 'kind': 'book', 'tag_ids': [tag_id]},
+        {'title': 'Plain', 'kind': 'book'},
+    ]})
+
+    assert resp.status_code == 200
+    assert resp.json()['created'] == 1
+    assert resp.json()['results'][0]['error']
+    assert resp.json()['results'][1]['item']['title'] == 'Plain'
+
+
+@pytest.mark.asyncio
+async def test_tag_changes_invalidate_cache(client, user_id):
+    await client.post(TAGS_URL, json={'name': 'b'})
+    assert [tag['name'] for tag in (await client.get(TAGS_URL)).json()] == ['b']
+
+    tag_id = (await client.post(TAGS_URL, json={'name': 'a'})).json()['id']
+    assert [tag['name'] for tag in (await client.get(TAGS_URL)).json()] == [
+        'a', 'b',
+    ]
+
+    await client.delete(f'{TAGS_URL}/{tag_id}')
+    resp = await client.post(ITEMS_URL, json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag_id],
+    })
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_refreshed_for_unknown_tag(client, user_id):
+    await client.get(TAGS_URL)
+    # тег создан в обход TagService - как из другого процесса
+    async with AsyncSessionLocal() as session:
+        tag_id = (await session.execute(
+            insert(TagORM).values(user_id=user_id, name='x').returning(TagORM.id),
+        )).scalar_one()
+        await session.commit()
+
+    resp = await client.post(ITEMS_URL, json={
+        'title': 'Item', 'kind': 'book', 'tag_ids': [tag_id],
+    })
+
+    assert resp.status_code == 201
+    assert resp.json()['tag_ids'] == [tag_id]
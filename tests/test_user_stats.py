@@ -0,0 +1,131 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import update
+
+from reading_list.db.engine import AsyncSessionLocal
+from reading_list.db.models.stats import UserItemStatORM
+from reading_list.jobs.reconcile_stats import reconcile_stats
+from reading_list.repositories.stats import UserItemStatsRepository
+
+ITEMS_URL = '/api/v1/items'
+
+
+async def _counters(user_id: int) -> dict[str, int]:
+    async with AsyncSessionLocal() as session:
+        counters = await UserItemStatsRepository(session).get_for_user(user_id)
+    return {name: value for name, value in counters.items() if value}
+
+
+async def _source_counters(user_id: int) -> dict[str, int]:
+    # пересчет из items/item_tags/tags в транзакции, которая откатывается
+    async with AsyncSessionLocal() as session:
+        await UserItemStatsRepository(session).reconcile([user_id])
+        counters = await UserItemStatsRepository(session).get_for_user(user_id)
+        await session.rollback()
+    return {name: value for name, value in counters.items() if value}
+
+
+async def _assert_consistent(user_id: int) -> dict[str, int]:
+    counters = await _counters(user_id)
+    assert counters == await _source_counters(user_id)
+    return counters
+
+
+@pytest.mark.asyncio
+async def test_counters_follow_item_writes(client, user_id):
+    work, fun = [
+        (await client.post('/api/v1/tags', json={'name': name})).json()['id']
+        for name in ('work', 'fun')
+    ]
+    item = (await client.post(ITEMS_URL, json={
+        'title': 'A', 'kind': 'book', 'tag_ids': [work, fun],
+    })).json()
+    await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': 'B', 'kind': 'article', 'status': 'done', 'tag_ids': [work]},
+        {'title': 'C', 'kind': 'article', 'priority': 'high'},
+    ]})
+    counters = await _assert_consistent(user_id)
+    assert counters['items'] == 3
+    assert counters['tags'] == 2
+    assert counters[f'tag:{work}'] == 2
+
+    await client.patch(f'{ITEMS_URL}/{item["id"]}', json={
+        'status': 'done', 'tag_ids': [fun],
+    })
+    await client.request(
+        'DELETE', f'{ITEMS_URL}/{item["id"]}/tags', json={'tag_ids': [fun]},
+    )
+    await _assert_consistent(user_id)
+
+    await client.patch(ITEMS_URL, params={'kind': 'article'}, json={
+        'status': 'reading', 'priority': 'low',
+    })
+    counters = await _assert_consistent(user_id)
+    assert counters['status:reading'] == 2
+
+    await client.delete(f'/api/v1/tags/{work}')
+    await client.delete(ITEMS_URL, params={'status': 'reading'})
+    await client.delete(f'{ITEMS_URL}/{item["id"]}')
+    counters = await _assert_consistent(user_id)
+    assert counters == {'tags': 1}
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoint(client, user_id):
+    tag_id = (await client.post('/api/v1/tags', json={'name': 'work'})).json()['id']
+    await client.post(f'{ITEMS_URL}:batch', json={'items': [
+        {'title': 'A', 'kind': 'book', 'status': 'done', 'tag_ids': [tag_id]},
+        {'title': 'B', 'kind': 'book'},
+    ]})
+
+    resp = await client.get(f'/api/v1/users/{user_id}/stats')
+
+    assert resp.status_code == 200
+    this_month = datetime.now(timezone.utc).strftime('%Y-%m')
+    assert resp.json() == {
+        'user_id': user_id,
+        'items': 2,
+        'tags': 1,
+        'status': {'planned': 1, 'reading': 0, 'done': 1},
+        'kind': {'book': 2, 'article': 0},
+        'priority': {'low': 0, 'normal': 2, 'high': 0},
+        'done_this_month': 1,
+        'done_by_month': {this_month: 1},
+        'items_per_tag': {str(tag_id): 1},
+    }
+    missing = await client.get(f'/api/v1/users/{user_id + 1}/stats')
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_reconcile_fixes_drift(client, user_id, db_engine):
+    await client.post(ITEMS_URL, json={'title': 'A', 'kind': 'book'})
+    expected = await _counters(user_id)
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(UserItemStatORM).where(
+                UserItemStatORM.name == 'items',
+            ).values(value=42),
+        )
+        await session.commit()
+
+    assert await reconcile_stats(db_engine) == 1
+    assert await _counters(user_id) == expected
+    assert await reconcile_stats(db_engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_zeroes_counters_without_source(
+    client, user_id, db_engine,
+):
+    await client.post(ITEMS_URL, json={'title': 'A', 'kind': 'book'})
+    expected = await _counters(user_id)
+    async with AsyncSessionLocal() as session:
+        await UserItemStatsRepository(session).apply(
+            user_id, {'kind:article': 3},
+        )
+        await session.commit()
+
+    assert await reconcile_stats(db_engine) == 1
+    assert await _counters(user_id) == expected